@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(BASE_DIR, "benchmark", "baseline.json")
+sys.path.insert(0, BASE_DIR)
+
+from benchmark.library import LibrarySpec, TEMPLATE_LIBRARY, generate  # noqa: E402
+from benchmark import runner  # noqa: E402
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Calibre-Web benchmark with synthetic libraries',
+                                     prog='python -m benchmark')
+    parser.add_argument('--workdir', metavar='path', help='directory for the generated databases '
+                                                          '(default: new temporary directory)')
+    parser.add_argument('--reuse', action='store_true', help='reuse already generated databases in workdir')
+    parser.add_argument('--books', type=int, default=1000)
+    parser.add_argument('--authors', type=int)
+    parser.add_argument('--tags', type=int)
+    parser.add_argument('--series', type=int)
+    parser.add_argument('--custom-columns', type=int, default=4)
+    parser.add_argument('--formats', type=int, default=2, help='maximum number of formats per book')
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--shelves-per-user', type=int, default=3)
+    parser.add_argument('--shelf-size', type=int, default=50)
+    parser.add_argument('--with-files', action='store_true', help='create book folders and cover files')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--iterations', type=int, default=10)
+    parser.add_argument('--only', metavar='names', help='comma separated list of scenarios to run')
+    parser.add_argument('--baseline', metavar='file', default=DEFAULT_BASELINE,
+                        help='json file with stored baseline results (default: benchmark/baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative p50 latency increase before reporting a regression')
+    parser.add_argument('--generate-only', action='store_true', help='only generate the databases')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    spec = LibrarySpec(books=args.books, authors=args.authors, tags=args.tags, series=args.series,
+                       custom_columns=args.custom_columns, formats=args.formats, users=args.users,
+                       shelves_per_user=args.shelves_per_user, shelf_size=args.shelf_size, seed=args.seed,
+                       with_files=args.with_files)
+    workdir = args.workdir or tempfile.mkdtemp(prefix="cw_benchmark_")
+    library_dir = os.path.join(workdir, "library")
+    app_db_path = os.path.join(workdir, "app.db")
+    if not (args.reuse and os.path.isfile(app_db_path) and os.path.isfile(os.path.join(library_dir, "metadata.db"))):
+        if not os.path.isfile(TEMPLATE_LIBRARY):
+            # the empty template library is not part of the release archives
+            print("Skipping benchmark: the template library {} is missing, the benchmark needs a source checkout "
+                  "of Calibre-Web".format(TEMPLATE_LIBRARY))
+            return 0
+        print("Generating library with {} books in {}".format(spec.books, workdir))
+        generate(workdir, spec)
+    if args.generate_only:
+        return 0
+
+    # Requests change the settings database (e.g. Kobo sync state), always start from the generated one
+    run_db_path = os.path.join(workdir, "app_run.db")
+    shutil.copyfile(app_db_path, run_db_path)
+    app = runner.create_app(library_dir, run_db_path)
+    scenarios = runner.default_scenarios(spec.books)
+    if args.only:
+        names = args.only.split(',')
+        scenarios = [s for s in scenarios if s.name in names]
+    results = runner.run_scenarios(app, scenarios, iterations=args.iterations)
+    baseline_spec, baseline = runner.load_baseline(args.baseline)
+    if args.save_baseline:
+        runner.save_baseline(args.baseline, results, spec)
+        print(runner.format_results(results))
+        print("Baseline stored in {}".format(args.baseline))
+        return 0
+    if baseline and baseline_spec != spec.to_dict():
+        print("Baseline was recorded with a different library, skipping comparison")
+        baseline = dict()
+    print(runner.format_results(results, baseline))
+    regressions = runner.compare(results, baseline, latency_tolerance=args.tolerance)
+    for regression in regressions:
+        print("REGRESSION " + regression)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    # the background threads of Calibre-Web are not stopped, exit hard after the benchmark
+    exit_code = 2
+    try:
+        exit_code = main()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Generates synthetic Calibre libraries (metadata.db) and Calibre-Web settings databases (app.db) of arbitrary size.
+# All data is generated from a seeded random generator, so two runs with identical parameters produce identical
+# databases.
+
+import os
+import random
+import shutil
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_LIBRARY = os.path.join(BASE_DIR, "library", "metadata.db")
+GENERIC_COVER = os.path.join(BASE_DIR, "cps", "static", "generic_cover.jpg")
+
+# Kobo auth token of the admin user in the generated app.db
+KOBO_AUTH_TOKEN = "0123456789abcdef0123456789abcdef"
+
+CUSTOM_COLUMN_TYPES = ["text", "int", "bool", "float", "datetime", "comments", "enumeration", "rating", "series"]
+NORMALIZED_TYPES = ["text", "enumeration", "rating", "series"]
+FORMATS = ["EPUB", "PDF", "MOBI", "AZW3", "CBZ", "TXT", "KEPUB", "MP3"]
+LANGUAGES = ["eng", "deu", "fra", "spa", "ita", "nld", "pol", "rus", "jpn", "zho"]
+WORDS = ["shadow", "river", "empire", "garden", "winter", "machine", "silent", "crimson", "ocean", "forest",
+         "stone", "night", "golden", "broken", "hidden", "last", "secret", "iron", "glass", "storm", "city",
+         "dragon", "letter", "journey", "kingdom", "mirror", "island", "fire", "memory", "star", "light", "wolf"]
+FIRST_NAMES = ["Anna", "Ben", "Clara", "David", "Emma", "Felix", "Greta", "Hugo", "Ida", "Jonas", "Karl", "Lena",
+               "Mila", "Noah", "Olga", "Paul", "Rosa", "Simon", "Tara", "Uwe", "Vera", "Walter", "Yara", "Zoe"]
+LAST_NAMES = ["Adler", "Berg", "Conrad", "Dietrich", "Engel", "Fischer", "Graf", "Hahn", "Jung", "Keller",
+              "Lang", "Meyer", "Neumann", "Otto", "Peters", "Richter", "Schmidt", "Vogel", "Weber", "Zimmer"]
+
+
+class LibrarySpec:
+    def __init__(self, books=1000, authors=None, tags=None, series=None, publishers=None, custom_columns=4,
+                 formats=2, users=20, shelves_per_user=3, shelf_size=50, downloads_per_user=50,
+                 read_states_per_user=100, seed=42, with_files=False):
+        self.books = books
+        self.authors = authors or max(1, books // 5)
+        self.tags = tags or max(1, min(2000, books // 10))
+        self.series = series or max(1, books // 20)
+        self.publishers = publishers or max(1, books // 50)
+        self.custom_columns = custom_columns
+        self.formats = max(1, min(formats, len(FORMATS)))
+        self.users = users
+        self.shelves_per_user = shelves_per_user
+        self.shelf_size = shelf_size
+        self.downloads_per_user = downloads_per_user
+        self.read_states_per_user = read_states_per_user
+        self.seed = seed
+        self.with_files = with_files
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+
+def _title_sort(title):
+    for prefix in ("The ", "A ", "An "):
+        if title.startswith(prefix):
+            return title[len(prefix):] + ", " + prefix.strip()
+    return title
+
+
+def _title(rnd, count):
+    return " ".join(rnd.choice(WORDS) for __ in range(count)).title()
+
+
+def _chunked(rows, size=10000):
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _create_custom_columns(conn, rnd, spec, book_ids):
+    for index in range(spec.custom_columns):
+        datatype = CUSTOM_COLUMN_TYPES[index % len(CUSTOM_COLUMN_TYPES)]
+        is_multiple = datatype == "text"
+        normalized = datatype in NORMALIZED_TYPES
+        display = '{"enum_values": ["a", "b", "c"]}' if datatype == "enumeration" else "{}"
+        cur = conn.execute("INSERT INTO custom_columns (label, name, datatype, mark_for_delete, editable, display, "
+                           "is_multiple, normalized) VALUES (?, ?, ?, 0, 1, ?, ?, ?)",
+                           ("col{}".format(index), "Column {}".format(index), datatype, display,
+                            is_multiple, normalized))
+        cc_id = cur.lastrowid
+        if normalized:
+            value_type = "INTEGER" if datatype == "rating" else "TEXT"
+            conn.execute("CREATE TABLE custom_column_{0} (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                         "value {1} NOT NULL, link TEXT NOT NULL DEFAULT '', UNIQUE(value))".format(cc_id, value_type))
+            extra = ", extra REAL" if datatype == "series" else ""
+            conn.execute("CREATE TABLE books_custom_column_{0}_link (id INTEGER PRIMARY KEY, book INTEGER NOT NULL, "
+                         "value INTEGER NOT NULL{1}, UNIQUE(book, value))".format(cc_id, extra))
+            if datatype == "rating":
+                values = list(range(0, 11, 2))
+            elif datatype == "enumeration":
+                values = ["a", "b", "c"]
+            else:
+                values = ["{} {}".format(rnd.choice(WORDS), n) for n in range(max(3, spec.tags // 4))]
+            conn.executemany("INSERT INTO custom_column_{} (value) VALUES (?)".format(cc_id),
+                             [(v,) for v in values])
+            links = list()
+            for book_id in book_ids:
+                if rnd.random() < 0.6:
+                    count = rnd.randint(1, 3) if is_multiple else 1
+                    for value_id in set(rnd.randint(1, len(values)) for __ in range(count)):
+                        links.append((book_id, value_id, float(rnd.randint(1, 10))) if extra
+                                     else (book_id, value_id))
+            placeholders = "?, ?, ?" if extra else "?, ?"
+            columns = "book, value, extra" if extra else "book, value"
+            for chunk in _chunked(links):
+                conn.executemany("INSERT INTO books_custom_column_{}_link ({}) VALUES ({})"
+                                 .format(cc_id, columns, placeholders), chunk)
+        else:
+            value_type = {"int": "INTEGER", "bool": "BOOL", "float": "REAL",
+                          "datetime": "timestamp", "comments": "TEXT"}[datatype]
+            conn.execute("CREATE TABLE custom_column_{0} (id INTEGER PRIMARY KEY AUTOINCREMENT, book INTEGER, "
+                         "value {1} NOT NULL, UNIQUE(book))".format(cc_id, value_type))
+            rows = list()
+            for book_id in book_ids:
+                if rnd.random() < 0.6:
+                    if datatype == "int":
+                        value = rnd.randint(0, 1000)
+                    elif datatype == "bool":
+                        value = rnd.random() < 0.5
+                    elif datatype == "float":
+                        value = rnd.random() * 100
+                    elif datatype == "datetime":
+                        value = (datetime(2000, 1, 1) + timedelta(days=rnd.randint(0, 9000))).isoformat(" ")
+                    else:
+                        value = "<p>{}</p>".format(_title(rnd, 12))
+                    rows.append((book_id, value))
+            for chunk in _chunked(rows):
+                conn.executemany("INSERT INTO custom_column_{} (book, value) VALUES (?, ?)".format(cc_id), chunk)
+
+
+def generate_metadata_db(library_dir, spec):
+    """Creates a Calibre library with a synthetic metadata.db in library_dir"""
+    rnd = random.Random(spec.seed)
+    os.makedirs(library_dir, exist_ok=True)
+    db_path = os.path.join(library_dir, "metadata.db")
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    shutil.copyfile(TEMPLATE_LIBRARY, db_path)
+
+    conn = sqlite3.connect(db_path)
+    conn.create_function("title_sort", 1, _title_sort)
+    conn.create_function("uuid4", 0, lambda: str(rnd_uuid(rnd)))
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("UPDATE library_id SET uuid = ?", (str(rnd_uuid(rnd)),))
+
+    author_names = list()
+    seen = set()
+    while len(author_names) < spec.authors:
+        name = "{} {}".format(rnd.choice(FIRST_NAMES), rnd.choice(LAST_NAMES))
+        if name in seen:
+            name = "{} {}".format(name, len(author_names))
+        seen.add(name)
+        author_names.append(name)
+    conn.executemany("INSERT INTO authors (id, name, sort) VALUES (?, ?, ?)",
+                     [(i + 1, n, ", ".join(reversed(n.split(" ", 1)))) for i, n in enumerate(author_names)])
+    conn.executemany("INSERT INTO tags (id, name) VALUES (?, ?)",
+                     [(i + 1, "{} {}".format(rnd.choice(WORDS), i)) for i in range(spec.tags)])
+    conn.executemany("INSERT INTO series (id, name, sort) VALUES (?, ?, ?)",
+                     [(i + 1, "{} Saga {}".format(rnd.choice(WORDS).title(), i),
+                       "{} Saga {}".format(rnd.choice(WORDS).title(), i)) for i in range(spec.series)])
+    conn.executemany("INSERT INTO publishers (id, name) VALUES (?, ?)",
+                     [(i + 1, "{} Press {}".format(rnd.choice(LAST_NAMES), i)) for i in range(spec.publishers)])
+    conn.executemany("INSERT INTO languages (id, lang_code) VALUES (?, ?)",
+                     [(i + 1, code) for i, code in enumerate(LANGUAGES)])
+    conn.executemany("INSERT INTO ratings (id, rating) VALUES (?, ?)", [(i + 1, i * 2) for i in range(6)])
+
+    books = list()
+    links = {"authors": [], "tags": [], "series": [], "publishers": [], "languages": [], "ratings": []}
+    data = list()
+    comments = list()
+    identifiers = list()
+    start = datetime(2010, 1, 1)
+    for book_id in range(1, spec.books + 1):
+        title = ("The " if rnd.random() < 0.1 else "") + _title(rnd, rnd.randint(1, 4))
+        authors = sorted(set(rnd.randint(1, spec.authors) for __ in range(1 if rnd.random() < 0.85 else 2)))
+        first_author = author_names[authors[0] - 1]
+        author_sort = " & ".join(", ".join(reversed(author_names[a - 1].split(" ", 1))) for a in authors)
+        timestamp = start + timedelta(minutes=book_id * 7)
+        path = "{}/{} ({})".format(first_author, title[:40], book_id)
+        has_cover = rnd.random() < 0.9
+        books.append((book_id, title, timestamp.isoformat(" ") + "+00:00",
+                      (datetime(1950, 1, 1) + timedelta(days=rnd.randint(0, 27000))).isoformat(" ") + "+00:00",
+                      float(rnd.randint(1, 12)), author_sort, path, int(has_cover),
+                      (timestamp + timedelta(days=rnd.randint(0, 30))).isoformat(" ") + "+00:00"))
+        links["authors"].extend((book_id, a) for a in authors)
+        links["tags"].extend((book_id, t) for t in set(rnd.randint(1, spec.tags) for __ in range(rnd.randint(0, 5))))
+        if rnd.random() < 0.4:
+            links["series"].append((book_id, rnd.randint(1, spec.series)))
+        if rnd.random() < 0.7:
+            links["publishers"].append((book_id, rnd.randint(1, spec.publishers)))
+        links["languages"].append((book_id, 1 if rnd.random() < 0.7 else rnd.randint(1, len(LANGUAGES))))
+        if rnd.random() < 0.5:
+            links["ratings"].append((book_id, rnd.randint(1, 6)))
+        for book_format in rnd.sample(FORMATS, rnd.randint(1, spec.formats)):
+            data.append((book_id, book_format, rnd.randint(50000, 50000000), first_author[:40]))
+        if rnd.random() < 0.8:
+            comments.append((book_id, "<p>{}</p>".format(_title(rnd, rnd.randint(10, 60)))))
+        if rnd.random() < 0.5:
+            identifiers.append((book_id, "isbn", "978{:010d}".format(book_id)))
+
+    for chunk in _chunked(books):
+        conn.executemany("INSERT INTO books (id, title, timestamp, pubdate, series_index, author_sort, path, "
+                         "has_cover, last_modified) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", chunk)
+    for table, column in (("authors", "author"), ("tags", "tag"), ("series", "series"),
+                          ("publishers", "publisher"), ("languages", "lang_code"), ("ratings", "rating")):
+        for chunk in _chunked(links[table]):
+            conn.executemany("INSERT INTO books_{}_link (book, {}) VALUES (?, ?)".format(table, column), chunk)
+    for chunk in _chunked(data):
+        conn.executemany("INSERT INTO data (book, format, uncompressed_size, name) VALUES (?, ?, ?, ?)", chunk)
+    for chunk in _chunked(comments):
+        conn.executemany("INSERT INTO comments (book, text) VALUES (?, ?)", chunk)
+    for chunk in _chunked(identifiers):
+        conn.executemany("INSERT INTO identifiers (book, type, val) VALUES (?, ?, ?)", chunk)
+    _create_custom_columns(conn, rnd, spec, range(1, spec.books + 1))
+    conn.commit()
+    conn.close()
+
+    if spec.with_files:
+        for book in books:
+            book_dir = os.path.join(library_dir, book[6])
+            os.makedirs(book_dir, exist_ok=True)
+            if book[7]:
+                shutil.copyfile(GENERIC_COVER, os.path.join(book_dir, "cover.jpg"))
+    return db_path
+
+
+def rnd_uuid(rnd):
+    return uuid.UUID(int=rnd.getrandbits(128), version=4)
+
+
+def generate_app_db(app_db_path, spec):
+    """Creates a Calibre-Web settings database with users, shelves, downloads and reading states"""
+    # Imported here, the library generator has to work without an initialized Calibre-Web application
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from werkzeug.security import generate_password_hash
+    from cps import ub, constants
+
+    rnd = random.Random(spec.seed + 1)
+    if os.path.exists(app_db_path):
+        os.remove(app_db_path)
+    engine = create_engine('sqlite:///{0}'.format(app_db_path), echo=False)
+    ub.Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    ub.create_admin_user(session)
+    ub.create_anonymous_user(session)
+    session.close()
+    engine.dispose()
+
+    conn = sqlite3.connect(app_db_path)
+    conn.execute("PRAGMA synchronous = OFF")
+    password = generate_password_hash(constants.DEFAULT_PASSWORD)
+    conn.executemany("INSERT INTO user (name, email, role, password, kindle_mail, locale, sidebar_view, "
+                     "default_language, denied_tags, allowed_tags, denied_column_value, allowed_column_value, "
+                     "view_settings, kobo_only_shelves_sync) "
+                     "VALUES (?, ?, ?, ?, '', 'en', ?, 'all', '', '', '', '', '{}', 0)",
+                     [("user{}".format(n), "user{}@example.org".format(n),
+                       constants.ROLE_DOWNLOAD | constants.ROLE_EDIT_SHELFS | constants.ROLE_VIEWER, password,
+                       constants.ADMIN_USER_SIDEBAR) for n in range(spec.users)])
+    user_ids = [row[0] for row in conn.execute("SELECT id FROM user WHERE role & ? = 0",
+                                               (constants.ROLE_ANONYMOUS,))]
+    now = datetime.now()
+    conn.execute("INSERT INTO remote_auth_token (auth_token, user_id, verified, expiration, token_type) "
+                 "VALUES (?, 1, 1, ?, 1)", (KOBO_AUTH_TOKEN, now + timedelta(days=3650)))
+    book_range = range(1, spec.books + 1)
+    shelves = list()
+    for user_id in user_ids:
+        for n in range(spec.shelves_per_user):
+            shelves.append((str(rnd_uuid(rnd)), "Shelf {} of {}".format(n, user_id), int(n == 0), user_id,
+                            int(n == 0), now, now))
+    conn.executemany("INSERT INTO shelf (uuid, name, is_public, user_id, kobo_sync, created, last_modified) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?)", shelves)
+    shelf_links = list()
+    for (shelf_id,) in conn.execute("SELECT id FROM shelf").fetchall():
+        for order, book_id in enumerate(rnd.sample(book_range, min(spec.shelf_size, spec.books))):
+            shelf_links.append((book_id, order + 1, shelf_id, now))
+    for chunk in _chunked(shelf_links):
+        conn.executemany('INSERT INTO book_shelf_link (book_id, "order", shelf, date_added) VALUES (?, ?, ?, ?)',
+                         chunk)
+    downloads = list()
+    read_states = list()
+    for user_id in user_ids:
+        downloads.extend((book_id, user_id) for book_id in
+                         rnd.sample(book_range, min(spec.downloads_per_user, spec.books)))
+        read_states.extend((book_id, user_id, rnd.randint(0, 2), now, 0) for book_id in
+                           rnd.sample(book_range, min(spec.read_states_per_user, spec.books)))
+    for chunk in _chunked(downloads):
+        conn.executemany("INSERT INTO downloads (book_id, user_id) VALUES (?, ?)", chunk)
+    for chunk in _chunked(read_states):
+        conn.executemany("INSERT INTO book_read_link (book_id, user_id, read_status, last_modified, "
+                         "times_started_reading) VALUES (?, ?, ?, ?, ?)", chunk)
+    conn.commit()
+    conn.close()
+    return app_db_path
+
+
+def generate(target_dir, spec):
+    library_dir = os.path.join(target_dir, "library")
+    generate_metadata_db(library_dir, spec)
+    generate_app_db(os.path.join(target_dir, "app.db"), spec)
+    return library_dir, os.path.join(target_dir, "app.db")
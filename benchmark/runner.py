@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Drives the key endpoints of Calibre-Web in-process through the Flask test client and measures latency and the
+# number of executed SQL statements per request.
+
+import base64
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+
+from .library import KOBO_AUTH_TOKEN
+
+BASIC_AUTH = {"Authorization": "Basic " + base64.b64encode(b"admin:admin123").decode()}
+
+
+class Scenario:
+    def __init__(self, name, path, method="GET", auth="session", data=None, follow_redirects=False, reset=None):
+        self.name = name
+        self.path = path
+        self.method = method
+        self.auth = auth
+        self.data = data
+        self.follow_redirects = follow_redirects
+        # called before every request (not measured), restores state changed by the previous request
+        self.reset = reset
+
+
+def reset_kobo_sync():
+    # every sync starts from a device that never synced, otherwise the result depends on the number of iterations
+    from cps import ub
+    user_id = ub.session.query(ub.User.id).filter(ub.User.name == "admin").scalar()
+    for table in (ub.KoboSyncedBooks, ub.KoboReadingState, ub.ShelfArchive):
+        ub.session.query(table).filter(table.user_id == user_id).delete(synchronize_session=False)
+    ub.session.commit()
+
+
+def default_scenarios(books):
+    middle_page = max(1, books // 60 // 2)
+    return [
+        Scenario("index", "/"),
+        Scenario("index_deep_page", "/page/{}".format(middle_page)),
+        Scenario("book_detail", "/book/1"),
+        Scenario("author_list", "/author"),
+        Scenario("author_books", "/author/1"),
+        Scenario("series_list", "/series"),
+        Scenario("category_list", "/category"),
+        Scenario("search", "/search?query=shadow", follow_redirects=True),
+        Scenario("advanced_search", "/advsearch", method="POST", follow_redirects=True,
+                 data={"authors": "", "title": "river", "publisher": "", "comments": "", "publishstart": "",
+                       "publishend": "", "ratinghigh": "", "ratinglow": "", "read_status": "",
+                       "include_tag": ["1"], "include_language": ["1"]}),
+        Scenario("listbooks", "/ajax/listbooks?offset=0&limit=50&sort=title&order=asc"),
+        Scenario("listbooks_search", "/ajax/listbooks?offset=0&limit=50&search=shadow"),
+        Scenario("shelf", "/shelf/1"),
+        Scenario("cover", "/cover/1/og"),
+        Scenario("opds_root", "/opds", auth="basic"),
+        Scenario("opds_new", "/opds/new", auth="basic"),
+        Scenario("opds_author", "/opds/author/1", auth="basic"),
+        Scenario("opds_search", "/opds/search/shadow", auth="basic"),
+        Scenario("opds_shelf", "/opds/shelf/1", auth="basic"),
+        Scenario("opds_discover", "/opds/discover", auth="basic"),
+        Scenario("opds_rated", "/opds/rated", auth="basic"),
+        Scenario("opds_hot", "/opds/hot", auth="basic"),
+        Scenario("opds_series", "/opds/series/1", auth="basic"),
+        Scenario("opds_category", "/opds/category/1", auth="basic"),
+        Scenario("opds_unread", "/opds/unreadbooks", auth="basic"),
+        Scenario("kobo_sync", "/kobo/{}/v1/library/sync".format(KOBO_AUTH_TOKEN), auth="kobo",
+                 reset=reset_kobo_sync),
+    ]
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+        # only queries of the requests count, not the ones of background threads flushing queued writes
+        self.thread = threading.get_ident()
+
+    def __call__(self, *args, **kwargs):
+        if threading.get_ident() == self.thread:
+            self.count += 1
+
+    def install(self):
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+        event.listen(Engine, "before_cursor_execute", self)
+
+
+def create_app(library_dir, app_db_path):
+    """Creates the fully wired Calibre-Web application without starting the webserver"""
+    workdir = os.path.dirname(app_db_path)
+    sys.argv = [sys.argv[0], "-p", app_db_path, "-g", os.path.join(workdir, "gdrive.db"),
+                "-o", os.path.join(workdir, "calibre-web.log")]
+    from cps import create_app as cw_create_app, config, limiter, db
+    from cps.main import register_blueprints
+
+    app = cw_create_app()
+    config.config_calibre_dir = library_dir
+    config.config_kobo_sync = 1
+    config.config_uploading = 1
+    config.config_ratelimiter = False
+    config.save()
+    db.CalibreDB.update_config(config, config.config_calibre_dir, app_db_path)
+    register_blueprints(app)
+    app.config.update(WTF_CSRF_ENABLED=False)
+    limiter.enabled = False
+    return app
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percent / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_scenarios(app, scenarios, iterations=10, warmup=2):
+    counter = QueryCounter()
+    counter.install()
+    client = app.test_client()
+    response = client.post("/login", data={"username": "admin", "password": "admin123"})
+    if response.status_code != 302:
+        raise RuntimeError("Login of benchmark user failed with status {}".format(response.status_code))
+    results = dict()
+    for scenario in scenarios:
+        headers = BASIC_AUTH if scenario.auth == "basic" else {}
+        timings = list()
+        queries = list()
+        status = None
+        for run in range(warmup + iterations):
+            if scenario.reset:
+                scenario.reset()
+            counter.count = 0
+            start = time.perf_counter()
+            response = client.open(scenario.path, method=scenario.method, data=scenario.data, headers=headers,
+                                   follow_redirects=scenario.follow_redirects)
+            # make sure streamed responses are consumed completely
+            response.get_data()
+            elapsed = time.perf_counter() - start
+            status = response.status_code
+            response.close()
+            if run >= warmup:
+                timings.append(elapsed * 1000)
+                queries.append(counter.count)
+        results[scenario.name] = {
+            "status": status,
+            "p50_ms": round(_percentile(timings, 50), 2),
+            "p90_ms": round(_percentile(timings, 90), 2),
+            "p99_ms": round(_percentile(timings, 99), 2),
+            "mean_ms": round(statistics.mean(timings), 2),
+            "queries": int(statistics.median(queries)),
+        }
+    return results
+
+
+def compare(results, baseline, latency_tolerance=0.25, query_tolerance=0):
+    """Returns a list of human-readable regressions of results against baseline"""
+    regressions = list()
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        if current["status"] != previous["status"]:
+            regressions.append("{}: status changed {} -> {}".format(name, previous["status"], current["status"]))
+        if current["p50_ms"] > previous["p50_ms"] * (1 + latency_tolerance):
+            regressions.append("{}: p50 latency {} ms -> {} ms".format(name, previous["p50_ms"], current["p50_ms"]))
+        if current["queries"] > previous["queries"] + query_tolerance:
+            regressions.append("{}: queries {} -> {}".format(name, previous["queries"], current["queries"]))
+    return regressions
+
+
+def format_results(results, baseline=None):
+    baseline = baseline or {}
+    lines = ["{:<20} {:>6} {:>9} {:>9} {:>9} {:>8} {:>10}".format(
+        "scenario", "status", "p50 ms", "p90 ms", "p99 ms", "queries", "base p50")]
+    for name, result in results.items():
+        previous = baseline.get(name, {})
+        lines.append("{:<20} {:>6} {:>9} {:>9} {:>9} {:>8} {:>10}".format(
+            name, result["status"], result["p50_ms"], result["p90_ms"], result["p99_ms"], result["queries"],
+            previous.get("p50_ms", "-")))
+    return "\n".join(lines)
+
+
+def load_baseline(path):
+    """Returns the library spec and the results stored in the baseline file"""
+    if not path or not os.path.isfile(path):
+        return dict(), dict()
+    with open(path, "r") as f:
+        baseline = json.load(f)
+    return baseline.get("spec", dict()), baseline.get("results", dict())
+
+
+def save_baseline(path, results, spec):
+    with open(path, "w") as f:
+        json.dump({"spec": spec.to_dict(), "results": results}, f, indent=2, sort_keys=True)
@@ -226,4 +226,10 @@ def create_app():
     register_scheduled_tasks(config.schedule_reconnect)
     register_startup_tasks()
 
+    # Detect changes of metadata.db done outside of Calibre-Web and find the changed books
+    from .library_watcher import watcher
+    from .library_changes import change_capture
+    change_capture.start()
+    watcher.start()
+
     return app
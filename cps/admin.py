@@ -42,11 +42,11 @@ from flask_babel import get_locale, format_time, format_datetime, format_timedel
 from sqlalchemy import and_
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.exc import IntegrityError, OperationalError, InvalidRequestError, ArgumentError
-from sqlalchemy.sql.expression import func, or_, text
+from sqlalchemy.sql.expression import func, text
 
 from . import constants, logger, helper, services, cli_param, themes
 from . import db, calibre_db, ub, web_server, config, updater_thread, gdriveutils, \
-    kobo_sync_status, schedule
+    kobo_sync_status, schedule, user_directory
 from .helper import check_valid_domain, send_test_mail, reset_password, generate_password_hash, check_email, \
     valid_email, check_username
 from .embed_helper import get_calibre_binarypath
@@ -55,6 +55,7 @@ from .binary_helper import resolve_binary_path, SUPPORTED_KEPUBIFY_BINARIES, SUP
 from .render_template import render_title_template, get_sidebar_config
 from .reverse_proxy_auth import is_valid_header_name
 from .services.worker import WorkerThread
+from .library_watcher import watcher as library_watcher
 from .usermanagement import user_login_required
 from .cw_babel import get_available_translations, get_available_locale, get_user_locale_language
 from . import debug_info
@@ -124,6 +125,8 @@ def before_request():
     g.themes = themes.get_available_themes()
     g.theme = themes.get_theme(config.config_theme)
     g.config_authors_max = config.config_authors_max
+    # changes of metadata.db found by the library watcher
+    library_watcher.reconnect_if_changed()
     if ('/static/' not in request.path and not config.db_configured and
         request.endpoint not in ('admin.ajax_db_config',
                                  'admin.simulatedbchange',
@@ -350,42 +353,24 @@ def list_users():
     state = None
     if sort == "state":
         state = json.loads(request.args.get("state", "[]"))
-    else:
-        if sort not in ub.User.__table__.columns.keys():
-            sort = "id"
     order = request.args.get("order", "").lower()
-    if sort != "state" and order:
-        if not order in ["asc", "desc"]:
-            order = "asc"
-        order = text(sort + " " + order)
-    elif not state:
-        order = ub.User.id.asc()
+    if (sort != "state" and not order) or (sort == "state" and not state):
+        sort = "id"
+        order = "asc"
+    if order not in ["asc", "desc"]:
+        order = "asc"
 
-    all_user = ub.session.query(ub.User)
-    if not config.config_anonbrowse:
-        all_user = all_user.filter(ub.User.role.op('&')(constants.ROLE_ANONYMOUS) != constants.ROLE_ANONYMOUS)
-
-    total_count = filtered_count = all_user.count()
-
-    if search:
-        all_user = all_user.filter(or_(func.lower(ub.User.name).ilike("%" + search + "%"),
-                                       func.lower(ub.User.kindle_mail).ilike("%" + search + "%"),
-                                       func.lower(ub.User.email).ilike("%" + search + "%")))
-    if state:
-        users = calibre_db.get_checkbox_sorted(all_user.all(), state, off, limit, request.args.get("order", "").lower())
-    else:
-        users = all_user.order_by(order).offset(off).limit(limit).all()
-    if search:
-        filtered_count = len(users)
+    total_count, filtered_count, users, cursor = user_directory.list_users(
+        search, sort, order, state, off, limit, request.args.get("cursor"), config.config_anonbrowse)
 
     for user in users:
-        if user.default_language == "all":
-            user.default = _("All")
+        if user['default_language'] == "all":
+            user['default'] = _("All")
         else:
-            user.default = get_user_locale_language(user.default_language)
+            user['default'] = get_user_locale_language(user['default_language'])
 
-    table_entries = {'totalNotFiltered': total_count, 'total': filtered_count, "rows": users}
-    return make_response(json.dumps(table_entries, cls=db.AlchemyEncoder))
+    table_entries = {'totalNotFiltered': total_count, 'total': filtered_count, "rows": users, "cursor": cursor}
+    return make_response(json.dumps(table_entries))
 
 
 @admi.route("/ajax/deleteuser", methods=['POST'])
@@ -1783,10 +1768,12 @@ def _db_configuration_update_helper():
         # if db changed -> delete shelfs, delete download books, delete read books, kobo sync...
         if db_change:
             log.info("Calibre Database changed, all Calibre-Web info related to old Database gets deleted")
+            ub.flush_activity()
             ub.session.query(ub.Downloads).delete()
             ub.session.query(ub.ArchivedBook).delete()
             ub.session.query(ub.ReadBook).delete()
             ub.session.query(ub.BookShelf).delete()
+            ub.mark_shelves_changed()
             ub.session.query(ub.Bookmark).delete()
             ub.session.query(ub.KoboReadingState).delete()
             ub.session.query(ub.KoboStatistics).delete()
@@ -2075,11 +2062,13 @@ def _delete_user(content):
         if content.name != "Guest":
             # Delete all books in shelfs belonging to user, all shelfs of user, downloadstat of user, read status
             # and user itself
+            ub.flush_activity()
             ub.session.query(ub.ReadBook).filter(content.id == ub.ReadBook.user_id).delete()
             ub.session.query(ub.Downloads).filter(content.id == ub.Downloads.user_id).delete()
             for us in ub.session.query(ub.Shelf).filter(content.id == ub.Shelf.user_id):
                 ub.session.query(ub.BookShelf).filter(us.id == ub.BookShelf.shelf).delete()
             ub.session.query(ub.Shelf).filter(content.id == ub.Shelf.user_id).delete()
+            ub.mark_shelves_changed()
             ub.session.query(ub.Bookmark).filter(content.id == ub.Bookmark.user_id).delete()
             ub.session.query(ub.User).filter(ub.User.id == content.id).delete()
             ub.session.query(ub.ArchivedBook).filter(ub.ArchivedBook.user_id == content.id).delete()
@@ -2091,6 +2080,7 @@ def _delete_user(content):
             for kobo_entry in kobo_entries:
                 ub.session.delete(kobo_entry)
             ub.session_commit()
+            ub.invalidate_user_sessions(content.id)
             log.info("User {} deleted".format(content.name))
             return _("User '%(nick)s' deleted", nick=content.name)
         else:
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Delivery of audio books to the player. Duration, bitrate and chapters of an audio file are read once and kept in
+# memory and in the cache folder as long as size and modification time of the file are unchanged. Range requests are
+# answered with at most STREAM_CHUNK bytes: the wsgi container holds the complete response in memory before sending
+# it, a request for the rest of a multi-hour file would have to read the whole file before playback could start.
+
+import hashlib
+import json
+import os
+import re
+
+from flask import Response, request, send_file
+
+from . import logger
+from .constants import CACHE_TYPE_AUDIO
+from .fs import FileSystem
+from .services.cache import LRUCache
+
+log = logger.create()
+
+try:
+    import mutagen
+    use_mutagen = True
+except ImportError as e:
+    log.debug('Cannot import mutagen, duration and chapters of audio books are not available: %s', e)
+    use_mutagen = False
+
+MIME_TYPES = {'mp3': 'audio/mpeg', 'mp4': 'audio/mp4', 'm4a': 'audio/mp4', 'm4b': 'audio/mp4', 'ogg': 'audio/ogg',
+              'opus': 'audio/ogg', 'flac': 'audio/flac', 'wav': 'audio/wav'}
+
+# Maximum length of the answer to one range request, the player requests the following range on its own
+STREAM_CHUNK = 4 * 1024 * 1024
+
+VORBIS_CHAPTER = re.compile(r'^CHAPTER(\d+)$')
+
+_info_cache = LRUCache(maxsize=256)
+
+
+def _file_version(path):
+    stat = os.stat(path)
+    return '{:x}-{:x}'.format(stat.st_mtime_ns, stat.st_size), stat
+
+
+def _vorbis_time(value):
+    # HH:MM:SS.mmm
+    seconds = 0.0
+    for part in value.strip().split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def _read_chapters(audio_file):
+    chapters = list()
+    tags = audio_file.tags
+    if getattr(audio_file, 'chapters', None):
+        # mp4 chapter list
+        chapters = [(chapter.start, chapter.title) for chapter in audio_file.chapters]
+    elif tags is not None and hasattr(tags, 'getall'):
+        # id3 chapter frames, times in milliseconds
+        for frame in tags.getall('CHAP'):
+            title = frame.sub_frames.get('TIT2')
+            chapters.append((frame.start_time / 1000, title.text[0] if title else frame.element_id))
+    elif tags is not None:
+        # vorbis comments CHAPTER001=00:00:00.000, CHAPTER001NAME=title
+        values = dict((key.upper(), value) for key, value in tags.items())
+        for key, value in values.items():
+            match = VORBIS_CHAPTER.match(key)
+            if match:
+                try:
+                    start = _vorbis_time(value[0])
+                except (ValueError, TypeError, IndexError):
+                    continue
+                name = values.get(key + 'NAME')
+                chapters.append((start, name[0] if name else match.group(1)))
+    return sorted(chapters, key=lambda chapter: chapter[0])
+
+
+def _read_info(path, extension):
+    audio_file = mutagen.File(path)
+    if audio_file is None:
+        raise ValueError('Unknown audio format')
+    duration = getattr(audio_file.info, 'length', 0) or 0
+    bitrate = getattr(audio_file.info, 'bitrate', 0) or 0
+    if not bitrate and duration:
+        bitrate = int(os.path.getsize(path) * 8 / duration)
+    chapters = list()
+    raw_chapters = _read_chapters(audio_file)
+    for index, (start, title) in enumerate(raw_chapters):
+        end = raw_chapters[index + 1][0] if index + 1 < len(raw_chapters) else duration
+        chapters.append({'title': title, 'start': round(start, 3), 'end': round(end, 3)})
+    return {'duration': round(duration, 3), 'bitrate': bitrate, 'mimetype': MIME_TYPES.get(extension),
+            'chapters': chapters}
+
+
+def get_audio_info(path, extension):
+    """Returns duration in seconds, bitrate in bits per second, mime type and chapters of an audio file, None if
+    the file can't be read"""
+    extension = extension.lower()
+    try:
+        version, __ = _file_version(path)
+    except OSError as ex:
+        log.error('Audio file {} not found: {}'.format(path, ex))
+        return None
+    info = _info_cache.get((path, version))
+    if info is not None:
+        return info
+    cache_file = FileSystem().get_cache_file_path(hashlib.sha1(path.encode('utf-8')).hexdigest() + '.json',
+                                                  CACHE_TYPE_AUDIO)
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if entry.get('version') == version:
+            info = entry['info']
+    except (OSError, ValueError, KeyError):
+        pass
+    if info is None:
+        if not use_mutagen:
+            return None
+        try:
+            info = _read_info(path, extension)
+        except Exception as ex:
+            log.error('Reading audio information of {} failed: {}'.format(path, ex))
+            return None
+        try:
+            with open(cache_file + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump({'version': version, 'info': info}, f)
+            os.replace(cache_file + '.tmp', cache_file)
+        except OSError as ex:
+            log.debug('Caching audio information of %s failed: %s', path, ex)
+    info['version'] = version
+    _info_cache.set((path, version), info)
+    return info
+
+
+def stream_audio(path, extension):
+    """Response for the audio file, single range requests are answered with partial content of at most STREAM_CHUNK
+    bytes"""
+    version, stat = _file_version(path)
+    mimetype = MIME_TYPES.get(extension.lower(), 'application/octet-stream')
+    size = stat.st_size
+    byte_range = request.range
+    # a range of an outdated version of the file is answered with the complete file
+    if byte_range is not None and request.if_range.etag and request.if_range.etag != version:
+        byte_range = None
+    range_for_length = byte_range.range_for_length(size) if byte_range is not None else None
+    if range_for_length is None:
+        # no range or one which can't be answered as a single range, e.g. multiple ranges: the complete file. Ranges
+        # are not handed to werkzeug, it would answer them with 416
+        response = send_file(path, mimetype=mimetype, etag=version, last_modified=stat.st_mtime, conditional=False)
+        response = response.make_conditional(request)
+    else:
+        start, stop = range_for_length
+        stop = min(stop, start + STREAM_CHUNK)
+        with open(path, 'rb') as f:
+            f.seek(start)
+            data = f.read(stop - start)
+        response = Response(data, status=206, mimetype=mimetype)
+        response.headers['Content-Range'] = 'bytes {}-{}/{}'.format(start, start + len(data) - 1, size)
+        response.set_etag(version)
+        response.last_modified = stat.st_mtime
+    response.headers['Accept-Ranges'] = 'bytes'
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
@@ -18,7 +18,7 @@
 
 import os
 
-from . import logger, isoLanguages, cover
+from . import logger, isoLanguages, cover, comic_pages
 from .constants import BookMeta
 
 try:
@@ -29,13 +29,6 @@ except (ImportError, RuntimeError) as e:
 
 log = logger.create()
 
-try:
-    from natsort import natsorted as sort
-except ImportError:
-    log.debug("Natural sorting unavailable: using standard "
-              "sorted() method instead.")
-    sort = sorted
-
 try:
     from comicapi.comicarchive import ComicArchive, MetaDataStyle
     use_comic_meta = True
@@ -51,68 +44,26 @@ try:
         load_archive_plugins = None
 except (ImportError, LookupError) as e:
     log.debug('Cannot import comicapi, extracting comic metadata will not work: %s', e)
-    import zipfile
-    import tarfile
-    try:
-        import rarfile
-        use_rarfile = True
-    except (ImportError, SyntaxError) as e:
-        log.debug('Cannot import rarfile, extracting cover files from rar files will not work: %s', e)
-        use_rarfile = False
-    try:
-        import py7zr
-        use_7zip = True
-    except (ImportError, SyntaxError) as e:
-        log.debug('Cannot import py7zr, extracting cover files from CB7 files will not work: %s', e)
-        use_7zip = False
     use_comic_meta = False
 
 
 def _extract_cover_from_archive(original_file_extension, tmp_file_name, rar_executable):
     cover_data = extension = None
-    if original_file_extension.upper() == '.CBZ':
-        cf = zipfile.ZipFile(tmp_file_name)
-        for name in sort(cf.namelist()):
-            ext = os.path.splitext(name)
-            if len(ext) > 1:
-                extension = ext[1].lower()
-                if extension in cover.COVER_EXTENSIONS:
-                    cover_data = cf.read(name)
-                    break
-    elif original_file_extension.upper() == '.CBT':
-        cf = tarfile.TarFile(tmp_file_name)
-        for name in sort(cf.getnames()):
-            ext = os.path.splitext(name)
-            if len(ext) > 1:
-                extension = ext[1].lower()
-                if extension in cover.COVER_EXTENSIONS:
-                    cover_data = cf.extractfile(name).read()
-                    break
-    elif original_file_extension.upper() == '.CBR' and use_rarfile:
-        try:
-            rarfile.UNRAR_TOOL = rar_executable
-            cf = rarfile.RarFile(tmp_file_name)
-            for name in sort(cf.namelist()):
-                ext = os.path.splitext(name)
-                if len(ext) > 1:
-                    extension = ext[1].lower()
-                    if extension in cover.COVER_EXTENSIONS:
-                        cover_data = cf.read(name)
-                        break
-        except Exception as ex:
-            log.error('Rarfile failed with error: {}'.format(ex))
-    elif original_file_extension.upper() == '.CB7' and use_7zip:
-        cf = py7zr.SevenZipFile(tmp_file_name)
-        for name in sort(cf.getnames()):
-            ext = os.path.splitext(name)
-            if len(ext) > 1:
-                extension = ext[1].lower()
-                if extension in cover.COVER_EXTENSIONS:
-                    try:
-                        cover_data = cf.read([name])[name].read()
-                    except (py7zr.Bad7zFile, OSError) as ex:
-                        log.error('7Zip file failed with error: {}'.format(ex))
-                    break
+    if not comic_pages.archive_format(original_file_extension):
+        return cover_data, extension
+    try:
+        index = comic_pages.get_page_index(tmp_file_name, original_file_extension, rar_executable)
+    except comic_pages.ComicPageError as ex:
+        log.error(ex)
+        return cover_data, extension
+    for page, name in enumerate(index.names):
+        extension = os.path.splitext(name)[1].lower()
+        if extension in cover.COVER_EXTENSIONS:
+            try:
+                cover_data = comic_pages.read_page(tmp_file_name, original_file_extension, page, rar_executable)[0]
+            except comic_pages.ComicPageError as ex:
+                log.error(ex)
+            break
     return cover_data, extension
 
 
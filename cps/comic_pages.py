@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Single pages of comic archives. The image entries of an archive are listed and sorted once and kept in memory as
+# long as size and modification time of the file are unchanged. A page is read straight from its entry, pages of
+# uncompressed tar archives are read from their offset without scanning the archive again. Pages downscaled to the
+# width of the reader are stored in the cache folder.
+
+import hashlib
+import os
+import tarfile
+import zipfile
+from collections import namedtuple
+
+from . import logger
+from .constants import CACHE_TYPE_COMIC_PAGES
+from .fs import FileSystem
+from .services.cache import LRUCache
+
+log = logger.create()
+
+try:
+    from natsort import natsorted as sort
+except ImportError:
+    sort = sorted
+
+try:
+    from wand.image import Image
+    use_IM = True
+except (ImportError, RuntimeError) as e:
+    log.debug('Cannot import wand, comic pages are not downscaled: %s', e)
+    use_IM = False
+
+try:
+    import rarfile
+    use_rarfile = True
+except (ImportError, SyntaxError) as e:
+    log.debug('Cannot import rarfile, reading pages of rar files will not work: %s', e)
+    use_rarfile = False
+
+try:
+    import py7zr
+    use_7zip = True
+except (ImportError, SyntaxError) as e:
+    log.debug('Cannot import py7zr, reading pages of CB7 files will not work: %s', e)
+    use_7zip = False
+
+PAGE_EXTENSIONS = ('.png', '.webp', '.bmp', '.jpg', '.jpeg', '.gif')
+MIME_TYPES = {'.png': 'image/png', '.webp': 'image/webp', '.bmp': 'image/bmp', '.jpg': 'image/jpeg',
+              '.jpeg': 'image/jpeg', '.gif': 'image/gif'}
+
+# Requested widths are rounded up to a multiple of this step, so a few sizes per page end up in the cache
+WIDTH_STEP = 200
+MAX_WIDTH = 4000
+# Number of downscaled pages kept in the cache folder, the folder is pruned after every PRUNE_INTERVAL new pages
+FILE_CACHE_SIZE = 5000
+PRUNE_INTERVAL = 100
+
+# version: size and modification time of the archive, locations: per page the entry name, for tar archives
+# offset and size of the data
+PageIndex = namedtuple('PageIndex', ['version', 'mtime', 'archive_format', 'names', 'locations'])
+
+_index_cache = LRUCache(maxsize=64)
+_written_pages = 0
+
+
+class ComicPageError(Exception):
+    pass
+
+
+def archive_format(extension):
+    """Returns zip, tar, rar or 7z for the extension of a comic file, None for unsupported files"""
+    extension = extension.lower().lstrip('.')
+    if extension in ('cbz', 'zip'):
+        return 'zip'
+    if extension in ('cbt', 'tar'):
+        return 'tar'
+    if extension in ('cbr', 'rar'):
+        return 'rar' if use_rarfile else None
+    if extension in ('cb7', '7z'):
+        return '7z' if use_7zip else None
+    return None
+
+
+def _is_page(name):
+    return os.path.splitext(name)[1].lower() in PAGE_EXTENSIONS and '__MACOSX' not in name
+
+
+def _list_entries(path, fmt):
+    if fmt == 'zip':
+        with zipfile.ZipFile(path) as cf:
+            return [(info.filename, info.filename) for info in cf.infolist() if not info.is_dir()]
+    if fmt == 'tar':
+        with tarfile.TarFile(path) as cf:
+            return [(info.name, (info.offset_data, info.size)) for info in cf.getmembers() if info.isfile()]
+    if fmt == 'rar':
+        with rarfile.RarFile(path) as cf:
+            return [(info.filename, info.filename) for info in cf.infolist() if not info.is_dir()]
+    with py7zr.SevenZipFile(path) as cf:
+        return [(info.filename, info.filename) for info in cf.list() if not info.is_directory]
+
+
+def get_page_index(path, extension, rar_executable=None):
+    """Returns the sorted page list of the comic archive, raises ComicPageError for unreadable archives"""
+    fmt = archive_format(extension)
+    if not fmt:
+        raise ComicPageError('Unsupported comic format {}'.format(extension))
+    try:
+        stat = os.stat(path)
+    except OSError as ex:
+        raise ComicPageError(ex)
+    version = '{:x}-{:x}'.format(stat.st_mtime_ns, stat.st_size)
+    index = _index_cache.get((path, version))
+    if index is None:
+        if fmt == 'rar' and rar_executable:
+            rarfile.UNRAR_TOOL = rar_executable
+        try:
+            entries = sort([entry for entry in _list_entries(path, fmt) if _is_page(entry[0])],
+                           key=lambda entry: entry[0])
+        except Exception as ex:
+            raise ComicPageError('Reading comic archive {} failed: {}'.format(path, ex))
+        index = PageIndex(version, stat.st_mtime, fmt,
+                          [entry[0] for entry in entries], [entry[1] for entry in entries])
+        _index_cache.set((path, version), index)
+    return index
+
+
+def _read_entry(path, index, page):
+    location = index.locations[page]
+    if index.archive_format == 'zip':
+        with zipfile.ZipFile(path) as cf:
+            return cf.read(location)
+    if index.archive_format == 'tar':
+        offset, size = location
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            return f.read(size)
+    if index.archive_format == 'rar':
+        with rarfile.RarFile(path) as cf:
+            return cf.read(location)
+    with py7zr.SevenZipFile(path) as cf:
+        return cf.read([location])[location].read()
+
+
+def read_page(path, extension, page, rar_executable=None):
+    """Returns data and file extension of the page with the given index"""
+    index = get_page_index(path, extension, rar_executable)
+    if not 0 <= page < len(index.names):
+        raise ComicPageError('Page {} not in {}'.format(page, path))
+    try:
+        data = _read_entry(path, index, page)
+    except Exception as ex:
+        raise ComicPageError('Reading page {} of {} failed: {}'.format(page, path, ex))
+    return data, os.path.splitext(index.names[page])[1].lower()
+
+
+def page_width(width):
+    """Rounds the requested width up to the next cached size"""
+    return min(MAX_WIDTH, max(WIDTH_STEP, -(-width // WIDTH_STEP) * WIDTH_STEP))
+
+
+def _scale(data, width):
+    with Image(blob=data) as img:
+        if img.width <= width:
+            return data
+        img.transform(resize='{}x'.format(width))
+        return img.make_blob()
+
+
+def _prune_cache_files(cache_dir):
+    files = list()
+    for root, __, names in os.walk(cache_dir):
+        for name in names:
+            file_path = os.path.join(root, name)
+            try:
+                files.append((os.path.getmtime(file_path), file_path))
+            except OSError:
+                pass
+    if len(files) > FILE_CACHE_SIZE:
+        files.sort()
+        for __, file_path in files[:len(files) - FILE_CACHE_SIZE]:
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+
+
+def get_page(path, extension, page, width=None, rar_executable=None):
+    """Returns data, file extension and archive version of a page. With a width and ImageMagick available wider
+    pages are downscaled and kept in the cache folder"""
+    global _written_pages
+    index = get_page_index(path, extension, rar_executable)
+    if not 0 <= page < len(index.names):
+        raise ComicPageError('Page {} not in {}'.format(page, path))
+    page_extension = os.path.splitext(index.names[page])[1].lower()
+    if not width or not use_IM:
+        return read_page(path, extension, page, rar_executable)[0], page_extension, index.version
+
+    width = page_width(width)
+    file_system = FileSystem()
+    cache_name = hashlib.sha1('{}|{}|{}|{}'.format(path, index.version, page, width).encode('utf-8')).hexdigest()
+    cache_file = file_system.get_cache_file_path(cache_name + page_extension, CACHE_TYPE_COMIC_PAGES)
+    try:
+        with open(cache_file, 'rb') as f:
+            return f.read(), page_extension, index.version
+    except OSError:
+        pass
+    data = read_page(path, extension, page, rar_executable)[0]
+    try:
+        data = _scale(data, width)
+    except Exception as ex:
+        log.debug('Downscaling page %d of %s failed: %s', page, path, ex)
+        return data, page_extension, index.version
+    try:
+        with open(cache_file + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(cache_file + '.tmp', cache_file)
+        _written_pages += 1
+        if _written_pages % PRUNE_INTERVAL == 0:
+            _prune_cache_files(file_system.get_cache_dir(CACHE_TYPE_COMIC_PAGES))
+    except OSError as ex:
+        log.debug('Caching page %d of %s failed: %s', page, path, ex)
+    return data, page_extension, index.version
@@ -183,6 +183,9 @@ NIGHTLY_VERSION[1] = '$Format:%cI$'
 
 # CACHE
 CACHE_TYPE_THUMBNAILS    = 'thumbnails'
+CACHE_TYPE_GOODREADS     = 'goodreads'
+CACHE_TYPE_COMIC_PAGES   = 'comic_pages'
+CACHE_TYPE_AUDIO         = 'audio'
 
 # Thumbnail Types
 THUMBNAIL_TYPE_COVER     = 1
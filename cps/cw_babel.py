@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from babel import negotiate_locale
 from flask_babel import Babel, Locale
 from babel.core import UnknownLocaleError
@@ -30,7 +32,12 @@ def get_locale():
 
 
 def get_user_locale_language(user_language):
-    return Locale.parse(user_language).get_language_name(get_locale())
+    return _language_name(user_language, str(get_locale()))
+
+
+@lru_cache(maxsize=1024)
+def _language_name(language, locale):
+    return Locale.parse(language).get_language_name(locale)
 
 
 def get_available_locale():
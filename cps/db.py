@@ -27,7 +27,7 @@ import unidecode
 from uuid import uuid4
 
 from sqlite3 import OperationalError as sqliteOperationalError
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy import Table, Column, ForeignKey, CheckConstraint
 from sqlalchemy import String, Integer, Boolean, TIMESTAMP, Float
 from sqlalchemy.orm import relationship, sessionmaker, scoped_session, selectinload
@@ -49,6 +49,7 @@ from flask import flash, g, Flask
 
 from . import logger, ub, isoLanguages
 from .pagination import Pagination
+from .services import metrics
 from .string_helper import strip_whitespaces
 
 log = logger.create()
@@ -663,12 +664,15 @@ class CalibreDB:
         ctx = g.get("lib_sql")
         if ctx:
             ctx.close()
+            metrics.calibre_db_sessions_active.dec()
 
     @property
     def session(self):
         # connect or get active connection
         if not g.get("lib_sql"):
             g.lib_sql = self.connect()
+            if g.lib_sql:
+                metrics.calibre_db_sessions_active.inc()
         return g.lib_sql
 
     @classmethod
@@ -705,6 +709,7 @@ class CalibreDB:
                 connection.execute(text("attach database '{}' as app_settings;".format(app_db_path.replace("'", "''"))))
 
             conn = engine.connect()
+            metrics.calibre_db_connections.inc()
             # conn.text_factory = lambda b: b.decode(errors = 'ignore') possible fix for #1302
         except Exception as ex:
             cls.config.invalidate(ex)
@@ -720,9 +725,10 @@ class CalibreDB:
                 log.error_or_exception(e)
                 return None
 
+        # commits of these sessions are recognized as own writes by the library watcher
         return scoped_session(sessionmaker(autocommit=False,
                                            autoflush=False,
-                                           bind=engine, future=True))
+                                           bind=engine, future=True, info={'calibre_db': True}))
 
 
     def get_book(self, book_id):
@@ -734,6 +740,7 @@ class CalibreDB:
 
     def get_book_read_archived(self, book_id, read_column, allow_show_archived=False):
         if not read_column:
+            ub.flush_activity()
             bd = (self.session.query(Books, ub.ReadBook.read_status, ub.ArchivedBook.is_archived).select_from(Books)
                   .join(ub.ReadBook, and_(ub.ReadBook.user_id == int(current_user.id), ub.ReadBook.book_id == book_id),
                   isouter=True))
@@ -818,6 +825,7 @@ class CalibreDB:
 
     def generate_linked_query(self, config_read_column, database):
         if not config_read_column:
+            ub.flush_activity()
             query = (self.session.query(database, ub.ArchivedBook.is_archived, ub.ReadBook.read_status)
                      .select_from(Books)
                      .outerjoin(ub.ReadBook,
@@ -874,6 +882,9 @@ class CalibreDB:
             query = self.generate_linked_query(config_read_column, database)
         else:
             query = self.session.query(database)
+        if database is Books:
+            # authors are needed for ordering them below
+            query = query.options(selectinload(Books.authors))
         off = int(int(pagesize) * (page - 1))
 
         indx = len(join)
@@ -904,6 +915,30 @@ class CalibreDB:
         entries = self.order_authors(entries, True, join_archive_read)
         return entries, randm, pagination
 
+    def prefetch_relations(self, entries, relations):
+        """Loads relationships of the books in entries with one query per relationship instead of one per book.
+        relations contains relationship attributes of Books or tuples of an attribute and a nested attribute"""
+        books = [getattr(entry, 'Books', entry) for entry in entries]
+        books = [book for book in books if isinstance(book, Books)]
+        if not books:
+            return
+        options = list()
+        for relation in relations:
+            attribute = relation[0] if isinstance(relation, tuple) else relation
+            # relationships which are loaded for every book already need no further query
+            if not any(attribute.key in inspect(book).unloaded for book in books):
+                continue
+            option = selectinload(attribute)
+            if isinstance(relation, tuple):
+                option = option.selectinload(relation[1])
+            options.append(option)
+        if not options:
+            return
+        ids = [book.id for book in books]
+        # refreshes the unloaded relationships of the books already in the session
+        for start in range(0, len(ids), 500):
+            self.session.query(Books).filter(Books.id.in_(ids[start:start + 500])).options(*options).all()
+
     # Orders all Authors in the list according to authors sort
     def order_authors(self, entries, list_return=False, combined=False):
         for entry in entries:
@@ -21,6 +21,7 @@
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import json
 from shutil import copyfile
@@ -28,20 +29,22 @@ from shutil import copyfile
 from markupsafe import escape, Markup  # dependency of flask
 from functools import wraps
 
-from flask import Blueprint, request, flash, redirect, url_for, abort, jsonify, make_response, Response
+from flask import Blueprint, request, flash, redirect, url_for, abort, jsonify, make_response, Response, \
+    copy_current_request_context, after_this_request
 from flask_babel import gettext as _
 from flask_babel import lazy_gettext as N_
 from flask_babel import get_locale
 from .cw_login import current_user
 from sqlalchemy.exc import OperationalError, IntegrityError, InterfaceError
 from sqlalchemy.orm.exc import StaleDataError
-from sqlalchemy.sql.expression import func
+from sqlalchemy.sql.expression import func, bindparam, exists, text
 
 from . import constants, logger, isoLanguages, gdriveutils, uploader, helper, kobo_sync_status
 from .clean_html import clean_string
 from . import config, ub, db, calibre_db
 from .services.worker import WorkerThread
 from .tasks.upload import TaskUpload
+from .tasks.rename import TaskRenameBooks
 from .render_template import render_title_template
 from .binary_helper import resolve_binary_path, SUPPORTED_UNRAR_BINARIES
 from .kobo_sync_status import change_archived_books
@@ -49,10 +52,19 @@ from .redirect import get_redirect_location
 from .file_helper import validate_mime_type
 from .usermanagement import user_login_required, login_required_if_no_ano
 from .string_helper import strip_whitespaces
+from .kepub_preconvert import preconverter
 
 editbook = Blueprint('edit-book', __name__)
 log = logger.create()
 
+# Fields of the batch editor of the books table
+BATCH_EDIT_FIELDS = ('title', 'title_sort', 'author_sort', 'authors', 'categories', 'series', 'languages',
+                     'publishers', 'comments')
+# Number of books per statement of the batch editor and of deleting books
+BATCH_EDIT_CHUNK = 500
+# Number of threads deleting book folders
+DELETE_WORKERS = 4
+
 
 def upload_required(f):
     @wraps(f)
@@ -156,6 +168,7 @@ def upload():
                 upload_text = N_("File %(file)s uploaded", file=link)
                 WorkerThread.add(current_user.name, TaskUpload(upload_text, escape(title)))
                 helper.add_book_to_thumbnail_cache(book_id)
+                preconverter.request_scan()
 
                 if len(request.files.getlist("btn-upload")) < 2:
                     if current_user.role_edit() or current_user.role_admin():
@@ -245,76 +258,192 @@ def edit_list_book(param):
 def edit_selected_books():
     d = request.get_json()
     selections = d.get('selections')
-    title = d.get('title')
-    title_sort = d.get('title_sort')
-    author_sort = d.get('author_sort')
-    authors = d.get('authors')
-    categories = d.get('categories')
-    series = d.get('series')
-    languages = d.get('languages')
-    publishers = d.get('publishers')
-    comments = d.get('comments')
-
-    if not (
-      title or title_sort or authors or categories or series or languages or publishers or comments) or not selections:
+    changes = dict((field, d.get(field)) for field in BATCH_EDIT_FIELDS if d.get(field))
+    if not changes or not selections:
         return _("Parameter not found"), 400
-    vals = {
-        "pk": selections,
-        "value": None,
-        "checkA": d.get('checkA'),
-        "checkT": d.get('checkT'),
-    }
-    res = list()
-    if title:
-        vals['value'] = title
-        out = edit_book_param('title', vals, True)
-        if out[0].get('success') != True:
-            res.extend(out)
-    if title_sort:
-        vals['value'] = title_sort
-        out = edit_book_param('sort', vals, True)
-        if out[0].get('success') != True:
-            res.extend(out)
-    if author_sort:
-        vals['value'] = author_sort
-        out = edit_book_param('author_sort', vals, True)
-        if out[0].get('success') != True:
-            res.extend(out)
-    if authors:
-        vals['value'] = authors
-        out = edit_book_param('authors', vals, True)
-        if out[0].get('success') != True:
-            res.extend(out)
-    if categories:
-        vals['value'] = categories
-        out = edit_book_param('tags', vals, True)
-        if out[0].get('success') != True:
-            res.extend(out)
-    if series:
-        vals['value'] = series
-        out = edit_book_param('series', vals, True)
-        if out[0].get('success') != True:
-            res.extend(out)
-    if languages:
-        vals['value'] = languages
-        out = edit_book_param('languages', vals, True)
-        if out[0].get('success') != True:
-            res.extend(out)
-    if publishers:
-        vals['value'] = publishers
-        out = edit_book_param('publishers', vals, True)
-        if out[0].get('success') != True:
-            res.extend(out)
-    if comments:
-        vals['value'] = comments
-        out = edit_book_param('comments', vals, True)
-        if out[0].get('success') != True:
-            res.extend(out)
+    res = batch_edit_books(selections, changes, d.get('checkA') == True, d.get('checkT') != False)
     if len(res) == 0:
         return jsonify([{'success': True, "msg": _("Changes successfully applied")}])
     else:
         return jsonify(res)
 
+
+# Applies the same changes to all selected books in one transaction. Relations are read from and written to the link
+# tables with a few statements per chunk of books, folders of books with a new title or first author are moved by a
+# background task afterwards. Returns the list of errors
+def batch_edit_books(book_ids, changes, update_author_sort=False, update_title_sort=True):
+    unavailable = {"success": False,
+                   "msg": _("Oops! Selected book is unavailable. File does not exist or is not accessible")}
+    try:
+        book_ids = sorted(set(int(book_id) for book_id in book_ids))
+    except (TypeError, ValueError):
+        return [unavailable]
+    errors = list()
+    existing = list()
+    for start in range(0, len(book_ids), BATCH_EDIT_CHUNK):
+        existing.extend(book_id for book_id, in calibre_db.session.query(db.Books.id)
+                        .filter(db.Books.id.in_(book_ids[start:start + BATCH_EDIT_CHUNK])))
+    if len(existing) != len(book_ids):
+        errors.append(unavailable)
+    if not existing:
+        return errors
+    book_ids = sorted(existing)
+    calibre_db.create_functions(config)
+    changed = set()
+    renamed = set()
+    first_author = None
+    try:
+        if 'title' in changes:
+            renamed |= batch_edit_title(book_ids, changes['title'], update_title_sort)
+        if 'title_sort' in changes:
+            changed |= batch_edit_column(book_ids, db.Books.sort, changes['title_sort'])
+        if 'author_sort' in changes:
+            changed |= batch_edit_column(book_ids, db.Books.author_sort, changes['author_sort'])
+        if 'authors' in changes:
+            input_authors = prepare_authors(changes['authors'])
+            if update_author_sort:
+                changed |= batch_edit_column(book_ids, db.Books.author_sort, get_sorted_authors(input_authors))
+            authors_changed = batch_edit_links(book_ids, db.Authors, 'author', db.books_authors_link.c.author,
+                                               input_authors, ordered=True)
+            if authors_changed:
+                renamed |= authors_changed
+                first_author = input_authors[0]
+        if 'categories' in changes:
+            changed |= batch_edit_links(book_ids, db.Tags, 'tags', db.books_tags_link.c.tag,
+                                        split_tags(changes['categories']))
+        if 'series' in changes:
+            changed |= batch_edit_links(book_ids, db.Series, 'series', db.books_series_link.c.series,
+                                        [strip_whitespaces(changes['series'])])
+        if 'languages' in changes:
+            invalid = list()
+            input_languages = isoLanguages.get_language_code_from_name(get_locale(), changes['languages'].split(','),
+                                                                       invalid)
+            if invalid:
+                errors.append({"success": False, "msg": 'Invalid languages in request: {}'.format(','.join(invalid))})
+            if input_languages:
+                changed |= batch_edit_links(book_ids, db.Languages, 'languages', db.books_languages_link.c.lang_code,
+                                            helper.uniq(input_languages))
+        if 'publishers' in changes:
+            changed |= batch_edit_links(book_ids, db.Publishers, 'publisher', db.books_publishers_link.c.publisher,
+                                        [strip_whitespaces(changes['publishers'])])
+        if 'comments' in changes:
+            changed |= batch_edit_comments(book_ids, changes['comments'])
+        changed |= renamed
+        batch_set_modified(sorted(changed))
+        calibre_db.session.commit()
+    except (OperationalError, IntegrityError, StaleDataError) as e:
+        calibre_db.session.rollback()
+        log.error_or_exception("Database error: {}".format(e))
+        return [{"success": False, "msg": 'Database error: {}'.format(e.orig if hasattr(e, "orig") else e)}]
+    log.debug("Batch edit changed {} of {} books".format(len(changed), len(book_ids)))
+    if renamed:
+        WorkerThread.add(current_user.name, TaskRenameBooks(sorted(renamed), first_author))
+    return errors
+
+
+def batch_edit_title(book_ids, title, update_title_sort):
+    title = strip_whitespaces(title) or _(u'Unknown')
+    old_sorts = dict()
+    for start in range(0, len(book_ids), BATCH_EDIT_CHUNK):
+        for book_id, book_title, book_sort in calibre_db.session.query(db.Books.id, db.Books.title, db.Books.sort) \
+                .filter(db.Books.id.in_(book_ids[start:start + BATCH_EDIT_CHUNK])):
+            if book_title != title:
+                old_sorts[book_id] = book_sort
+    changed = sorted(old_sorts)
+    books = db.Books.__table__
+    for start in range(0, len(changed), BATCH_EDIT_CHUNK):
+        calibre_db.session.execute(books.update().where(books.c.id.in_(changed[start:start + BATCH_EDIT_CHUNK]))
+                                   .values(title=title))
+    if changed and not update_title_sort:
+        # the update trigger of the books table generated a new title sort, restore the previous one
+        calibre_db.session.execute(books.update().where(books.c.id == bindparam('book_id'))
+                                   .values(sort=bindparam('old_sort')),
+                                   [{'book_id': book_id, 'old_sort': sort} for book_id, sort in old_sorts.items()])
+    return set(changed)
+
+
+def batch_edit_column(book_ids, column, value):
+    changed = list()
+    for start in range(0, len(book_ids), BATCH_EDIT_CHUNK):
+        changed.extend(book_id for book_id, current in calibre_db.session.query(db.Books.id, column)
+                       .filter(db.Books.id.in_(book_ids[start:start + BATCH_EDIT_CHUNK])) if current != value)
+    books = db.Books.__table__
+    for start in range(0, len(changed), BATCH_EDIT_CHUNK):
+        calibre_db.session.execute(books.update().where(books.c.id.in_(changed[start:start + BATCH_EDIT_CHUNK]))
+                                   .values({column.key: value}))
+    return set(changed)
+
+
+# Links all books to exactly the given elements, elements are created if needed and deleted if they are no longer
+# used. With ordered the order of the links matters, e.g. for authors. Returns the ids of the changed books
+def batch_edit_links(book_ids, db_object, db_type, link_column, input_elements, ordered=False):
+    link_table = link_column.table
+    book_column = link_table.c.book
+    elements = list()
+    add_objects(elements, db_object, calibre_db.session, db_type, [x for x in input_elements if x != ''])
+    calibre_db.session.flush()
+    target = list()
+    for element in elements:
+        if element.id not in target:
+            target.append(element.id)
+    changed = list()
+    removed = set()
+    for start in range(0, len(book_ids), BATCH_EDIT_CHUNK):
+        chunk = book_ids[start:start + BATCH_EDIT_CHUNK]
+        linked = dict()
+        for book_id, element_id in calibre_db.session.query(book_column, link_column) \
+                .filter(book_column.in_(chunk)).order_by(text("rowid")):
+            linked.setdefault(book_id, list()).append(element_id)
+        for book_id in chunk:
+            current = linked.get(book_id, [])
+            if (current != target) if ordered else (set(current) != set(target)):
+                changed.append(book_id)
+                removed.update(set(current) - set(target))
+    for start in range(0, len(changed), BATCH_EDIT_CHUNK):
+        chunk = changed[start:start + BATCH_EDIT_CHUNK]
+        calibre_db.session.execute(link_table.delete().where(book_column.in_(chunk)))
+        if target:
+            calibre_db.session.execute(link_table.insert(), [{'book': book_id, link_column.key: element_id}
+                                                             for book_id in chunk for element_id in target])
+    delete_orphans(db_object, link_column, removed)
+    return set(changed)
+
+
+# Deletes the given elements (authors, tags, ...) if no book is linked to them anymore
+def delete_orphans(db_object, link_column, element_ids):
+    element_ids = sorted(element_ids)
+    for start in range(0, len(element_ids), BATCH_EDIT_CHUNK):
+        calibre_db.session.query(db_object).filter(db_object.id.in_(element_ids[start:start + BATCH_EDIT_CHUNK])) \
+            .filter(~exists().where(link_column == db_object.id)).delete(synchronize_session=False)
+
+
+def batch_edit_comments(book_ids, comments):
+    comments = clean_string(comments)
+    current = dict()
+    for start in range(0, len(book_ids), BATCH_EDIT_CHUNK):
+        current.update(calibre_db.session.query(db.Comments.book, db.Comments.text)
+                       .filter(db.Comments.book.in_(book_ids[start:start + BATCH_EDIT_CHUNK])))
+    updated = [book_id for book_id in book_ids if book_id in current and current[book_id] != comments]
+    added = [book_id for book_id in book_ids if book_id not in current] if comments else []
+    table = db.Comments.__table__
+    if updated:
+        calibre_db.session.execute(table.update().where(table.c.book == bindparam('book_id'))
+                                   .values(text=comments), [{'book_id': book_id} for book_id in updated])
+    if added:
+        calibre_db.session.execute(table.insert(), [{'book': book_id, 'text': comments} for book_id in added])
+    return set(updated + added)
+
+
+def batch_set_modified(book_ids):
+    now = datetime.now(timezone.utc)
+    books = db.Books.__table__
+    for start in range(0, len(book_ids), BATCH_EDIT_CHUNK):
+        chunk = book_ids[start:start + BATCH_EDIT_CHUNK]
+        calibre_db.session.execute(books.update().where(books.c.id.in_(chunk)).values(last_modified=now))
+        calibre_db.session.execute(db.Metadata_Dirtied.__table__.insert().prefix_with("OR IGNORE"),
+                                   [{'book': book_id} for book_id in chunk])
+
+
 # Separated from /editbooks so that /editselectedbooks can also use this
 #
 # param: the property of the book to be changed
@@ -423,7 +552,7 @@ def edit_book_param(param, vals, multi=False):
                     kobo_sync_status.remove_synced_book(book.id)
                 continue
             elif param == 'read_status':
-                error = helper.edit_book_read_status(book.id, vals['value'] == "True")
+                error = helper.edit_book_read_status(book.id, vals['value'] == "True", sync=True)
                 if error:
                     if multi:
                         out.append({"success":False, "msg":error})
@@ -536,7 +665,7 @@ def read_selected_books():
     if vals:
         try:
             for book_id in vals:
-                ret = helper.edit_book_read_status(book_id, markAsRead)
+                ret = helper.edit_book_read_status(book_id, markAsRead, sync=True)
 
         except (OperationalError, IntegrityError, StaleDataError) as e:
             calibre_db.session.rollback()
@@ -810,9 +939,7 @@ def identifier_list(to_save, book):
     return result
 
 
-def prepare_authors(authr, calibre_path, gdrive=False):
-    if gdrive:
-        calibre_path = ""
+def prepare_authors(authr):
     # handle authors
     input_authors = authr.split('&')
     # handle_authors(input_authors)
@@ -840,10 +967,10 @@ def prepare_authors(authr, calibre_path, gdrive=False):
             # rename all book author_sort strings with the new author name
             all_books = calibre_db.session.query(db.Books) \
                 .filter(db.Books.authors.any(db.Authors.name == renamed_author.name)).all()
+            sorted_old_author = helper.get_sorted_author(old_author_name)
+            sorted_renamed_author = helper.get_sorted_author(in_aut)
+            renamed_books = list()
             for one_book in all_books:
-                # ToDo: check
-                sorted_old_author = helper.get_sorted_author(old_author_name)
-                sorted_renamed_author = helper.get_sorted_author(in_aut)
                 # change author sort path
                 try:
                     author_index = one_book.author_sort.index(sorted_old_author)
@@ -853,24 +980,21 @@ def prepare_authors(authr, calibre_path, gdrive=False):
                     author_index = -1
                 # change book path if changed author is first author -> match on first position
                 if author_index == 0:
-                    one_titledir = one_book.path.split('/')[1]
-                    one_old_authordir = one_book.path.split('/')[0]
-                    # rename author path only once per renamed author -> search all books with author name in book.path
-                    # das muss einmal geschehen aber pro Buch geprüft werden ansonsten habe ich das Problem das vlt. 2 gleiche Ordner bis auf Groß/Kleinschreibung vorhanden sind im Umzug
-                    new_author_dir = helper.rename_author_path(in_aut, one_old_authordir, renamed_author.name, calibre_path, gdrive)
-                    one_book.path = os.path.join(new_author_dir, one_titledir).replace('\\', '/')
-                    # rename all books in book data with the new author name and move corresponding files to new locations
-                    # old_path = os.path.join(calibre_path, new_author_dir, one_titledir)
-                    new_path = os.path.join(calibre_path, new_author_dir, one_titledir)
-                    all_new_name = helper.get_valid_filename(one_book.title, chars=42) + ' - ' \
-                                   + helper.get_valid_filename(renamed_author.name, chars=42)
-                    # change location in database to new author/title path
-                    error = helper.rename_all_files_on_change(one_book, new_path, new_path, all_new_name, gdrive)
-                    if error:
-                        flash(error)
+                    renamed_books.append(one_book.id)
+            if renamed_books:
+                rename_books_after_request(renamed_books, in_aut)
     return input_authors
 
 
+def rename_books_after_request(book_ids, first_author):
+    # The folders of all books are moved by one background job, it reads the book paths and has to start after the
+    # changes of this request are committed
+    @after_this_request
+    def add_rename_task(response):
+        WorkerThread.add(current_user.name, TaskRenameBooks(book_ids, first_author))
+        return response
+
+
 def prepare_authors_on_upload(title, authr):
     if title != _('Unknown') and authr != _('Unknown'):
         entry = calibre_db.check_exists_book(authr, title)
@@ -879,7 +1003,7 @@ def prepare_authors_on_upload(title, authr):
             flash(_("Uploaded book probably exists in the library, consider to change before upload new: ")
                   + Markup(render_title_template('book_exists_flash.html', entry=entry)), category="warning")
 
-    input_authors = prepare_authors(authr, config.get_book_path(), config.config_use_google_drive)
+    input_authors = prepare_authors(authr)
 
     sort_authors_list = list()
     db_author = None
@@ -1015,49 +1139,54 @@ def move_coverfile(meta, db_book):
 
 
 def delete_whole_book(book_id, book):
-    # delete book from shelves, Downloads, Read list
-    ub.session.query(ub.BookShelf).filter(ub.BookShelf.book_id == book_id).delete()
-    ub.session.query(ub.ReadBook).filter(ub.ReadBook.book_id == book_id).delete()
-    ub.delete_download(book_id)
+    delete_books_from_database([book_id])
+
+
+# Removes books with their links, custom column values and no longer used authors, tags, series, languages and
+# publishers with a few statements per chunk of books, the caller commits the Calibre session
+def delete_books_from_database(book_ids):
+    book_ids = sorted(book_ids)
+    # delete books from shelves, Downloads, Read list
+    ub.flush_activity()
+    for start in range(0, len(book_ids), BATCH_EDIT_CHUNK):
+        chunk = book_ids[start:start + BATCH_EDIT_CHUNK]
+        ub.session.query(ub.BookShelf).filter(ub.BookShelf.book_id.in_(chunk)).delete(synchronize_session=False)
+        ub.session.query(ub.ReadBook).filter(ub.ReadBook.book_id.in_(chunk)).delete(synchronize_session=False)
+        ub.session.query(ub.Downloads).filter(ub.Downloads.book_id.in_(chunk)).delete(synchronize_session=False)
+    ub.mark_shelves_changed()
     ub.session_commit()
 
-    # check if only this book links to:
-    # author, language, series, tags, custom columns
-    modify_database_object([''], book.authors, db.Authors, calibre_db.session, 'author')
-    modify_database_object([u''], book.tags, db.Tags, calibre_db.session, 'tags')
-    modify_database_object([u''], book.series, db.Series, calibre_db.session, 'series')
-    modify_database_object([u''], book.languages, db.Languages, calibre_db.session, 'languages')
-    modify_database_object([u''], book.publishers, db.Publishers, calibre_db.session, 'publishers')
-
-    cc = calibre_db.session.query(db.CustomColumns). \
-        filter(db.CustomColumns.datatype.notin_(db.cc_exceptions)).all()
-    for c in cc:
-        cc_string = "custom_column_" + str(c.id)
-        if not c.is_multiple:
-            if len(getattr(book, cc_string)) > 0:
-                if c.datatype == 'bool' or c.datatype == 'integer' or c.datatype == 'float':
-                    del_cc = getattr(book, cc_string)[0]
-                    getattr(book, cc_string).remove(del_cc)
-                    log.debug('remove ' + str(c.id))
-                    calibre_db.session.delete(del_cc)
-                    calibre_db.session.commit()
-                elif c.datatype == 'rating':
-                    del_cc = getattr(book, cc_string)[0]
-                    getattr(book, cc_string).remove(del_cc)
-                    if len(del_cc.books) == 0:
-                        log.debug('remove ' + str(c.id))
-                        calibre_db.session.delete(del_cc)
-                        calibre_db.session.commit()
-                else:
-                    del_cc = getattr(book, cc_string)[0]
-                    getattr(book, cc_string).remove(del_cc)
-                    log.debug('remove ' + str(c.id))
-                    calibre_db.session.delete(del_cc)
-                    calibre_db.session.commit()
+    links = [(db.Authors, db.books_authors_link.c.author),
+             (db.Tags, db.books_tags_link.c.tag),
+             (db.Series, db.books_series_link.c.series),
+             (db.Languages, db.books_languages_link.c.lang_code),
+             (db.Publishers, db.books_publishers_link.c.publisher)]
+    # custom columns with a book column in the value table
+    cc_values = list()
+    for c in calibre_db.session.query(db.CustomColumns).filter(db.CustomColumns.datatype.notin_(db.cc_exceptions)):
+        relation = getattr(db.Books, "custom_column_" + str(c.id)).property
+        if relation.secondary is not None:
+            links.append((db.cc_classes[c.id], relation.secondary.c.value))
+        elif c.datatype == 'series':
+            links.append((db.cc_classes[c.id], relation.mapper.class_.__table__.c.value))
         else:
-            modify_database_object([u''], getattr(book, cc_string), db.cc_classes[c.id],
-                                   calibre_db.session, 'custom')
-    calibre_db.session.query(db.Books).filter(db.Books.id == book_id).delete()
+            cc_values.append(db.cc_classes[c.id])
+    linked = [set() for __ in links]
+    for start in range(0, len(book_ids), BATCH_EDIT_CHUNK):
+        chunk = book_ids[start:start + BATCH_EDIT_CHUNK]
+        for (__, link_column), elements in zip(links, linked):
+            book_column = link_column.table.c.book
+            elements.update(element_id for element_id, in calibre_db.session.query(link_column)
+                            .filter(book_column.in_(chunk)).distinct())
+            calibre_db.session.execute(link_column.table.delete().where(book_column.in_(chunk)))
+        for cc_class in cc_values:
+            calibre_db.session.query(cc_class).filter(cc_class.book.in_(chunk)).delete(synchronize_session=False)
+        calibre_db.session.query(db.Metadata_Dirtied).filter(db.Metadata_Dirtied.book.in_(chunk)) \
+            .delete(synchronize_session=False)
+        # the delete trigger of the books table removes formats, comments, identifiers and ratings links
+        calibre_db.session.query(db.Books).filter(db.Books.id.in_(chunk)).delete(synchronize_session=False)
+    for (db_object, link_column), elements in zip(links, linked):
+        delete_orphans(db_object, link_column, elements)
 
 
 def render_delete_book_result(book_format, book_id, location=""):
@@ -1073,11 +1202,7 @@ def check_delete_book(book_id, book_format, json_response, location=""):
     if current_user.role_delete_books():
         if json_response:
             # if json response is set, it's possible to delete more than one book, but never a format is deleted
-            res = list()
-            for b in book_id:
-                ret = delete_book_from_table(b)
-                if ret:
-                    res.extend([ret])
+            res = delete_books_from_table(book_id)
             if len(res) == 0:
                 return [{"location": get_redirect_location(location, "web.index"),
                         "type": "success",
@@ -1130,37 +1255,81 @@ def delete_book_from_UI(book_id, book_format, location=""):
     return render_delete_book_result(book_format, book_id, location)
 
 
-def delete_book_from_table(book_id):
-    book = calibre_db.get_book(book_id)
-    if book:
-        try:
-            result, error = helper.delete_book(book, config.get_book_path(), book_format="")
-            if not result:
-                return {"location": url_for("edit-book.show_edit_book", book_id=book_id),
+# Deletes the selected books of the books table from the database in one transaction, the book folders are deleted
+# afterwards by a few threads. Returns the list of errors
+def delete_books_from_table(book_ids):
+    try:
+        book_ids = sorted(set(int(book_id) for book_id in book_ids))
+    except (TypeError, ValueError) as ex:
+        return [{"location": url_for("web.index"), "type": "danger", "format": "", "message": str(ex)}]
+    res = list()
+    books = list()
+    for start in range(0, len(book_ids), BATCH_EDIT_CHUNK):
+        books.extend(calibre_db.session.query(db.Books.id, db.Books.path)
+                     .filter(db.Books.id.in_(book_ids[start:start + BATCH_EDIT_CHUNK])))
+    found = set(book.id for book in books)
+    for book_id in book_ids:
+        if book_id not in found:
+            log.error('Book with id "%s" could not be deleted: not found', book_id)
+            res.append({"location": url_for("edit-book.show_edit_book", book_id=book_id),
                         "type": "danger",
                         "format": "",
-                        "message": error}
-            delete_whole_book(book_id, book)
-            calibre_db.session.commit()
-            if error:
-                return {"location": url_for("edit-book.show_edit_book", book_id=book_id),
-                           "type": "warning",
-                           "format": "",
-                           "message": error}
-        except Exception as ex:
-            log.error_or_exception(ex)
-            calibre_db.session.rollback()
-            return {"location": url_for("edit-book.show_edit_book", book_id=book_id),
-                    "type": "danger",
+                        "message": _('Book with id "{}" could not be deleted: not found'.format(book_id))})
+    if not books:
+        return res
+    try:
+        delete_books_from_database(sorted(found))
+        calibre_db.session.commit()
+    except Exception as ex:
+        log.error_or_exception(ex)
+        calibre_db.session.rollback()
+        return res + [{"location": url_for("web.index"), "type": "danger", "format": "", "message": str(ex)}]
+    log.info("%d books deleted from database", len(books))
+    # removes the thumbnails of all books which are no longer part of the library
+    helper.clear_cover_thumbnail_cache(0)
+    for book_id, error in delete_book_folders(books):
+        res.append({"location": url_for("edit-book.show_edit_book", book_id=book_id),
+                    "type": "warning",
                     "format": "",
-                    "message": ex}
-    else:
-        # book not found
-        log.error('Book with id "%s" could not be deleted: not found', book_id)
-        return {"location": url_for("edit-book.show_edit_book", book_id=book_id),
-                "type": "danger",
-                "format": "",
-                "message": _('Book with id "{}" could not be deleted: not found'.format(book_id))}
+                    "message": error})
+    return res
+
+
+# Deletes the folders of already deleted books, books of one author are handled by the same thread as their author
+# folder is removed together with the last book. Returns a list of (book_id, error message)
+def delete_book_folders(books):
+    errors = list()
+    if config.config_use_google_drive:
+        # the Google Drive client isn't thread safe
+        for book in books:
+            __, error = helper.delete_book_gdrive(book, None)
+            if error:
+                errors.append((book.id, error))
+        return errors
+    by_author = dict()
+    for book in books:
+        by_author.setdefault(book.path.split('/')[0], list()).append(book)
+    calibre_path = config.get_book_path()
+
+    def delete_author_books(author_books):
+        author_errors = list()
+        for author_book in author_books:
+            try:
+                __, error = helper.delete_book_file(author_book, calibre_path)
+            except OSError as ex:
+                log.error("Deleting book %s failed: %s", author_book.id, ex)
+                error = str(ex)
+            if error:
+                author_errors.append((author_book.id, error))
+        return author_errors
+
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+        # the error messages are translated within a copy of the request context
+        futures = [executor.submit(copy_current_request_context(delete_author_books), author_books)
+                   for author_books in by_author.values()]
+        for future in futures:
+            errors.extend(future.result())
+    return errors
 
 
 def render_edit_book(book_id):
@@ -1234,22 +1403,25 @@ def edit_book_ratings(to_save, book):
 
 def edit_book_tags(tags, book):
     if tags is not None:
-        input_tags = tags.split(',')
-        input_tags = list(map(lambda it: strip_whitespaces(it), input_tags))
-        input_tags = helper.uniq(input_tags)
-        # Tag names are unique with NOCASE collation in the database. Remove
-        # case-insensitive duplicates before creating book-tag associations.
-        unique_tags = []
-        seen_tags = set()
-        for tag in input_tags:
-            normalized_tag = tag.casefold()
-            if normalized_tag not in seen_tags:
-                seen_tags.add(normalized_tag)
-                unique_tags.append(tag)
-        input_tags = unique_tags
-        return modify_database_object(input_tags, book.tags, db.Tags, calibre_db.session, 'tags')
+        return modify_database_object(split_tags(tags), book.tags, db.Tags, calibre_db.session, 'tags')
     return False
 
+
+def split_tags(tags):
+    input_tags = tags.split(',')
+    input_tags = list(map(lambda it: strip_whitespaces(it), input_tags))
+    input_tags = helper.uniq(input_tags)
+    # Tag names are unique with NOCASE collation in the database. Remove
+    # case-insensitive duplicates before creating book-tag associations.
+    unique_tags = []
+    seen_tags = set()
+    for tag in input_tags:
+        normalized_tag = tag.casefold()
+        if normalized_tag not in seen_tags:
+            seen_tags.add(normalized_tag)
+            unique_tags.append(tag)
+    return unique_tags
+
 def edit_book_series(series, book):
     if series is not None:
         input_series = [strip_whitespaces(series)]
@@ -1569,8 +1741,18 @@ def handle_title_on_edit(book, book_title):
 
 def handle_author_on_edit(book, author_name, update_stored=True):
     change = False
-    input_authors = prepare_authors(author_name, config.get_book_path(), config.config_use_google_drive)
+    input_authors = prepare_authors(author_name)
+    sort_authors = get_sorted_authors(input_authors)
+    if book.author_sort != sort_authors and update_stored:
+        book.author_sort = sort_authors
+        change = True
+
+    change |= modify_database_object(input_authors, book.authors, db.Authors, calibre_db.session, 'author')
+
+    return input_authors, change
+
 
+def get_sorted_authors(input_authors):
     # Search for each author if author is in database, if not, author name and sorted author name is generated new
     # everything then is assembled for sorted author field in database
     sort_authors_list = list()
@@ -1581,14 +1763,7 @@ def handle_author_on_edit(book, author_name, update_stored=True):
         else:
             stored_author = stored_author.sort
         sort_authors_list.append(helper.get_sorted_author(stored_author))
-    sort_authors = ' & '.join(sort_authors_list)
-    if book.author_sort != sort_authors and update_stored:
-        book.author_sort = sort_authors
-        change = True
-
-    change |= modify_database_object(input_authors, book.authors, db.Authors, calibre_db.session, 'author')
-
-    return input_authors, change
+    return ' & '.join(sort_authors_list)
 
 
 def search_objects_remove(db_book_object, db_type, input_elements):
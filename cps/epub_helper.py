@@ -16,7 +16,10 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 
+import struct
+import time
 import zipfile
+import zlib
 from lxml import etree
 
 from . import isoLanguages
@@ -39,7 +42,125 @@ OPF_NS = {None: OPF_NAMESPACE}  # the default namespace (no prefix)
 NSMAP = {'dc': PURL_NAMESPACE, 'opf': OPF_NAMESPACE}
 
 
+class EpubRewriter:
+    """Replaces one member of an epub file without recompressing the other members
+
+    The local headers and compressed data of all unchanged members are copied byte by byte from the source file and
+    the central directory is rebuilt, only the replaced member is compressed again. The result is produced in chunks
+    by iterating over the rewriter, its final size is known in advance. Archives which need zip64 extensions raise
+    zipfile.LargeZipFile.
+    """
+
+    def __init__(self, src, filename, data, chunk_size=64 * 1024):
+        self.src = src
+        self.chunk_size = chunk_size
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        with zipfile.ZipFile(src, 'r') as zin:
+            infos = zin.infolist()
+            self.comment = zin.comment
+        if len(infos) >= 0xFFFF or any(info.header_offset > zipfile.ZIP64_LIMIT
+                                       or info.compress_size > zipfile.ZIP64_LIMIT
+                                       or info.file_size > zipfile.ZIP64_LIMIT for info in infos):
+            raise zipfile.LargeZipFile("Epub needs zip64 extensions")
+        # list of (zipinfo, offset in source or None, length in source, new local header and data)
+        self.members = list()
+        found = False
+        with open(src, 'rb') as fin:
+            for info in infos:
+                if info.filename == filename:
+                    replaced = self._compress_member(info, data)
+                    self.members.append((replaced[0], None, len(replaced[1]), replaced[1]))
+                    found = True
+                else:
+                    self.members.append((info, info.header_offset, self._stored_length(fin, info), None))
+        if not found:
+            new_info = zipfile.ZipInfo(filename, date_time=time.localtime(time.time())[:6])
+            replaced = self._compress_member(new_info, data)
+            self.members.append((replaced[0], None, len(replaced[1]), replaced[1]))
+        self.central_directory = b"".join(self._central_directory_record(info, offset)
+                                          for info, offset in self._new_offsets())
+        self.central_directory_offset = sum(member[2] for member in self.members)
+        self.size = self.central_directory_offset + len(self.central_directory) + \
+            zipfile.sizeEndCentDir + len(self.comment)
+
+    @staticmethod
+    def _stored_length(fin, info):
+        fin.seek(info.header_offset)
+        header = struct.unpack(zipfile.structFileHeader, fin.read(zipfile.sizeFileHeader))
+        if header[0] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile("Bad local file header of {}".format(info.filename))
+        length = zipfile.sizeFileHeader + header[10] + header[11] + info.compress_size
+        if info.flag_bits & 0x08:
+            # data descriptor with optional signature follows the compressed data
+            fin.seek(info.header_offset + length)
+            length += 16 if fin.read(4) == b"PK\x07\x08" else 12
+        return length
+
+    @staticmethod
+    def _compress_member(info, data):
+        new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+        new_info.compress_type = zipfile.ZIP_DEFLATED
+        if not info.filename.isascii():
+            new_info.flag_bits |= 0x800
+        new_info.create_system = info.create_system
+        new_info.external_attr = info.external_attr or 0o600 << 16
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+        new_info.CRC = zlib.crc32(data) & 0xFFFFFFFF
+        new_info.file_size = len(data)
+        new_info.compress_size = len(payload)
+        return new_info, new_info.FileHeader() + payload
+
+    def _new_offsets(self):
+        offset = 0
+        for info, __, length, __ in self.members:
+            yield info, offset
+            offset += length
+
+    @staticmethod
+    def _central_directory_record(info, offset):
+        # names without the utf-8 flag have been decoded as cp437
+        filename = info.orig_filename.encode('utf-8' if info.flag_bits & 0x800 else 'cp437')
+        dt = info.date_time
+        dosdate = (dt[0] - 1980) << 9 | dt[1] << 5 | dt[2]
+        dostime = dt[3] << 11 | dt[4] << 5 | (dt[5] // 2)
+        return struct.pack(zipfile.structCentralDir, zipfile.stringCentralDir, info.create_version,
+                           info.create_system, info.extract_version, info.reserved, info.flag_bits, info.compress_type,
+                           dostime, dosdate, info.CRC, info.compress_size, info.file_size, len(filename),
+                           len(info.extra), len(info.comment), 0, info.internal_attr, info.external_attr,
+                           offset) + filename + info.extra + info.comment
+
+    def __iter__(self):
+        with open(self.src, 'rb') as fin:
+            for __, source_offset, length, content in self.members:
+                if content is not None:
+                    yield content
+                    continue
+                fin.seek(source_offset)
+                while length > 0:
+                    chunk = fin.read(min(self.chunk_size, length))
+                    if not chunk:
+                        raise zipfile.BadZipFile("Unexpected end of file in {}".format(self.src))
+                    length -= len(chunk)
+                    yield chunk
+        count = len(self.members)
+        yield self.central_directory
+        yield struct.pack(zipfile.structEndArchive, zipfile.stringEndArchive, 0, 0, count, count,
+                          len(self.central_directory), self.central_directory_offset, len(self.comment)) + self.comment
+
+    def write(self, dest):
+        with open(dest, 'wb') as fout:
+            for chunk in self:
+                fout.write(chunk)
+
+
 def updateEpub(src, dest, filename, data, ):
+    try:
+        EpubRewriter(src, filename, data).write(dest)
+        return
+    except zipfile.LargeZipFile:
+        pass
     # create a temp copy of the archive without filename
     with zipfile.ZipFile(src, 'r') as zin:
         with zipfile.ZipFile(dest, 'w') as zout:
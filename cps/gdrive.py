@@ -30,9 +30,10 @@ from shutil import move, copyfile
 from flask import Blueprint, flash, request, redirect, url_for, abort
 from flask_babel import gettext as _
 
-from . import logger, gdriveutils, config, ub, calibre_db, csrf
+from . import logger, gdriveutils, config, csrf
 from .admin import admin_required
 from .file_helper import get_temp_dir
+from .library_watcher import watcher as library_watcher
 from .usermanagement import user_login_required
 
 gdrive = Blueprint('gdrive', __name__, url_prefix='/gdrive')
@@ -150,7 +151,8 @@ try:
                     log.info('Setting up new DB')
                     # prevent error on windows, as os.rename does on existing files, also allow cross hdd move
                     move(os.path.join(tmp_dir, "tmp_metadata.db"), dbpath)
-                    calibre_db.reconnect_db(config, ub.app_DB_path)
+                    library_watcher.check()
+                    library_watcher.reconnect_if_changed()
         except Exception as ex:
             log.error_or_exception(ex)
         return ''
@@ -25,6 +25,7 @@ import re
 import regex
 import shutil
 import socket
+import zipfile
 from datetime import datetime, timedelta, timezone
 import requests
 import unidecode
@@ -54,8 +55,9 @@ except ImportError as e:
 
 from . import calibre_db, cli_param
 from .string_helper import strip_whitespaces
-from .tasks.convert import TaskConvert
+from .tasks.convert import TaskConvert, add_conversion, conversion_key
 from . import logger, config, db, ub, fs
+from .services import metrics
 from . import gdriveutils as gd
 from .constants import (STATIC_DIR as _STATIC_DIR, CACHE_TYPE_THUMBNAILS, THUMBNAIL_TYPE_COVER, THUMBNAIL_TYPE_SERIES,
                         SUPPORTED_CALIBRE_BINARIES)
@@ -66,7 +68,7 @@ from .tasks.mail import TaskEmail
 from .tasks.thumbnail import TaskClearCoverThumbnailCache, TaskGenerateCoverThumbnails
 from .tasks.metadata_backup import TaskBackupMetadata
 from .file_helper import get_temp_dir
-from .epub_helper import get_content_opf, create_new_metadata_backup, updateEpub, replace_metadata
+from .epub_helper import get_content_opf, create_new_metadata_backup, updateEpub, replace_metadata, EpubRewriter
 from .embed_helper import do_calibre_export
 
 log = logger.create()
@@ -113,17 +115,16 @@ def convert_book_format(book_id, calibre_path, old_book_format, new_book_format,
            link)
     settings['old_book_format'] = old_book_format
     settings['new_book_format'] = new_book_format
-    WorkerThread.add(user_id, TaskConvert(file_path, book.id, txt, settings, ereader_mail, user_id))
+    key = conversion_key(book.id, book.last_modified, old_book_format, new_book_format)
+    add_conversion(user_id, TaskConvert(file_path, book.id, txt, settings, ereader_mail, user_id, key=key))
     return None
 
 
 # Texts are not lazy translated as they are supposed to get send out as is
 def send_test_mail(ereader_mail, user_name):
-    for email in ereader_mail.split(','):
-        email = strip_whitespaces(email)
-        WorkerThread.add(user_name, TaskEmail(_('Calibre-Web Test Email'), None, None,
-                         config.get_mail_settings(), email, N_("Test Email"),
-                                              _('This Email has been sent via Calibre-Web.')))
+    WorkerThread.add(user_name, TaskEmail(_('Calibre-Web Test Email'), None, None,
+                     config.get_mail_settings(), ereader_mail, N_("Test Email"),
+                                          _('This Email has been sent via Calibre-Web.')))
     return
 
 
@@ -231,11 +232,9 @@ def send_mail(book_id, book_format, convert, ereader_mail, calibrepath, user_id)
             converted_file_name = entry.name + '.' + book_format.lower()
             link = '<a href="{}">{}</a>'.format(url_for('web.show_book', book_id=book_id), escape(book.title))
             email_text = N_("%(book)s send to eReader", book=link)
-            for email in ereader_mail.split(','):
-                email = strip_whitespaces(email)
-                WorkerThread.add(user_id, TaskEmail(_("Send to eReader"), book.path, converted_file_name,
-                                 config.get_mail_settings(), email,
-                                 email_text, _('This Email has been sent via Calibre-Web.'), book.id))
+            WorkerThread.add(user_id, TaskEmail(_("Send to eReader"), book.path, converted_file_name,
+                             config.get_mail_settings(), ereader_mail,
+                             email_text, _('This Email has been sent via Calibre-Web.'), book.id))
             return
     return _("The requested file could not be read. Maybe wrong permissions?")
 
@@ -306,27 +305,19 @@ def get_sorted_author(value):
     return value2
 
 
-def edit_book_read_status(book_id, read_status=None):
+# Read states of the internal read column are written behind, sync=True commits them before returning
+def edit_book_read_status(book_id, read_status=None, sync=False):
     if not config.config_read_column:
-        book = ub.session.query(ub.ReadBook).filter(and_(ub.ReadBook.user_id == int(current_user.id),
-                                                         ub.ReadBook.book_id == book_id)).first()
-        if not book:
-            read_book = ub.ReadBook(user_id=current_user.id, book_id=book_id)
-            book = read_book
         if read_status is None:
-            if book.read_status == ub.ReadBook.STATUS_FINISHED:
-                book.read_status = ub.ReadBook.STATUS_UNREAD
+            if ub.get_read_status(int(current_user.id), book_id) == ub.ReadBook.STATUS_FINISHED:
+                new_status = ub.ReadBook.STATUS_UNREAD
             else:
-                book.read_status = ub.ReadBook.STATUS_FINISHED
+                new_status = ub.ReadBook.STATUS_FINISHED
         else:
-            book.read_status = ub.ReadBook.STATUS_FINISHED if read_status == True else ub.ReadBook.STATUS_UNREAD
-        if not book.kobo_reading_state:
-            kobo_reading_state = ub.KoboReadingState(user_id=current_user.id, book_id=book_id)
-            kobo_reading_state.current_bookmark = ub.KoboBookmark()
-            kobo_reading_state.statistics = ub.KoboStatistics()
-            book.kobo_reading_state = kobo_reading_state
-        ub.session.merge(book)
-        ub.session_commit("Book {} readbit toggled".format(book_id))
+            new_status = ub.ReadBook.STATUS_FINISHED if read_status == True else ub.ReadBook.STATUS_UNREAD
+        if not ub.update_read_status(int(current_user.id), book_id, new_status, sync):
+            return _("Read status could not set: {}".format("Settings Database error"))
+        log.debug("Book {} readbit toggled".format(book_id))
     else:
         try:
             calibre_db.create_functions(config)
@@ -422,31 +413,6 @@ def rename_all_files_on_change(one_book, new_path, old_path, all_new_name, gdriv
     return False
 
 
-def rename_author_path(first_author, old_author_dir, renamed_author, calibre_path="", gdrive=False):
-    # Create new_author_dir from parameter or from database
-    # Create new title_dir from database and add id
-    new_authordir = get_valid_filename(first_author, chars=96)
-    new_author_rename_dir = get_valid_filename(renamed_author, chars=96)
-    if gdrive:
-        g_file = gd.getFileFromEbooksFolder(None, old_author_dir)
-        if g_file:
-            gd.moveGdriveFolderRemote(g_file, new_author_rename_dir)
-    else:
-        if os.path.isdir(os.path.join(calibre_path, old_author_dir)):
-            old_author_path = os.path.join(calibre_path, old_author_dir)
-            new_author_path = os.path.join(calibre_path, new_author_rename_dir)
-            try:
-                os.rename(old_author_path, new_author_path)
-            except OSError:
-                try:
-                    shutil.move(old_author_path, new_author_path)
-                except OSError as ex:
-                    log.error("Rename author from: %s to %s: %s", old_author_path, new_author_path, ex)
-                    log.error_or_exception(ex)
-                    raise Exception(_("Rename author from: '%(src)s' to '%(dest)s' failed with error: %(error)s",
-                             src=old_author_path, dest=new_author_path, error=str(ex)))
-    return new_authordir
-
 # Moves files in file storage during author/title rename, or from temp dir to file storage
 def update_dir_structure_file(book_id, calibre_path, original_filepath, new_author, db_filename):
     # get book database entry from id, if original path overwrite source with original_filepath
@@ -746,8 +712,10 @@ def get_book_cover_internal(book, resolution=None):
             if thumbnail:
                 cache = fs.FileSystem()
                 if cache.get_cache_file_exists(thumbnail.filename, CACHE_TYPE_THUMBNAILS):
+                    metrics.thumbnail_cache.inc("cover", "hit")
                     return send_from_directory(cache.get_cache_file_dir(thumbnail.filename, CACHE_TYPE_THUMBNAILS),
                                                thumbnail.filename)
+            metrics.thumbnail_cache.inc("cover", "miss")
 
         # Send the book cover from Google Drive if configured
         if config.config_use_google_drive:
@@ -808,8 +776,10 @@ def get_series_cover_internal(series_id, resolution=None):
         if thumbnail:
             cache = fs.FileSystem()
             if cache.get_cache_file_exists(thumbnail.filename, CACHE_TYPE_THUMBNAILS):
+                metrics.thumbnail_cache.inc("series", "hit")
                 return send_from_directory(cache.get_cache_file_dir(thumbnail.filename, CACHE_TYPE_THUMBNAILS),
                                            thumbnail.filename)
+        metrics.thumbnail_cache.inc("series", "miss")
 
     return get_series_thumbnail_on_failure(series_id, resolution)
 
@@ -921,6 +891,7 @@ def save_cover(img, book_path):
 def do_download_file(book, book_format, client, data, headers):
     book_name = data.name
     download_name = filename = None
+    epub_stream = None
     if config.config_use_google_drive:
         # startTime = time.time()
         df = gd.getFileFromEbooksFolder(book.path, data.name + "." + book_format)
@@ -952,8 +923,10 @@ def do_download_file(book, book_format, client, data, headers):
             headers["Content-Disposition"] = headers["Content-Disposition"].replace(".kepub", ".kepub.epub")
 
         if book_format == "kepub" and config.config_kepubifypath and config.config_embed_metadata:
-            filename, download_name = do_kepubify_metadata_replace(book, os.path.join(filename,
-                                                                                      book_name + "." + book_format))
+            epub_stream = get_kepubify_metadata_stream(book, os.path.join(filename, book_name + "." + book_format))
+            if not epub_stream:
+                filename, download_name = do_kepubify_metadata_replace(book, os.path.join(filename,
+                                                                                          book_name + "." + book_format))
         elif book_format != "kepub" and config.config_binariesdir and config.config_embed_metadata:
             filename, download_name = do_calibre_export(book.id, book_format)
         else:
@@ -970,7 +943,12 @@ def do_download_file(book, book_format, client, data, headers):
             except OSError as ex:
                 log.warning('Failed to remove staged download %s: %s', _tmp_path, ex)
             return resp
-    response = make_response(send_from_directory(filename, download_name + "." + book_format))
+    if epub_stream:
+        # The epub with the replaced metadata is produced while sending, no temporary copy is written
+        response = Response(iter(epub_stream), mimetype=headers["Content-Type"])
+        response.content_length = epub_stream.size
+    else:
+        response = make_response(send_from_directory(filename, download_name + "." + book_format))
     # ToDo Check headers parameter
     for element in headers:
         response.headers[element[0]] = element[1]
@@ -979,7 +957,7 @@ def do_download_file(book, book_format, client, data, headers):
     return response
 
 
-def do_kepubify_metadata_replace(book, file_path):
+def get_kepubify_metadata(book, file_path):
     custom_columns = (calibre_db.session.query(db.CustomColumns)
                       .filter(db.CustomColumns.mark_for_delete == 0)
                       .filter(db.CustomColumns.datatype.notin_(db.cc_exceptions))
@@ -987,7 +965,20 @@ def do_kepubify_metadata_replace(book, file_path):
 
     tree, cf_name = get_content_opf(file_path)
     package = create_new_metadata_backup(book, custom_columns, current_user.locale, _("Cover"), lang_type=2)
-    content = replace_metadata(tree, package)
+    return cf_name, replace_metadata(tree, package)
+
+
+# Returns the kepub with replaced metadata as iterable of chunks, None if the archive can't be rewritten in place
+def get_kepubify_metadata_stream(book, file_path):
+    cf_name, content = get_kepubify_metadata(book, file_path)
+    try:
+        return EpubRewriter(file_path, cf_name, content)
+    except zipfile.LargeZipFile:
+        return None
+
+
+def do_kepubify_metadata_replace(book, file_path):
+    cf_name, content = get_kepubify_metadata(book, file_path)
     tmp_dir = get_temp_dir()
     temp_file_name = str(uuid4())
     # open zipfile and replace metadata block in content.opf
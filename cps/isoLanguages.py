@@ -16,13 +16,18 @@
 #   You should have received a copy of the GNU General Public License
 #   along with this program. If not, see <http://www.gnu.org/licenses/>.
 import sys
+import os
+import json
+from functools import lru_cache
 
-from .iso_language_names import LANGUAGE_NAMES as _LANGUAGE_NAMES
 from . import logger
 from .string_helper import strip_whitespaces
 
 log = logger.create()
 
+# Translated language names, one json file per locale, generated from the translations of Calibre
+LANGUAGE_NAMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "language_names")
+
 
 try:
     from pycountry import languages as pyc_languages
@@ -46,11 +51,35 @@ except ImportError as ex:
     get = languages.get
 
 
+@lru_cache(maxsize=8)
+def _load_language_names(locale_name):
+    try:
+        with open(os.path.join(LANGUAGE_NAMES_DIR, locale_name + ".json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=8)
+def _language_name_index(locale_name):
+    # lower case name -> (position, code), the first code in file order wins for duplicate names
+    index = dict()
+    for position, (code, name) in enumerate(_load_language_names(locale_name).items()):
+        index.setdefault(name.lower(), (position, code))
+    return index
+
+
+def _locale_name(locale):
+    if os.path.sep not in str(locale) and _load_language_names(str(locale)) is not None:
+        return str(locale)
+    if locale is not None and _load_language_names(locale.language) is not None:
+        return locale.language
+    return None
+
+
 def get_language_names(locale):
-    names = _LANGUAGE_NAMES.get(str(locale))
-    if names is None:
-        names = _LANGUAGE_NAMES.get(locale.language)
-    return names
+    locale_name = _locale_name(locale)
+    return _load_language_names(locale_name) if locale_name else None
 
 
 def get_language_name(locale, lang_code):
@@ -69,25 +98,21 @@ def get_language_name(locale, lang_code):
 
 def get_language_code_from_name(locale, language_names, remainder=None):
     language_names = set(strip_whitespaces(x).lower() for x in language_names if x)
-    lang = list()
-    for key, val in get_language_names(locale).items():
-        val = val.lower()
-        if val in language_names:
-            lang.append(key)
-            language_names.remove(val)
-    if remainder is not None and language_names:
-        remainder.extend(language_names)
-    return lang
+    index = _language_name_index(_locale_name(locale))
+    found = sorted(index[name] for name in language_names if name in index)
+    if remainder is not None:
+        remainder.extend(name for name in language_names if name not in index)
+    return [code for __, code in found]
 
 
 def get_valid_language_codes_from_code(locale, language_names, remainder=None):
-    lang = list()
     if "" in language_names:
         language_names.remove("")
-    for k, __ in get_language_names(locale).items():
-        if k in language_names:
-            lang.append(k)
-            language_names.remove(k)
+    names = get_language_names(locale)
+    positions = {code: position for position, code in enumerate(names)}
+    lang = sorted(set(code for code in language_names if code in names), key=positions.get)
+    for code in lang:
+        language_names.remove(code)
     if remainder is not None and len(language_names):
         remainder.extend(language_names)
     return lang
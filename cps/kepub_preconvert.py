@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Converts EPUB books to KEPUB before a Kobo device asks for them. Candidates are the books on Kobo sync shelves
+# and, for users syncing the whole library, the newest books of the library. Conversions run in a few background
+# threads which only start a converter while no interactive task is waiting in the worker queue.
+
+import os
+import queue
+import threading
+import time
+
+from markupsafe import escape
+from sqlalchemy import exists
+from sqlalchemy.exc import SQLAlchemyError
+
+from . import app, config, db, ub, logger
+from .binary_helper import resolve_binary_path, SUPPORTED_KEPUBIFY_BINARIES
+from .services.cache import LRUCache
+from .services.worker import WorkerThread, STAT_WAITING, STAT_STARTED
+from .tasks.convert import TaskConvert, add_conversion, conversion_key
+
+log = logger.create()
+
+# Number of conversions running in parallel
+PRECONVERT_WORKERS = 2
+# Wait this many seconds after a change before scanning, further changes in between are covered by the same scan
+SCAN_DELAY = 10
+# Maximum number of books queued by one scan
+SCAN_LIMIT = 500
+# Seconds between two checks whether the worker is busy with interactive tasks
+IDLE_POLL = 5
+
+
+def is_enabled():
+    return bool(config.db_configured and config.config_kobo_sync and config.config_kepubifypath
+                and resolve_binary_path(config.config_kepubifypath, SUPPORTED_KEPUBIFY_BINARIES))
+
+
+class KepubPreconverter:
+    def __init__(self, workers=PRECONVERT_WORKERS, delay=SCAN_DELAY):
+        self.workers = workers
+        self.delay = delay
+        self._queue = queue.Queue()
+        self._queued = set()
+        self._lock = threading.Lock()
+        self._scan_requested = threading.Event()
+        self._threads = list()
+        # conversions which failed, they are retried once the book or the converter settings change
+        self._failed = LRUCache(maxsize=4096)
+
+    def request_scan(self):
+        """Looks for books to convert shortly, e.g. after a book was added to a Kobo sync shelf"""
+        if not is_enabled():
+            return
+        self._start()
+        self._scan_requested.set()
+
+    def submit(self, book_ids):
+        if not is_enabled():
+            return
+        self._start()
+        with self._lock:
+            for book_id in book_ids:
+                if book_id not in self._queued:
+                    self._queued.add(book_id)
+                    self._queue.put(book_id)
+
+    def _start(self):
+        with self._lock:
+            if self._threads:
+                return
+            self._threads.append(threading.Thread(target=self._scan_loop, name="KepubScan", daemon=True))
+            for number in range(self.workers):
+                self._threads.append(threading.Thread(target=self._convert_loop,
+                                                      name="KepubPreconvert-{}".format(number),
+                                                      daemon=True))
+            for thread in self._threads:
+                thread.start()
+
+    def _scan_loop(self):
+        while True:
+            self._scan_requested.wait()
+            time.sleep(self.delay)
+            self._scan_requested.clear()
+            try:
+                self.submit(self.find_candidates())
+            except Exception as ex:
+                log.error_or_exception("Kepub pre-conversion: scanning library failed: {}".format(ex))
+
+    def find_candidates(self):
+        """Returns the ids of books with EPUB but without KEPUB format which are synced to a Kobo device"""
+        with app.app_context():
+            calibre = db.CalibreDB(app)
+            try:
+                kobo_users = (calibre.session.query(ub.User.id, ub.User.kobo_only_shelves_sync)
+                              .join(ub.RemoteAuthToken, ub.RemoteAuthToken.user_id == ub.User.id)
+                              .filter(ub.RemoteAuthToken.token_type == 1)
+                              .distinct().all())
+                if not kobo_users:
+                    return []
+                query = (calibre.session.query(db.Books.id)
+                         .filter(db.Books.data.any(db.Data.format == 'EPUB'))
+                         .filter(~exists().where(db.Data.book == db.Books.id).where(db.Data.format == 'KEPUB')))
+                if all(only_shelves for __, only_shelves in kobo_users):
+                    shelf_books = (calibre.session.query(ub.BookShelf.book_id)
+                                   .join(ub.Shelf, ub.Shelf.id == ub.BookShelf.shelf)
+                                   .filter(ub.Shelf.kobo_sync)
+                                   .filter(ub.Shelf.user_id.in_([user_id for user_id, __ in kobo_users])))
+                    query = query.filter(db.Books.id.in_(shelf_books))
+                return [book_id for book_id, in query.order_by(db.Books.timestamp.desc()).limit(SCAN_LIMIT)]
+            finally:
+                calibre.session.close()
+
+    def _convert_loop(self):
+        while True:
+            book_id = self._queue.get()
+            try:
+                self._wait_for_idle_worker()
+                self._convert(book_id)
+            except Exception as ex:
+                log.error_or_exception("Kepub pre-conversion of book {} failed: {}".format(book_id, ex))
+            finally:
+                with self._lock:
+                    self._queued.discard(book_id)
+                self._queue.task_done()
+
+    @staticmethod
+    def _wait_for_idle_worker():
+        # Interactive tasks (uploads, conversions for sending to an e-reader, ...) take precedence
+        while any(task.stat in (STAT_WAITING, STAT_STARTED) and not task.scheduled
+                  for __, __, __, task, __ in WorkerThread.get_instance().tasks):
+            time.sleep(IDLE_POLL)
+
+    def _convert(self, book_id):
+        if not is_enabled():
+            return
+        with app.app_context():
+            calibre = db.CalibreDB(app)
+            try:
+                book = calibre.get_book(book_id)
+                if not book:
+                    return
+                formats = [data.format for data in book.data]
+                if 'KEPUB' in formats or 'EPUB' not in formats:
+                    return
+                data = calibre.get_book_format(book_id, 'EPUB')
+                file_path = os.path.join(config.get_book_path(), book.path, data.name)
+                key = conversion_key(book_id, book.last_modified, 'EPUB', 'KEPUB')
+                title = book.title
+            except SQLAlchemyError as ex:
+                log.error("Kepub pre-conversion: database error: {}".format(ex))
+                return
+            finally:
+                calibre.session.close()
+        if key in self._failed:
+            return
+        settings = {'old_book_format': 'EPUB', 'new_book_format': 'KEPUB'}
+        task = TaskConvert(file_path, book_id, "EPUB -> KEPUB: {}".format(escape(title)), settings, None, key=key)
+        task.low_priority = True
+        if add_conversion(None, task, queue_task=False) is not task:
+            # an identical conversion is already waiting in the worker queue
+            return
+        log.debug("Kepub pre-conversion of book %d started", book_id)
+        task.start(WorkerThread.get_instance())
+        if task.error:
+            self._failed.set(key, True)
+            log.error("Kepub pre-conversion of book %d failed: %s", book_id, task.error)
+
+
+preconverter = KepubPreconverter()
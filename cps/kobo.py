@@ -40,7 +40,7 @@ from flask import (
 from .cw_login import current_user
 from werkzeug.datastructures import Headers
 from sqlalchemy import func
-from sqlalchemy.sql.expression import and_, or_
+from sqlalchemy.sql.expression import and_, or_, exists, false
 from sqlalchemy.exc import StatementError
 
 from . import config, logger, kobo_auth, db, calibre_db, helper, shelf as shelf_lib, ub, csrf, kobo_sync_status
@@ -49,14 +49,19 @@ from .epub import get_epub_layout
 from .constants import COVER_THUMBNAIL_SMALL, COVER_THUMBNAIL_MEDIUM, COVER_THUMBNAIL_LARGE, BASE_DIR
 from .helper import get_download_link
 from .services import SyncToken as SyncToken
+from .services import metrics
 from .web import download_required
 from .kobo_auth import requires_kobo_auth, get_auth_token
+from .kepub_preconvert import preconverter
+from .library_watcher import watcher as library_watcher
 
 KOBO_FORMATS = {"KEPUB": ["KEPUB"], "EPUB": ["EPUB3", "EPUB"]}
 KOBO_STOREAPI_URL = "https://storeapi.kobo.com"
 KOBO_IMAGEHOST_URL = "https://cdn.kobo.com/book-images"
 
 SYNC_ITEM_LIMIT = 100
+# Number of shelves whose items are read with one query during the sync
+SYNC_SHELF_BATCH = 50
 
 kobo = Blueprint("kobo", __name__, url_prefix="/kobo/<auth_token>")
 kobo_auth.disable_failed_auth_redirect_for_blueprint(kobo)
@@ -146,6 +151,8 @@ def HandleSyncRequest():
         return abort(403)
     sync_token = SyncToken.SyncToken.from_headers(request.headers)
     log.info("Kobo library sync request received")
+    # read states are written behind, the sync has to see the queued ones
+    ub.flush_activity()
     log.debug("SyncToken: {}".format(sync_token))
     log.debug("Download link format {}".format(get_download_url_for_book('[bookid]', '[bookformat]')))
     if not current_app.wsgi_app.is_proxied:
@@ -166,7 +173,8 @@ def HandleSyncRequest():
 
     # We reload the book database so that the user gets a fresh view of the library
     # in case of external changes (e.g: adding a book through Calibre).
-    calibre_db.reconnect_db(config, ub.app_DB_path)
+    library_watcher.check()
+    library_watcher.reconnect_if_changed()
 
     only_kobo_shelves = current_user.kobo_only_shelves_sync
 
@@ -210,7 +218,8 @@ def HandleSyncRequest():
     for book in books:
         formats = [data.format for data in book.Books.data]
         if 'KEPUB' not in formats and config.config_kepubifypath and 'EPUB' in formats:
-            helper.convert_book_format(book.Books.id, config.get_book_path(), 'EPUB', 'KEPUB', current_user.name)
+            # normally converted in advance, the device gets the KEPUB with one of the next syncs
+            preconverter.submit([book.Books.id])
 
         kobo_reading_state = get_or_create_reading_state(book.Books.id)
         entitlement = {
@@ -323,6 +332,7 @@ def generate_sync_response(sync_token, sync_results, set_cont=False):
             log.error_or_exception("Failed to receive or parse response from Kobo's sync endpoint: {}".format(ex))
     if set_cont:
         extra_headers["x-kobo-sync"] = "continue"
+    metrics.kobo_sync_requests.inc("continue" if set_cont else "complete")
     sync_token.to_headers(extra_headers)
 
     # log.debug("Kobo Sync Content: {}".format(sync_results))
@@ -571,25 +581,35 @@ def HandleTagUpdate(tag_id):
 
 # Adds items to the given shelf.
 def add_items_to_shelf(items, shelf):
-    book_ids_already_in_shelf = set([book_shelf.book_id for book_shelf in shelf.books])
+    book_ids, items_unknown_to_calibre = get_book_ids_of_items(items)
+    ub.add_books_to_shelf(shelf, book_ids)
+    return items_unknown_to_calibre
+
+
+# Returns the ids of the books of the tag items in one query and the items which are no known books
+def get_book_ids_of_items(items):
+    tag_items = list()
     items_unknown_to_calibre = []
     for item in items:
         try:
             if item["Type"] != "ProductRevisionTagItem":
                 items_unknown_to_calibre.append(item)
                 continue
-
-            book = calibre_db.get_book_by_uuid(item["RevisionId"])
-            if not book:
-                items_unknown_to_calibre.append(item)
-                continue
-
-            book_id = book.id
-            if book_id not in book_ids_already_in_shelf:
-                shelf.books.append(ub.BookShelf(book_id=book_id))
+            tag_items.append((item, item["RevisionId"]))
         except KeyError:
             items_unknown_to_calibre.append(item)
-    return items_unknown_to_calibre
+    books = dict()
+    if tag_items:
+        books = dict(calibre_db.session.query(db.Books.uuid, db.Books.id)
+                     .filter(db.Books.uuid.in_([book_uuid for __, book_uuid in tag_items]))
+                     .filter(calibre_db.common_filters()).all())
+    book_ids = list()
+    for item, book_uuid in tag_items:
+        if book_uuid in books:
+            book_ids.append(books[book_uuid])
+        else:
+            items_unknown_to_calibre.append(item)
+    return book_ids, items_unknown_to_calibre
 
 
 @csrf.exempt
@@ -644,21 +664,8 @@ def HandleTagRemoveItem(tag_id):
     if not shelf_lib.check_shelf_edit_permissions(shelf):
         abort(401, description="User is unauthaurized to edit shelf.")
 
-    items_unknown_to_calibre = []
-    for item in items:
-        try:
-            if item["Type"] != "ProductRevisionTagItem":
-                items_unknown_to_calibre.append(item)
-                continue
-
-            book = calibre_db.get_book_by_uuid(item["RevisionId"])
-            if not book:
-                items_unknown_to_calibre.append(item)
-                continue
-
-            shelf.books.filter(ub.BookShelf.book_id == book.id).delete()
-        except KeyError:
-            items_unknown_to_calibre.append(item)
+    book_ids, items_unknown_to_calibre = get_book_ids_of_items(items)
+    ub.remove_books_from_shelf(shelf, book_ids)
     ub.session_commit()
 
     if items_unknown_to_calibre:
@@ -690,7 +697,7 @@ def sync_shelves(sync_token, sync_results, only_kobo_shelves=False):
         for shelf in ub.session.query(ub.Shelf).filter(
             func.datetime(ub.Shelf.last_modified) > sync_token.tags_last_modified,
             ub.Shelf.user_id == current_user.id,
-            not ub.Shelf.kobo_sync
+            ub.Shelf.kobo_sync == false()
         ):
             sync_results.append({
                 "DeletedTag": {
@@ -702,56 +709,61 @@ def sync_shelves(sync_token, sync_results, only_kobo_shelves=False):
             })
         extra_filters.append(ub.Shelf.kobo_sync)
 
-    shelflist = ub.session.query(ub.Shelf).outerjoin(ub.BookShelf).filter(
-        or_(func.datetime(ub.Shelf.last_modified) > sync_token.tags_last_modified,
-            func.datetime(ub.BookShelf.date_added) > sync_token.tags_last_modified),
+    books_added = exists().where(ub.BookShelf.shelf == ub.Shelf.id,
+                                 func.datetime(ub.BookShelf.date_added) > sync_token.tags_last_modified)
+    shelflist = ub.session.query(ub.Shelf).filter(
+        or_(func.datetime(ub.Shelf.last_modified) > sync_token.tags_last_modified, books_added),
         ub.Shelf.user_id == current_user.id,
         *extra_filters
-    ).distinct().order_by(func.datetime(ub.Shelf.last_modified).asc())
-
-    for shelf in shelflist:
-        if not shelf_lib.check_shelf_view_permissions(shelf):
-            continue
-
-        new_tags_last_modified = max(shelf.last_modified, new_tags_last_modified)
-
-        tag = create_kobo_tag(shelf)
-        if not tag:
-            continue
+    ).order_by(func.datetime(ub.Shelf.last_modified).asc()).all()
+    shelflist = [shelf for shelf in shelflist if shelf_lib.check_shelf_view_permissions(shelf)]
+
+    # the items of a batch of shelves are read with one query
+    for start in range(0, len(shelflist), SYNC_SHELF_BATCH):
+        batch = shelflist[start:start + SYNC_SHELF_BATCH]
+        shelf_items = get_shelf_items([shelf.id for shelf in batch])
+        for shelf in batch:
+            new_tags_last_modified = max(shelf.last_modified, new_tags_last_modified)
+
+            tag = create_kobo_tag(shelf, shelf_items.get(shelf.id, []))
+            if not tag:
+                continue
 
-        if shelf.created > sync_token.tags_last_modified:
-            sync_results.append({
-                "NewTag": tag
-            })
-        else:
-            sync_results.append({
-                "ChangedTag": tag
-            })
+            if shelf.created > sync_token.tags_last_modified:
+                sync_results.append({
+                    "NewTag": tag
+                })
+            else:
+                sync_results.append({
+                    "ChangedTag": tag
+                })
     sync_token.tags_last_modified = new_tags_last_modified
     ub.session_commit()
 
 
+def get_shelf_items(shelf_ids):
+    """Returns the uuids of the books on the shelves, books missing in the Calibre library are skipped"""
+    shelf_items = dict()
+    for shelf_id, book_uuid in (calibre_db.session.query(ub.BookShelf.shelf, db.Books.uuid)
+                                .join(db.Books, db.Books.id == ub.BookShelf.book_id)
+                                .filter(ub.BookShelf.shelf.in_(shelf_ids))
+                                .order_by(ub.BookShelf.id)):
+        shelf_items.setdefault(shelf_id, list()).append(book_uuid)
+    return shelf_items
+
+
 # Creates a Kobo "Tag" object from an ub.Shelf object
-def create_kobo_tag(shelf):
+def create_kobo_tag(shelf, book_uuids=None):
+    if book_uuids is None:
+        book_uuids = get_shelf_items([shelf.id]).get(shelf.id, [])
     tag = {
         "Created": convert_to_kobo_timestamp_string(shelf.created),
         "Id": shelf.uuid,
-        "Items": [],
+        "Items": [{"RevisionId": book_uuid, "Type": "ProductRevisionTagItem"} for book_uuid in book_uuids],
         "LastModified": convert_to_kobo_timestamp_string(shelf.last_modified),
         "Name": shelf.name,
         "Type": "UserTag"
     }
-    for book_shelf in shelf.books:
-        book = calibre_db.get_book(book_shelf.book_id)
-        if not book:
-            log.info("Book (id: %s) in BookShelf (id: %s) not found in book database",  book_shelf.book_id, shelf.id)
-            continue
-        tag["Items"].append(
-            {
-                "RevisionId": book.uuid,
-                "Type": "ProductRevisionTagItem"
-            }
-        )
     return {"Tag": tag}
 
 
@@ -840,6 +852,8 @@ def get_ub_read_status(kobo_read_status):
 
 
 def get_or_create_reading_state(book_id):
+    # read states toggled in the web ui may still be queued
+    ub.flush_activity()
     book_read = ub.session.query(ub.ReadBook).filter(ub.ReadBook.book_id == book_id,
                                                      ub.ReadBook.user_id == int(current_user.id)).one_or_none()
     if not book_read:
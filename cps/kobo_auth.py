@@ -68,8 +68,9 @@ from flask import g, Blueprint, abort, request
 from .cw_login import login_user, current_user
 from flask_babel import gettext as _
 
-from . import logger, config, calibre_db, db, helper, ub, lm, limiter
+from . import logger, ub, lm, limiter
 from .render_template import render_title_template
+from .kepub_preconvert import preconverter
 from .usermanagement import user_login_required
 
 
@@ -107,12 +108,8 @@ def generate_auth_token(user_id):
         ub.session.add(auth_token)
         ub.session_commit()
 
-    books = calibre_db.session.query(db.Books).join(db.Data).all()
-
-    for book in books:
-        formats = [data.format for data in book.data]
-        if 'KEPUB' not in formats and config.config_kepubifypath and 'EPUB' in formats:
-            helper.convert_book_format(book.id, config.config_calibre_dir, 'EPUB', 'KEPUB', current_user.name)
+    # Convert the books of this user to KEPUB in the background
+    preconverter.request_scan()
 
     return render_title_template(
         "generate_kobo_auth_url.html",
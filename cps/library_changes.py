@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Finds out which books changed whenever the library watcher detects a write of another program to metadata.db, edits
+# in Calibre-Web don't take a snapshot. A snapshot of all books is kept in a few compact arrays, after each change a
+# new snapshot is compared against the previous one and the changed books are handed to the subscribers. Books edited
+# in Calibre-Web meanwhile are part of the next comparison as well. Maintenance tasks can process these books instead
+# of the whole library.
+
+import threading
+import zlib
+from array import array
+from collections import namedtuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from . import app, config, db, logger
+from .kepub_preconvert import preconverter
+from .library_watcher import watcher
+from .services.worker import WorkerThread
+from .tasks.clean import TaskCleanShelves
+from .tasks.thumbnail import TaskGenerateCoverThumbnails, TaskClearCoverThumbnailCache
+
+log = logger.create()
+
+# Seconds between two tries to take the first snapshot as long as no library is configured
+BASELINE_RETRY = 30
+
+ADDED = "added"
+DELETED = "deleted"
+MODIFIED = "modified"
+
+# fields: for modified books the changed columns out of last_modified, cover, formats and path
+BookChange = namedtuple('BookChange', ['book_id', 'kind', 'fields'])
+
+# Format sets are stored as index into this table, identical sets of all snapshots share one index
+_format_sets = dict()
+_format_sets_lock = threading.Lock()
+
+
+def _format_set_index(formats):
+    key = frozenset(formats)
+    with _format_sets_lock:
+        return _format_sets.setdefault(key, len(_format_sets))
+
+
+def _checksum(value):
+    return zlib.crc32(str(value).encode('utf-8'))
+
+
+class LibrarySnapshot:
+    """State of all books sorted by id, one array per column. Timestamps and paths are only compared for equality
+    and stored as checksums"""
+
+    def __init__(self):
+        self.ids = array('q')
+        self.last_modified = array('L')
+        self.has_cover = bytearray()
+        self.formats = array('L')
+        self.paths = array('L')
+
+    def __len__(self):
+        return len(self.ids)
+
+    def append(self, book_id, last_modified, has_cover, path, formats):
+        self.ids.append(book_id)
+        self.last_modified.append(_checksum(last_modified))
+        self.has_cover.append(1 if has_cover else 0)
+        self.formats.append(_format_set_index(formats))
+        self.paths.append(_checksum(path))
+
+    @classmethod
+    def take(cls, session):
+        snapshot = cls()
+        data = iter(session.execute(text("SELECT book, format FROM data ORDER BY book")))
+        pending = next(data, None)
+        for book_id, last_modified, has_cover, path in session.execute(
+                text("SELECT id, last_modified, has_cover, path FROM books ORDER BY id")):
+            formats = list()
+            while pending is not None and pending[0] <= book_id:
+                if pending[0] == book_id:
+                    formats.append(pending[1].upper())
+                pending = next(data, None)
+            snapshot.append(book_id, last_modified, has_cover, path, formats)
+        return snapshot
+
+    def changed_fields(self, index, other, other_index):
+        fields = list()
+        if self.last_modified[index] != other.last_modified[other_index]:
+            fields.append("last_modified")
+        if self.has_cover[index] != other.has_cover[other_index]:
+            fields.append("cover")
+        if self.formats[index] != other.formats[other_index]:
+            fields.append("formats")
+        if self.paths[index] != other.paths[other_index]:
+            fields.append("path")
+        return frozenset(fields)
+
+
+def diff(old, new):
+    """Returns the list of changes between two snapshots"""
+    changes = list()
+    i = j = 0
+    while i < len(old) or j < len(new):
+        if j >= len(new) or (i < len(old) and old.ids[i] < new.ids[j]):
+            changes.append(BookChange(old.ids[i], DELETED, frozenset()))
+            i += 1
+        elif i >= len(old) or new.ids[j] < old.ids[i]:
+            changes.append(BookChange(new.ids[j], ADDED, frozenset()))
+            j += 1
+        else:
+            fields = old.changed_fields(i, new, j)
+            if fields:
+                changes.append(BookChange(new.ids[j], MODIFIED, fields))
+            i += 1
+            j += 1
+    return changes
+
+
+class ChangeCapture:
+    def __init__(self):
+        self._snapshot = None
+        # library the snapshot belongs to, a different library starts with a new snapshot
+        self._library_dir = None
+        self._subscribers = list()
+        self._changed = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback):
+        """callback(changes) is called with the list of BookChange entries after every external change of the
+        library"""
+        self._subscribers.append(callback)
+
+    def start(self):
+        if self._thread is None:
+            watcher.add_listener(self.notify)
+            self._thread = threading.Thread(target=self._run, name="LibraryChanges", daemon=True)
+            self._thread.start()
+
+    def notify(self, generation=None):
+        self._changed.set()
+
+    def _run(self):
+        while True:
+            try:
+                if self._snapshot is None:
+                    self.update()
+                    # no library configured yet
+                    if self._snapshot is None:
+                        self._changed.wait(BASELINE_RETRY)
+                        continue
+                self._changed.wait()
+                self._changed.clear()
+                self.update()
+            except Exception as ex:
+                log.error_or_exception("Detecting changed books failed: {}".format(ex))
+
+    def update(self):
+        library_dir = config.config_calibre_dir
+        snapshot = self._take()
+        if snapshot is None:
+            return
+        if self._snapshot is None or library_dir != self._library_dir:
+            self._snapshot = snapshot
+            self._library_dir = library_dir
+            return
+        changes = diff(self._snapshot, snapshot)
+        self._snapshot = snapshot
+        if not changes:
+            return
+        log.debug("%d books changed in the Calibre library", len(changes))
+        for callback in self._subscribers:
+            try:
+                callback(changes)
+            except Exception as ex:
+                log.error_or_exception("Processing changed books failed: {}".format(ex))
+
+    @staticmethod
+    def _take():
+        # opening the database without a configured library would invalidate the configuration
+        if not config.config_calibre_dir or not config.db_configured:
+            return None
+        with app.app_context():
+            calibre_db = db.CalibreDB(app)
+            try:
+                session = calibre_db.session
+                if session is None:
+                    return None
+                return LibrarySnapshot.take(session)
+            except SQLAlchemyError as ex:
+                log.error("Reading library snapshot failed: {}".format(ex))
+                return None
+
+
+def update_thumbnails(changes):
+    if not config.schedule_generate_book_covers:
+        return
+    book_ids = [change.book_id for change in changes if change.kind != DELETED]
+    if book_ids:
+        WorkerThread.add(None, TaskGenerateCoverThumbnails(book_ids=book_ids), hidden=True)
+    if any(change.kind == DELETED for change in changes):
+        # removes the thumbnails of all books which are no longer part of the library
+        WorkerThread.add(None, TaskClearCoverThumbnailCache(0), hidden=True)
+
+
+def clean_shelves(changes):
+    if any(change.kind == DELETED for change in changes):
+        WorkerThread.add(None, TaskCleanShelves(), hidden=True)
+
+
+def convert_new_books(changes):
+    if any(change.kind == ADDED or "formats" in change.fields for change in changes):
+        preconverter.request_scan()
+
+
+change_capture = ChangeCapture()
+change_capture.subscribe(update_thumbnails)
+change_capture.subscribe(clean_shelves)
+change_capture.subscribe(convert_new_books)
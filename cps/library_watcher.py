@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Detects writes to metadata.db, e.g. by Calibre desktop. Every detected change and every commit of Calibre-Web
+# itself increases the library generation, caches of library data can use the generation as part of their key and
+# stay valid as long as it doesn't change. Own commits become the new baseline of the watcher, only writes of other
+# programs reconnect the Calibre database and are handed to the listeners. The reconnect is done by the next request
+# or the scheduled reconnect task, never by the watcher thread.
+
+import os
+import sqlite3
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from . import app, calibre_db, config, ub, logger
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    use_inotify = True
+except ImportError:
+    use_inotify = False
+
+log = logger.create()
+
+# Seconds between two checks of metadata.db, with inotify this is only the fallback if events got lost
+POLL_INTERVAL = 5
+DB_FILES = ("metadata.db", "metadata.db-wal", "metadata.db-journal")
+
+
+class LibraryWatcher:
+    def __init__(self, interval=POLL_INTERVAL):
+        self.interval = interval
+        self._generation = 1
+        self._lock = threading.Lock()
+        self._dbpath = None
+        self._signature = None
+        self._data_version = None
+        self._connection = None
+        self._thread = None
+        # the first check only records the current state
+        self._baseline = True
+        self._reconnect = False
+        self._listeners = list()
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def add_listener(self, callback):
+        """callback(generation) is called after every detected change of another program"""
+        self._listeners.append(callback)
+
+    def start(self):
+        if self._thread is None:
+            self.check()
+            self._thread = threading.Thread(target=self._run, name="LibraryWatcher", daemon=True)
+            self._thread.start()
+
+    def check(self):
+        """Returns True if another program changed metadata.db since the last check, the Calibre database is
+        reconnected by the next call of reconnect_if_changed"""
+        with self._lock:
+            self._update_dbpath()
+            signature = self._file_signature()
+            if signature is None or signature == self._signature:
+                return False
+            replaced = self._signature is not None and signature[0] != self._signature[0]
+            self._signature = signature
+            if replaced:
+                # metadata.db was replaced by another file, e.g. downloaded from Google Drive
+                self._close()
+            data_version = self._read_data_version()
+            # files touched without a committed change in between, e.g. a wal checkpoint
+            if not replaced and data_version is not None and data_version == self._data_version:
+                return False
+            self._data_version = data_version
+            if self._baseline:
+                self._baseline = False
+                return False
+            self._generation += 1
+            self._reconnect = True
+        log.debug("Calibre library changed, generation %d", self._generation)
+        for callback in self._listeners:
+            try:
+                callback(self._generation)
+            except Exception as ex:
+                log.error_or_exception("Library change listener failed: {}".format(ex))
+        return True
+
+    def own_commit(self):
+        """Called after every commit of Calibre-Web to the Calibre database, the new state of metadata.db becomes the
+        baseline of the next check"""
+        with self._lock:
+            self._update_dbpath()
+            if self._baseline or not self._dbpath:
+                return
+            data_version = self._read_data_version()
+            self._signature = self._file_signature()
+            # commits which only changed the attached settings database
+            if data_version is not None and data_version == self._data_version:
+                return
+            self._data_version = data_version
+            self._generation += 1
+
+    def reconnect_if_changed(self):
+        """Reconnects the Calibre database if a change was detected since the last reconnect"""
+        with self._lock:
+            if not self._reconnect:
+                return False
+            self._reconnect = False
+        with app.app_context():
+            calibre_db.reconnect_db(config, ub.app_DB_path)
+        return True
+
+    def _update_dbpath(self):
+        dbpath = os.path.join(config.config_calibre_dir, "metadata.db") if config.config_calibre_dir else None
+        if dbpath != self._dbpath:
+            self._close()
+            self._dbpath = dbpath
+            self._signature = self._data_version = None
+
+    def _file_signature(self):
+        if not self._dbpath:
+            return None
+        try:
+            stat = os.stat(self._dbpath)
+        except OSError:
+            return None
+        # identity of metadata.db first, followed by the state of all files written on a commit
+        signature = [(stat.st_dev, stat.st_ino)]
+        for name in DB_FILES:
+            try:
+                stat = os.stat(os.path.join(os.path.dirname(self._dbpath), name))
+                signature.append((name, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                pass
+        return tuple(signature)
+
+    def _read_data_version(self):
+        # data_version of a connection changes whenever another connection committed to the database
+        try:
+            if self._connection is None:
+                self._connection = sqlite3.connect("file:{}?mode=ro".format(self._dbpath), uri=True,
+                                                   check_same_thread=False)
+            return self._connection.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error as ex:
+            log.debug("Reading data_version of %s failed: %s", self._dbpath, ex)
+            self._close()
+            return None
+
+    def _close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _run(self):
+        notifier = None
+        watched_dir = None
+        while True:
+            try:
+                library_dir = config.config_calibre_dir
+                if use_inotify and library_dir and library_dir != watched_dir:
+                    if notifier:
+                        notifier.close()
+                    notifier = INotify()
+                    notifier.add_watch(library_dir, inotify_flags.MODIFY | inotify_flags.CLOSE_WRITE
+                                       | inotify_flags.MOVED_TO | inotify_flags.CREATE | inotify_flags.DELETE)
+                    watched_dir = library_dir
+                if notifier:
+                    events = notifier.read(timeout=self.interval * 1000, read_delay=100)
+                    if events and not any(event.name in DB_FILES for event in events):
+                        continue
+                else:
+                    time.sleep(self.interval)
+                self.check()
+            except Exception as ex:
+                log.error_or_exception("Watching Calibre library failed: {}".format(ex))
+                notifier = watched_dir = None
+                time.sleep(self.interval)
+
+
+watcher = LibraryWatcher()
+
+
+@event.listens_for(Session, 'after_commit')
+def receive_after_commit(session):
+    if session.info.get('calibre_db'):
+        watcher.own_commit()
+
+
+def get_library_generation():
+    return watcher.generation
@@ -29,7 +29,13 @@ def request_username():
 
 def main():
     app = create_app()
+    register_blueprints(app)
+    from . import web_server
+    success = web_server.start()
+    sys.exit(0 if success else 1)
+
 
+def register_blueprints(app):
     from .web import web
     from .basic import basic
     from .opds import opds
@@ -43,6 +49,7 @@ def main():
     from .tasks_status import tasks
     from .error_handler import init_errorhandler
     from .remotelogin import remotelogin
+    from .metrics import metrics
     try:
         from .kobo import kobo, get_kobo_activated
         from .kobo_auth import kobo_auth
@@ -59,9 +66,9 @@ def main():
         oauth_available = False
         oauth = None
 
-    from . import web_server
     init_errorhandler()
 
+    app.register_blueprint(metrics)
     app.register_blueprint(search)
     app.register_blueprint(tasks)
     app.register_blueprint(web)
@@ -82,5 +89,3 @@ def main():
         app.register_blueprint(kobo_auth)
     if oauth_available:
         app.register_blueprint(oauth)
-    success = web_server.start()
-    sys.exit(0 if success else 1)
@@ -16,7 +16,6 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 
-import concurrent.futures
 import requests
 from bs4 import BeautifulSoup as BS  # requirement
 from typing import List, Optional
@@ -37,7 +36,7 @@ log = logger.create()
 class Amazon(Metadata):
     __name__ = "Amazon"
     __id__ = "amazon"
-    headers = {'upgrade-insecure-requests': '1',
+    HEADERS = {'upgrade-insecure-requests': '1',
                'user-agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:130.0) Gecko/20100101 Firefox/130.0',
                'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/png,image/svg+xml,*/*;q=0.8',
                'Sec-Fetch-Site': 'same-origin',
@@ -49,80 +48,76 @@ class Amazon(Metadata):
                'Priority' : 'u=0, i',
                'accept-encoding': 'gzip, deflate, br, zstd',
                'accept-language': 'en-US,en;q=0.9'}
-    session = requests.Session()
-    session.headers=headers
 
     def search(
         self, query: str, generic_cover: str = "", locale: str = "en"
     ) -> Optional[List[MetaRecord]]:
         def inner(link, index) -> [dict, int]:
-            with self.session as session:
+            try:
+                r = self.get(f"https://www.amazon.com/{link}")
+                r.raise_for_status()
+            except Exception as ex:
+                log.warning(ex)
+                return []
+            long_soup = BS(r.text, "lxml")  #~4sec :/
+            soup2 = long_soup.find("div", attrs={"id": "dp-container"})
+            if soup2 is None:
+                return []
+            try:
+                match = MetaRecord(
+                    title = "",
+                    authors = "",
+                    source=MetaSourceInfo(
+                        id=self.__id__,
+                        description="Amazon Books",
+                        link="https://amazon.com/"
+                    ),
+                    url = f"https://www.amazon.com{link}",
+                    #the more searches the slower, these are too hard to find in reasonable time or might not even exist
+                    publisher= "",  # very unreliable
+                    publishedDate= "",  # very unreliable
+                    id = None,  # ?
+                    tags = []  # dont exist on amazon
+                )
+
                 try:
-                    r = session.get(f"https://www.amazon.com/{link}")
-                    r.raise_for_status()
-                except Exception as ex:
-                    log.warning(ex)
-                    return []
-                long_soup = BS(r.text, "lxml")  #~4sec :/
-                soup2 = long_soup.find("div", attrs={"id": "dp-container"})
-                if soup2 is None:
-                    return []
+                    match.description = "\n".join(
+                        soup2.find("div", attrs={"data-feature-name": "bookDescription"}).stripped_strings)\
+                                            .replace("\xa0"," ")[:-9].strip().strip("\n")
+                except (AttributeError, TypeError):
+                    return []  # if there is no description it is not a book and therefore should be ignored
                 try:
-                    match = MetaRecord(
-                        title = "",
-                        authors = "",
-                        source=MetaSourceInfo(
-                            id=self.__id__,
-                            description="Amazon Books",
-                            link="https://amazon.com/"
-                        ),
-                        url = f"https://www.amazon.com{link}",
-                        #the more searches the slower, these are too hard to find in reasonable time or might not even exist
-                        publisher= "",  # very unreliable
-                        publishedDate= "",  # very unreliable
-                        id = None,  # ?
-                        tags = []  # dont exist on amazon
-                    )
-
-                    try:
-                        match.description = "\n".join(
-                            soup2.find("div", attrs={"data-feature-name": "bookDescription"}).stripped_strings)\
-                                                .replace("\xa0"," ")[:-9].strip().strip("\n")
-                    except (AttributeError, TypeError):
-                        return []  # if there is no description it is not a book and therefore should be ignored
-                    try:
-                        match.title = soup2.find("span", attrs={"id": "productTitle"}).text
-                    except (AttributeError, TypeError):
-                        match.title = ""
-                    try:
-                        match.authors = [next(
-                            filter(lambda i: i != " " and i != "\n" and not i.startswith("{"),
-                                   x.find_all(string=True))).strip()
-                                        for x in soup2.find_all("span", attrs={"class": "author"})]
-                    except (AttributeError, TypeError, StopIteration):
-                        match.authors = ""
-                    try:
-                        match.rating = int(
-                            soup2.find("span", class_="a-icon-alt").text.split(" ")[0].split(".")[
-                                0])  # first number in string
-                    except (AttributeError, ValueError):
-                        match.rating = 0
-                    try:
-                        match.cover = soup2.find("img", attrs={"class": "a-dynamic-image"})["src"]
-                    except (AttributeError, TypeError):
-                        match.cover = ""
-                    return match, index
-                except Exception as e:
-                    log.error_or_exception(e)
-                    return []
+                    match.title = soup2.find("span", attrs={"id": "productTitle"}).text
+                except (AttributeError, TypeError):
+                    match.title = ""
+                try:
+                    match.authors = [next(
+                        filter(lambda i: i != " " and i != "\n" and not i.startswith("{"),
+                               x.find_all(string=True))).strip()
+                                    for x in soup2.find_all("span", attrs={"class": "author"})]
+                except (AttributeError, TypeError, StopIteration):
+                    match.authors = ""
+                try:
+                    match.rating = int(
+                        soup2.find("span", class_="a-icon-alt").text.split(" ")[0].split(".")[
+                            0])  # first number in string
+                except (AttributeError, ValueError):
+                    match.rating = 0
+                try:
+                    match.cover = soup2.find("img", attrs={"class": "a-dynamic-image"})["src"]
+                except (AttributeError, TypeError):
+                    match.cover = ""
+                return match, index
+            except Exception as e:
+                log.error_or_exception(e)
+                return []
 
         val = list()
         if self.active:
             try:
-                results = self.session.get(
+                results = self.get(
                     f"https://www.amazon.com/s?k={query.replace(' ', '+')}&i=digital-text&sprefix={query.replace(' ', '+')}"
-                    f"%2Cdigital-text&ref=nb_sb_noss",
-                    headers=self.headers)
+                    f"%2Cdigital-text&ref=nb_sb_noss")
                 results.raise_for_status()
             except requests.exceptions.HTTPError as e:
                 log.error_or_exception(e)
@@ -133,8 +128,7 @@ class Amazon(Metadata):
             soup = BS(results.text, 'html.parser')
             links_list = [next(filter(lambda i: "digital-text" in i["href"], x.find_all("a")))["href"] for x in
                           soup.find_all("div", attrs={"data-component-type": "s-search-result"})]
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-                fut = {executor.submit(inner, link, index) for index, link in enumerate(links_list[:3])}
-                val = list(map(lambda x : x.result(), concurrent.futures.as_completed(fut)))
+            val = self.fetch_all(inner, [(link, index) for index, link in enumerate(links_list[:3])],
+                                 timeout=self.DEADLINE)
         result = list(filter(lambda x: x, val))
         return [x[0] for x in sorted(result, key=itemgetter(1))] #sort by amazons listing order for best relevance
@@ -20,7 +20,6 @@
 from typing import Dict, List, Optional
 from urllib.parse import quote
 
-import requests
 from cps import logger
 from cps.services.Metadata import MetaRecord, MetaSourceInfo, Metadata
 
@@ -50,10 +49,7 @@ class ComicVine(Metadata):
                 tokens = [quote(t.encode("utf-8")) for t in title_tokens]
                 query = "%20".join(tokens)
             try:
-                result = requests.get(
-                    f"{ComicVine.BASE_URL}{query}{ComicVine.QUERY_PARAMS}",
-                    headers=ComicVine.HEADERS,
-                )
+                result = self.get(f"{ComicVine.BASE_URL}{query}{ComicVine.QUERY_PARAMS}")
                 result.raise_for_status()
             except Exception as e:
                 log.warning(e)
@@ -16,10 +16,8 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 import re
-from concurrent import futures
 from typing import List, Optional
 
-import requests
 from html2text import HTML2Text
 from lxml import etree
 
@@ -62,8 +60,7 @@ class Douban(Metadata):
     DESCRIPTION_XPATH = "//div[@id='link-report']//div[@class='intro']"
     RATING_XPATH = "//div[@class='rating_self clearfix']/strong"
 
-    session = requests.Session()
-    session.headers = {
+    HEADERS = {
         'user-agent':
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36 Edg/98.0.1108.56',
     }
@@ -85,24 +82,18 @@ class Douban(Metadata):
                 log.debug("No search results in Douban")
                 return []
 
-            with futures.ThreadPoolExecutor(
-                    max_workers=5, thread_name_prefix='douban') as executor:
-
-                fut = [
-                    executor.submit(self._parse_single_book, book_id,
-                                    generic_cover) for book_id in book_id_list
-                ]
-
-                val = [
-                    future.result() for future in futures.as_completed(fut)
-                    if future.result()
-                ]
+            val = [
+                result for result in self.fetch_all(
+                    self._parse_single_book,
+                    [(book_id, generic_cover) for book_id in book_id_list],
+                    timeout=self.DEADLINE) if result
+            ]
 
         return val
 
     def _get_book_id_list_from_html(self, query: str) -> List[str]:
         try:
-            r = self.session.get(self.SEARCH_URL,
+            r = self.get(self.SEARCH_URL,
                                  params={
                                      "cat": 1001,
                                      "q": query
@@ -124,7 +115,7 @@ class Douban(Metadata):
 
     def _get_book_id_list_from_json(self, query: str) -> List[str]:
         try:
-            r = self.session.get(self.SEARCH_JSON_URL,
+            r = self.get(self.SEARCH_JSON_URL,
                                  params={
                                      "cat": 1001,
                                      "q": query
@@ -151,7 +142,7 @@ class Douban(Metadata):
         log.debug(f"start parsing {url}")
 
         try:
-            r = self.session.get(url)
+            r = self.get(url)
             r.raise_for_status()
         except Exception as e:
             log.warning(e)
@@ -17,11 +17,9 @@
 import datetime
 import json
 import re
-from multiprocessing.pool import ThreadPool
 from typing import List, Optional, Tuple, Union
 from urllib.parse import quote
 
-import requests
 from dateutil import parser
 from html2text import HTML2Text
 from lxml.html import HtmlElement, fromstring, tostring
@@ -118,7 +116,7 @@ class LubimyCzytac(Metadata):
     ) -> Optional[List[MetaRecord]]:
         if self.active:
             try:
-                result = requests.get(self._prepare_query(title=query))
+                result = self.get(self._prepare_query(title=query))
                 result.raise_for_status()
             except Exception as e:
                 log.warning(e)
@@ -127,12 +125,11 @@ class LubimyCzytac(Metadata):
             lc_parser = LubimyCzytacParser(root=root, metadata=self)
             matches = lc_parser.parse_search_results()
             if matches:
-                with ThreadPool(processes=10) as pool:
-                    final_matches = pool.starmap(
-                        lc_parser.parse_single_book,
-                        [(match, generic_cover, locale) for match in matches],
-                    )
-                return final_matches
+                return self.fetch_all(
+                    lc_parser.parse_single_book,
+                    [(match, generic_cover, locale) for match in matches],
+                    timeout=self.DEADLINE,
+                )
             return matches
 
     def _prepare_query(self, title: str) -> str:
@@ -212,12 +209,19 @@ class LubimyCzytacParser:
         self, match: MetaRecord, generic_cover: str, locale: str
     ) -> MetaRecord:
         try:
-            response = requests.get(match.url)
+            response = self.metadata.get(match.url)
             response.raise_for_status()
         except Exception as e:
             log.warning(e)
             return None
-        self.root = fromstring(response.text)
+        # books are parsed in parallel, each one gets its own parser
+        return LubimyCzytacParser(
+            root=fromstring(response.text), metadata=self.metadata
+        )._parse_book_details(match, generic_cover, locale)
+
+    def _parse_book_details(
+        self, match: MetaRecord, generic_cover: str, locale: str
+    ) -> MetaRecord:
         match.cover = self._parse_cover(generic_cover=generic_cover)
         match.description = self._parse_description()
         match.languages = self._parse_languages(locale=locale)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import time
+
+from flask import Blueprint, request, g, abort, make_response
+
+from . import logger
+from .services import metrics as prom
+from .services.worker import WorkerThread, STAT_WAITING, STAT_STARTED
+from .usermanagement import requires_basic_auth_if_no_ano, auth
+
+metrics = Blueprint('metrics', __name__)
+
+log = logger.create()
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _worker_queue_depth():
+    worker = WorkerThread._instance
+    return worker.queue.qsize() if worker else 0
+
+
+def _worker_tasks_running():
+    worker = WorkerThread._instance
+    if not worker:
+        return 0
+    with worker.doLock:
+        return len([item for item in worker.dequeued if item.task.stat in (STAT_WAITING, STAT_STARTED)])
+
+
+prom.Gauge("calibreweb_worker_queue_depth", "Number of tasks waiting in the worker queue",
+           callback=_worker_queue_depth)
+prom.Gauge("calibreweb_worker_tasks_running", "Number of dequeued tasks which are not finished yet",
+           callback=_worker_tasks_running)
+
+
+def _request_labels():
+    # Unmatched urls are collapsed into one label to keep the cardinality of the metrics bounded
+    endpoint = request.url_rule.endpoint if request.url_rule else "unmatched"
+    return request.blueprint or "", endpoint
+
+
+@metrics.before_app_request
+def start_request_timer():
+    g.metrics_start = time.perf_counter()
+    prom.http_requests_in_flight.inc()
+
+
+@metrics.after_app_request
+def record_request_metrics(response):
+    start = g.get("metrics_start")
+    if start is not None:
+        blueprint, endpoint = _request_labels()
+        prom.http_request_duration.observe(time.perf_counter() - start, blueprint, endpoint)
+        prom.http_requests.inc(blueprint, endpoint, request.method, response.status_code)
+        if response.content_length is not None:
+            prom.http_response_size.observe(response.content_length, blueprint, endpoint)
+    return response
+
+
+@metrics.teardown_app_request
+def stop_request_timer(exception=None):
+    if g.pop("metrics_start", None) is not None:
+        prom.http_requests_in_flight.dec()
+
+
+@metrics.route("/metrics")
+@requires_basic_auth_if_no_ano
+def render_metrics():
+    if not auth.current_user().role_admin():
+        abort(403)
+    response = make_response(prom.generate_latest())
+    response.headers["Content-Type"] = CONTENT_TYPE_LATEST
+    response.headers["Cache-Control"] = "no-store"
+    return response
@@ -21,21 +21,27 @@
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import datetime
+import hashlib
+import json
 from urllib.parse import unquote_plus
 
-from flask import Blueprint, request, render_template, make_response, abort, g, jsonify
+from flask import Blueprint, request, render_template, make_response, abort, g, jsonify, Response
 from flask_babel import get_locale
 from flask_babel import gettext as _
-
+try:
+    from flask import stream_template
+except ImportError:
+    stream_template = None
 
 from sqlalchemy.sql.expression import func, text, or_, and_, true
-from sqlalchemy.exc import InvalidRequestError, OperationalError
+from sqlalchemy.orm import selectinload
 
 from . import logger, config, db, calibre_db, ub, isoLanguages, constants
 from .usermanagement import requires_basic_auth_if_no_ano, auth
 from .helper import get_download_link, get_book_cover
 from .pagination import Pagination
 from .web import render_read_books
+from .library_watcher import get_library_generation
 
 
 opds = Blueprint('opds', __name__)
@@ -110,7 +116,8 @@ def feed_discover():
     if not auth.current_user().check_visibility(constants.SIDEBAR_RANDOM):
         abort(404)
     query = calibre_db.generate_linked_query(config.config_read_column, db.Books)
-    entries = query.filter(calibre_db.common_filters()).order_by(func.random()).limit(config.config_books_per_page)
+    entries = query.filter(calibre_db.common_filters()).order_by(func.random()).limit(config.config_books_per_page)\
+        .options(selectinload(db.Books.authors)).all()
     pagination = Pagination(1, config.config_books_per_page, int(config.config_books_per_page))
     cc = calibre_db.get_cc_columns(config, filter_config_custom_read=True)
     return render_xml_template('feed.xml', entries=entries, pagination=pagination, cc=cc)
@@ -138,12 +145,15 @@ def feed_hot():
     off = request.args.get("offset") or 0
     all_books = ub.session.query(ub.Downloads, func.count(ub.Downloads.book_id)).order_by(
         func.count(ub.Downloads.book_id).desc()).group_by(ub.Downloads.book_id)
-    hot_books = all_books.offset(off).limit(config.config_books_per_page)
+    hot_books = all_books.offset(off).limit(config.config_books_per_page).all()
+    query = calibre_db.generate_linked_query(config.config_read_column, db.Books)
+    download_books = query.filter(calibre_db.common_filters())\
+        .filter(db.Books.id.in_([book.Downloads.book_id for book in hot_books]))\
+        .options(selectinload(db.Books.authors)).all()
+    download_books = {entry.Books.id: entry for entry in download_books}
     entries = list()
     for book in hot_books:
-        query = calibre_db.generate_linked_query(config.config_read_column, db.Books)
-        download_book = query.filter(calibre_db.common_filters()).filter(
-            book.Downloads.book_id == db.Books.id).first()
+        download_book = download_books.get(book.Downloads.book_id)
         if download_book:
             entries.append(download_book)
         else:
@@ -384,11 +394,12 @@ def feed_languages(book_id):
 def feed_shelfindex():
     if not (auth.current_user().is_authenticated or g.allow_anonymous):
         abort(404)
-    off = request.args.get("offset") or 0
-    shelf = ub.session.query(ub.Shelf).filter(
-        or_(ub.Shelf.is_public == 1, ub.Shelf.user_id == auth.current_user().id)).order_by(ub.Shelf.name).all()
-    number = len(shelf)
-    pagination = Pagination((int(off) / (int(config.config_books_per_page)) + 1), config.config_books_per_page,
+    off = int(request.args.get("offset") or 0)
+    shelves = ub.session.query(ub.Shelf).filter(
+        or_(ub.Shelf.is_public == 1, ub.Shelf.user_id == auth.current_user().id))
+    number = shelves.count()
+    shelf = shelves.order_by(ub.Shelf.name).offset(off).limit(config.config_books_per_page).all()
+    pagination = Pagination((off / (int(config.config_books_per_page)) + 1), config.config_books_per_page,
                             number)
     cc = calibre_db.get_cc_columns(config, filter_config_custom_read=True)
     return render_xml_template('feed.xml', listelements=shelf, folder='opds.feed_shelf', pagination=pagination, cc=cc)
@@ -410,8 +421,14 @@ def feed_shelf(book_id):
                                                            ub.Shelf.id == book_id))).first()
     result = list()
     pagination = list()
+    etag = None
     # user is allowed to access shelf
     if shelf:
+        etag = shelf_feed_etag(shelf, off)
+        if request.if_none_match.contains(etag):
+            response = make_response("", 304)
+            response.set_etag(etag)
+            return response
         result, __, pagination = calibre_db.fill_indexpage((int(off) / (int(config.config_books_per_page)) + 1),
                                                            config.config_books_per_page,
                                                            db.Books,
@@ -419,20 +436,29 @@ def feed_shelf(book_id):
                                                            [ub.BookShelf.order.asc()],
                                                            True, config.config_read_column,
                                                            ub.BookShelf, ub.BookShelf.book_id == db.Books.id)
-        # delete shelf entries where book is not existent anymore, can happen if book is deleted outside calibre-web
-        wrong_entries = calibre_db.session.query(ub.BookShelf) \
-            .join(db.Books, ub.BookShelf.book_id == db.Books.id, isouter=True) \
-            .filter(db.Books.id == None).all()
-        for entry in wrong_entries:
-            log.info('Not existing book {} in {} deleted'.format(entry.book_id, shelf))
-            try:
-                ub.session.query(ub.BookShelf).filter(ub.BookShelf.book_id == entry.book_id).delete()
-                ub.session.commit()
-            except (OperationalError, InvalidRequestError) as e:
-                ub.session.rollback()
-                log.error_or_exception("Settings Database error: {}".format(e))
     cc = calibre_db.get_cc_columns(config, filter_config_custom_read=True)
-    return render_xml_template('feed.xml', entries=result, pagination=pagination, cc=cc)
+    response = render_xml_template('feed.xml', entries=result, pagination=pagination, cc=cc)
+    if etag:
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def shelf_feed_etag(shelf, off):
+    # Changes to the shelf update its last_modified, edited books their own last_modified, other changes of the
+    # library increase the library generation. Reordering the shelf doesn't touch last_modified, so the stored order
+    # is part of the key. The visible books also depend on the restrictions and archived books of the user
+    user = auth.current_user()
+    archived = ub.session.query(func.max(ub.ArchivedBook.last_modified)) \
+        .filter(ub.ArchivedBook.user_id == user.id).scalar()
+    order = ub.session.query(ub.BookShelf.book_id, ub.BookShelf.order) \
+        .filter(ub.BookShelf.shelf == shelf.id).order_by(ub.BookShelf.id).all()
+    books_modified = calibre_db.session.query(func.max(db.Books.last_modified)) \
+        .join(ub.BookShelf, ub.BookShelf.book_id == db.Books.id).filter(ub.BookShelf.shelf == shelf.id).scalar()
+    key = [shelf.id, str(shelf.last_modified), str(off), config.config_books_per_page, get_library_generation(),
+           user.id, user.role, user.default_language, user.denied_tags, user.allowed_tags, user.denied_column_value,
+           user.allowed_column_value, str(archived), str(books_modified), [list(entry) for entry in order]]
+    return hashlib.sha1(json.dumps(key).encode("utf-8")).hexdigest()
 
 
 @opds.route("/opds/download/<book_id>/<book_format>/")
@@ -526,9 +552,30 @@ def feed_search(term):
 
 
 
+def feed_relations(cc):
+    # relationships of books used by feed.xml
+    relations = [db.Books.authors, db.Books.tags, db.Books.data, db.Books.languages, db.Books.series,
+                 db.Books.publishers, db.Books.comments, db.Books.ratings]
+    for c in cc:
+        column = getattr(db.Books, 'custom_column_' + str(c.id))
+        if c.datatype == 'series':
+            relations.append((column, column.property.mapper.class_.asoc))
+        else:
+            relations.append(column)
+    return relations
+
+
 def render_xml_template(*args, **kwargs):
     # ToDo: return time in current timezone similar to %z
     currtime = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S+00:00")
+    if kwargs.get('entries'):
+        kwargs['entries'] = list(kwargs['entries'])
+        calibre_db.prefetch_relations(kwargs['entries'], feed_relations(kwargs.get('cc', [])))
+    if stream_template:
+        # the feed is sent while rendering instead of building the whole document first
+        return Response(stream_template(current_time=currtime, instance=config.config_calibre_web_title,
+                                        constants=constants.sidebar_settings, *args, **kwargs),
+                        content_type="application/atom+xml; charset=utf-8")
     xml = render_template(current_time=currtime, instance=config.config_calibre_web_title, constants=constants.sidebar_settings, *args, **kwargs)
     response = make_response(xml)
     response.headers["Content-Type"] = "application/atom+xml; charset=utf-8"
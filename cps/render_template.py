@@ -16,20 +16,31 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 
+from collections import namedtuple
+
 from flask import g, abort, request, render_template
 from flask_themes2 import render_theme_template
 from jinja2 import TemplateNotFound
-from flask_babel import gettext as _
+from flask_babel import gettext as _, get_locale
+from markupsafe import Markup
 from werkzeug.local import LocalProxy
 from .cw_login import current_user
-from sqlalchemy.sql.expression import or_
+from sqlalchemy.sql.expression import or_, func
 
 from . import config, constants, logger, ub, themes
 from .ub import User
+from .services.cache import LRUCache
 
 
 log = logger.create()
 
+# Lightweight, session independent copy of the shelves a user can access, shared between requests
+ShelfEntry = namedtuple('ShelfEntry', ['id', 'name', 'is_public', 'user_id', 'book_count'])
+
+_sidebar_cache = LRUCache(maxsize=64)
+_shelves_cache = LRUCache(maxsize=512)
+_sidebar_html_cache = LRUCache(maxsize=1024)
+
 
 def get_active_theme_identifier():
     return themes.get_theme_identifier(config.config_theme, request.blueprint)
@@ -56,6 +67,32 @@ def get_sidebar_config(kwargs=None):
         content = isinstance(content, (User, LocalProxy)) and not content.role_anonymous()
     else:
         content = 'conf' in kwargs
+    # The sidebar only depends on the locale, the roles of the user and the language filter
+    key = (str(get_locale()), current_user.role_admin(), current_user.is_anonymous,
+           current_user.filter_language() == 'all', simple, content)
+    sidebar = _sidebar_cache.get(key)
+    if sidebar is None:
+        sidebar = _build_sidebar(simple, content)
+        _sidebar_cache.set(key, sidebar)
+    g.shelves_access = get_shelves_access()
+    return sidebar, simple
+
+
+def get_shelves_access():
+    """Returns the shelves visible for the current user together with the number of books on each shelf"""
+    key = (current_user.id, ub.get_shelf_version())
+    shelves = _shelves_cache.get(key)
+    if shelves is None:
+        shelves = [ShelfEntry(*row) for row in ub.session.query(
+            ub.Shelf.id, ub.Shelf.name, ub.Shelf.is_public, ub.Shelf.user_id, func.count(ub.BookShelf.id))
+            .outerjoin(ub.BookShelf, ub.BookShelf.shelf == ub.Shelf.id)
+            .filter(or_(ub.Shelf.is_public == 1, ub.Shelf.user_id == current_user.id))
+            .group_by(ub.Shelf.id).order_by(ub.Shelf.name).all()]
+        _shelves_cache.set(key, shelves)
+    return shelves
+
+
+def _build_sidebar(simple, content):
     sidebar = list()
     sidebar.append({"glyph": "glyphicon-book", "text": _('Books'), "link": 'web.index', "id": "new",
                     "visibility": constants.SIDEBAR_RECENT, 'public': True, "page": "root",
@@ -119,10 +156,19 @@ def get_sidebar_config(kwargs=None):
             {"glyph": "glyphicon-th-list", "text": _('Books List'), "link": 'web.books_table', "id": "list",
              "visibility": constants.SIDEBAR_LIST, 'public': (not current_user.is_anonymous),
              "show_text": _('Show Books List'), "config_show": content, "no_param":True})
-    g.shelves_access = ub.session.query(ub.Shelf).filter(
-        or_(ub.Shelf.is_public == 1, ub.Shelf.user_id == current_user.id)).order_by(ub.Shelf.name).all()
+    return sidebar
 
-    return sidebar, simple
+
+def render_sidebar(sidebar, simple, page=None):
+    """Returns the navigation entries of the sidebar as html, rendered once per user, page and shelf version"""
+    key = (current_user.id, str(get_locale()), current_user.role, current_user.sidebar_view,
+           current_user.is_anonymous, current_user.filter_language(), ub.get_shelf_version(),
+           get_active_theme_identifier(), request.script_root, simple, page)
+    html = _sidebar_html_cache.get(key)
+    if html is None:
+        html = Markup(themed_render('sidebar.html', sidebar=sidebar, page=page))
+        _sidebar_html_cache.set(key, html)
+    return html
 
 
 # Returns the template for rendering and includes the instance name
@@ -132,6 +178,7 @@ def render_title_template(*args, **kwargs):
         return themed_render(args[0],
                              instance=config.config_calibre_web_title,
                              sidebar=sidebar,
+                             sidebar_html=lambda: render_sidebar(sidebar, simple, kwargs.get('page')),
                              simple=simple,
                              accept=config.config_upload_formats.split(','),
                              **kwargs)
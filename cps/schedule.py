@@ -18,13 +18,15 @@
 
 import datetime
 
-from . import config, constants
-from .services.background_scheduler import BackgroundScheduler, CronTrigger, use_APScheduler
+from . import config, constants, ub
+from .services.background_scheduler import BackgroundScheduler, CronTrigger, IntervalTrigger, use_APScheduler
 from .tasks.database import TaskReconnectDatabase
-from .tasks.clean import TaskClean
+from .tasks.clean import TaskClean, TaskCleanShelves
 from .tasks.thumbnail import TaskGenerateCoverThumbnails, TaskGenerateSeriesThumbnails, TaskClearCoverThumbnailCache
 from .services.worker import WorkerThread
 from .tasks.metadata_backup import TaskBackupMetadata
+from .tasks.rename import TaskRenameBooks
+from .kepub_preconvert import preconverter
 
 def get_scheduled_tasks(reconnect=True):
     tasks = list()
@@ -35,6 +37,9 @@ def get_scheduled_tasks(reconnect=True):
     # Delete temp folder
     tasks.append([lambda: TaskClean(), 'delete temp', True])
 
+    # Delete shelf entries of books deleted outside of Calibre-Web
+    tasks.append([lambda: TaskCleanShelves(), 'clean shelves', True])
+
     # Generate metadata.opf file for each changed book
     if config.schedule_metadata_backup:
         tasks.append([lambda: TaskBackupMetadata("en"), 'backup metadata', False])
@@ -77,12 +82,26 @@ def register_scheduled_tasks(reconnect=True):
                                                                          timezone=timezone_info),
                            name="end scheduled task")
 
+        # Extended expiry dates of user sessions are written in batches instead of on every request
+        scheduler.schedule(func=ub.flush_session_expiry, trigger=IntervalTrigger(minutes=5),
+                           name="flush user sessions")
+        ub.defer_session_expiry = True
+
+        # Convert books synced to Kobo devices to KEPUB in advance, also catches books added by Calibre
+        scheduler.schedule(func=preconverter.request_scan, trigger=IntervalTrigger(minutes=30),
+                           name="kepub pre-conversion")
+        preconverter.request_scan()
+
         # Kick-off tasks, if they should currently be running
         if should_task_be_running(start, duration):
             scheduler.schedule_tasks_immediately(tasks=get_scheduled_tasks(reconnect))
 
 
 def register_startup_tasks():
+    # Finish moving book folders interrupted by a shutdown
+    for task in TaskRenameBooks.resume_unfinished():
+        WorkerThread.add(None, task)
+
     scheduler = BackgroundScheduler()
 
     if scheduler:
@@ -134,6 +134,7 @@ def adv_search_ratings(q, rating_high, rating_low):
 
 def adv_search_read_status(read_status):
     if not config.config_read_column:
+        ub.flush_activity()
         if read_status == "True":
             db_filter = and_(ub.ReadBook.user_id == int(current_user.id),
                              ub.ReadBook.read_status == ub.ReadBook.STATUS_FINISHED)
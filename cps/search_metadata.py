@@ -22,6 +22,7 @@ import inspect
 import json
 import os
 import sys
+import threading
 from urllib.parse import urlsplit
 
 from flask import Blueprint, request, url_for, make_response, jsonify
@@ -32,6 +33,7 @@ from sqlalchemy.orm.attributes import flag_modified
 
 from cps.services.Metadata import Metadata
 from . import constants, logger, ub, web_server
+from .services.cache import LRUCache
 from .usermanagement import user_login_required
 
 
@@ -39,6 +41,14 @@ meta = Blueprint("metadata", __name__)
 
 log = logger.create()
 
+# Searches of all providers run in this pool, a search keeps running after the deadline of a request has passed
+# and its result is cached for the next request
+_search_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="metadata_search")
+# Search results by (provider, normalized query, locale)
+_search_cache = LRUCache(maxsize=512, ttl=3600)
+_running_searches = dict()
+_running_lock = threading.Lock()
+
 
 def _safe_metadata_url(value):
     if not isinstance(value, str):
@@ -111,6 +121,39 @@ def list_classes(provider_list):
 cl = list_classes(new_list)
 
 
+def _cache_key(provider, query, static_cover, locale):
+    # providers use static_cover as cover of records without one, it ends up in the results
+    return provider.__id__, " ".join(query.casefold().split()), static_cover, str(locale)
+
+
+def _run_search(provider, key, query, static_cover, locale):
+    try:
+        data = _serialize_metadata_records(provider.search(query, static_cover, locale))
+        if data:
+            _search_cache.set(key, data)
+        return data
+    finally:
+        with _running_lock:
+            _running_searches.pop(key, None)
+
+
+def search_provider(provider, query, static_cover="", locale="en"):
+    """Returns a future with the serialized search results of the provider, identical searches share one request
+    to the provider"""
+    key = _cache_key(provider, query, static_cover, locale)
+    data = _search_cache.get(key)
+    if data is not None:
+        future = concurrent.futures.Future()
+        future.set_result(data)
+        return future
+    with _running_lock:
+        future = _running_searches.get(key)
+        if future is None:
+            future = _search_executor.submit(_run_search, provider, key, query, static_cover, locale)
+            _running_searches[key] = future
+    return future
+
+
 @meta.route("/metadata/provider")
 @user_login_required
 def metadata_provider():
@@ -145,8 +188,8 @@ def metadata_change_active_provider(prov_name):
         data = []
         provider = next((c for c in cl if c.__id__ == prov_name), None)
         if provider is not None:
-            data = provider.search(new_state.get("query", ""))
-        return make_response(jsonify(_serialize_metadata_records(data)))
+            data = _collect([search_provider(provider, new_state.get("query", ""))], provider.DEADLINE)
+        return make_response(jsonify(data))
     return ""
 
 
@@ -159,13 +202,23 @@ def metadata_search():
     locale = get_locale()
     if query:
         static_cover = url_for("static", filename="generic_cover.jpg")
-        # ret = cl[0].search(query, static_cover, locale)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            meta = {
-                executor.submit(c.search, query, static_cover, locale): c
-                for c in cl
-                if active.get(c.__id__, True)
-            }
-            for future in concurrent.futures.as_completed(meta):
-                data.extend(_serialize_metadata_records(future.result()))
+        providers = [c for c in cl if active.get(c.__id__, True)]
+        if providers:
+            data = _collect([search_provider(c, query, static_cover, locale) for c in providers],
+                            max(c.DEADLINE for c in providers))
     return make_response(jsonify(data))
+
+
+def _collect(futures, deadline):
+    """Returns the results of all searches which finished before the deadline, slow providers are left out"""
+    data = list()
+    try:
+        for future in concurrent.futures.as_completed(futures, timeout=deadline):
+            try:
+                data.extend(future.result())
+            except Exception as ex:
+                log.warning("Metadata search failed: {}".format(ex))
+    except concurrent.futures.TimeoutError:
+        log.info("Metadata search: {} of {} providers did not answer in time".format(
+            sum(not future.done() for future in futures), len(futures)))
+    return data
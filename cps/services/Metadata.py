@@ -16,12 +16,24 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 import abc
+import concurrent.futures
 import dataclasses
 import os
 import re
+import threading
 from typing import Dict, Generator, List, Optional, Union
 
-from cps import constants
+import requests
+from requests.adapters import HTTPAdapter
+
+from cps import constants, logger
+
+log = logger.create()
+
+# Detail pages and covers of search results are fetched by this pool, shared by all providers
+DETAIL_WORKERS = 10
+_detail_executor = concurrent.futures.ThreadPoolExecutor(max_workers=DETAIL_WORKERS,
+                                                         thread_name_prefix="metadata_detail")
 
 
 @dataclasses.dataclass
@@ -53,13 +65,57 @@ class MetaRecord:
 class Metadata:
     __name__ = "Generic"
     __id__ = "generic"
+    # Seconds to wait for a single http request and for the complete search of this provider
+    TIMEOUT = 10
+    DEADLINE = 20
+    HEADERS = None
 
     def __init__(self):
         self.active = True
+        self._session = None
+        self._session_lock = threading.Lock()
 
     def set_status(self, state):
         self.active = state
 
+    @property
+    def session(self):
+        """One http session per provider, connections are kept alive and reused by all searches"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=DETAIL_WORKERS)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    if self.HEADERS:
+                        session.headers.update(self.HEADERS)
+                    self._session = session
+        return self._session
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault("timeout", self.TIMEOUT)
+        return self.session.get(url, **kwargs)
+
+    @staticmethod
+    def fetch_all(function, arguments, timeout=None):
+        """Calls function(*args) for all arguments in the shared detail pool and returns the results in the order
+        of arguments. Results which are not ready before the timeout are returned as None"""
+        futures = [_detail_executor.submit(function, *args) for args in arguments]
+        concurrent.futures.wait(futures, timeout=timeout)
+        results = list()
+        for future in futures:
+            if not future.done():
+                future.cancel()
+                results.append(None)
+            elif future.cancelled() or future.exception() is not None:
+                if not future.cancelled():
+                    log.warning(future.exception())
+                results.append(None)
+            else:
+                results.append(future.result())
+        return results
+
     @abc.abstractmethod
     def search(
         self, query: str, generic_cover: str = "", locale: str = "en"
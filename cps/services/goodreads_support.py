@@ -16,10 +16,15 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 
+import concurrent.futures
+import hashlib
+import json
+import os
+import threading
 import time
-from functools import reduce
 import requests
 
+from goodreads.author import GoodreadsAuthor
 from goodreads.client import GoodreadsClient
 from goodreads.request import GoodreadsRequest
 from lxml import etree
@@ -31,6 +36,9 @@ except ImportError:
 
 from .. import logger
 from ..clean_html import clean_string
+from ..constants import CACHE_TYPE_GOODREADS
+from ..fs import FileSystem
+from .cache import LRUCache
 
 
 
@@ -105,7 +113,17 @@ _client = None  # type: GoodreadsClient
 
 # GoodReads TOS allows for 24h caching of data
 _CACHE_TIMEOUT = 23 * 60 * 60  # 23 hours (in seconds)
-_AUTHORS_CACHE = {}
+# Authors unknown to Goodreads or failed requests are asked for again after this time
+_MISS_TIMEOUT = 60 * 60
+# Maximum number of authors kept in memory and in the cache directory
+_MEMORY_CACHE_SIZE = 256
+_FILE_CACHE_SIZE = 2000
+_NOT_FOUND = object()
+
+_authors_cache = LRUCache(maxsize=_MEMORY_CACHE_SIZE, ttl=_CACHE_TIMEOUT)
+_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="goodreads")
+_pending = dict()
+_pending_lock = threading.Lock()
 
 
 def connect(key=None, enabled=True):
@@ -124,31 +142,95 @@ def connect(key=None, enabled=True):
         _client = my_GoodreadsClient(key, None)
 
 
-def get_author_info(author_name):
-    now = time.time()
-    author_info = _AUTHORS_CACHE.get(author_name, None)
-    if author_info:
-        if now < author_info._timestamp + _CACHE_TIMEOUT:
-            return author_info
-        # clear expired entries
-        del _AUTHORS_CACHE[author_name]
+def _prepare(author_info):
+    author_info.safe_about = clean_string(author_info.about or "")
+    return author_info
 
-    if not _client:
-        log.warning("failed to get a Goodreads client")
-        return
 
+def _cache_file_name(author_name):
+    return hashlib.sha1(author_name.encode('utf-8')).hexdigest() + ".json"
+
+
+def _read_cache_file(author_name):
     try:
-        author_info = _client.find_author(author_name=author_name)
-    except Exception as ex:
-        # Skip goodreads, if site is down/inaccessible
-        log.warning('Goodreads website is down/inaccessible? %s', ex.__str__())
-        return
+        path = FileSystem().get_cache_file_path(_cache_file_name(author_name), CACHE_TYPE_GOODREADS)
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get("name") != author_name or time.time() > entry.get("timestamp", 0) + _CACHE_TIMEOUT:
+        return None
+    return _prepare(GoodreadsAuthor(entry["author"], _client))
+
+
+def _write_cache_file(author_name, author_info):
+    file_system = FileSystem()
+    try:
+        path = file_system.get_cache_file_path(_cache_file_name(author_name), CACHE_TYPE_GOODREADS)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"name": author_name, "timestamp": time.time(), "author": author_info._author_dict}, f)
+        os.replace(path + ".tmp", path)
+        _prune_cache_files(file_system.get_cache_dir(CACHE_TYPE_GOODREADS))
+    except (OSError, TypeError, ValueError) as ex:
+        log.debug("Caching Goodreads author %s failed: %s", author_name, ex)
+
+
+def _prune_cache_files(cache_dir):
+    files = list()
+    for root, __, names in os.walk(cache_dir):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                files.append((os.path.getmtime(path), path))
+            except OSError:
+                pass
+    if len(files) > _FILE_CACHE_SIZE:
+        files.sort()
+        for __, path in files[:len(files) - _FILE_CACHE_SIZE]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _fetch_author_info(author_name):
+    try:
+        if not _client:
+            log.warning("failed to get a Goodreads client")
+            return
+        try:
+            author_info = _client.find_author(author_name=author_name)
+        except Exception as ex:
+            # Skip goodreads, if site is down/inaccessible
+            log.warning('Goodreads website is down/inaccessible? %s', ex.__str__())
+            _authors_cache.set(author_name, _NOT_FOUND, ttl=_MISS_TIMEOUT)
+            return
+        if author_info:
+            _authors_cache.set(author_name, _prepare(author_info))
+            _write_cache_file(author_name, author_info)
+        else:
+            _authors_cache.set(author_name, _NOT_FOUND, ttl=_MISS_TIMEOUT)
+    finally:
+        with _pending_lock:
+            _pending.pop(author_name, None)
 
-    if author_info:
-        author_info._timestamp = now
-        author_info.safe_about = clean_string(author_info.about)
-        _AUTHORS_CACHE[author_name] = author_info
-    return author_info
+
+def get_author_info(author_name):
+    """Returns (ready, author_info) without waiting for Goodreads. If the author is not cached yet, it is fetched in
+    the background and ready is False, author_info is None for authors unknown to Goodreads"""
+    author_info = _authors_cache.get(author_name)
+    if author_info is None:
+        author_info = _read_cache_file(author_name)
+        if author_info is not None:
+            _authors_cache.set(author_name, author_info)
+    if author_info is not None:
+        return True, None if author_info is _NOT_FOUND else author_info
+    if not _client:
+        return True, None
+    with _pending_lock:
+        if author_name not in _pending:
+            _pending[author_name] = _executor.submit(_fetch_author_info, author_name)
+    return False, None
 
 
 def get_other_books(author_info, library_books=None):
@@ -159,26 +241,29 @@ def get_other_books(author_info, library_books=None):
     if not author_info:
         return
 
-    identifiers = []
-    library_titles = []
+    identifiers = set()
+    library_titles = set()
     if library_books:
-        identifiers = list(
-            reduce(lambda acc, book: acc + [i.val for i in book.identifiers if i.val], library_books, []))
-        library_titles = [book.title for book in library_books]
+        identifiers = {i.val for book in library_books for i in book.identifiers if i.val}
+        library_titles = {book.title for book in library_books}
 
     for book in author_info.books:
         if book.isbn in identifiers:
             continue
-        if isinstance(book.gid, int):
-            if book.gid in identifiers:
-                continue
-        else:
-            if book.gid["#text"] in identifiers:
-                continue
+        if (book.gid if isinstance(book.gid, int) else book.gid["#text"]) in identifiers:
+            continue
 
-        if Levenshtein and library_titles:
+        if library_titles:
             goodreads_title = book._book_dict['title_without_series']
-            if any(Levenshtein.ratio(goodreads_title, title) > 0.7 for title in library_titles):
+            if goodreads_title in library_titles:
+                continue
+            # the ratio can't exceed 0.7 if one title is much shorter than the other one
+            if Levenshtein and any(_similar_length(goodreads_title, title)
+                                   and Levenshtein.ratio(goodreads_title, title) > 0.7 for title in library_titles):
                 continue
 
         yield book
+
+
+def _similar_length(first, second):
+    return 2 * min(len(first), len(second)) > 0.7 * (len(first) + len(second))
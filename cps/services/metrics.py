@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Minimal, dependency free implementation of the Prometheus text exposition format. Only the metric types used
+# inside Calibre-Web are implemented (counter, gauge, histogram), all of them are thread safe.
+
+import abc
+import threading
+from bisect import bisect_left
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+DEFAULT_TASK_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0)
+
+_registry = list()
+_registry_lock = threading.Lock()
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = ['{}="{}"'.format(name, _escape(value)) for name, value in zip(names, values)]
+    if extra:
+        pairs.append('{}="{}"'.format(extra[0], extra[1]))
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return repr(value)
+    return str(value)
+
+
+class _Metric(abc.ABC):
+    metric_type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = dict()
+        with _registry_lock:
+            _registry.append(self)
+
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError("Metric {} expects labels {}".format(self.name, self.labelnames))
+        return tuple(str(label) for label in labels)
+
+    @abc.abstractmethod
+    def _samples(self):
+        """Lines of all samples of this metric"""
+
+    def render(self):
+        lines = ["# HELP {} {}".format(self.name, self.documentation),
+                 "# TYPE {} {}".format(self.name, self.metric_type)]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def inc(self, *labels, amount=1):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self):
+        with self._lock:
+            values = dict(self._values)
+        if not values and not self.labelnames:
+            values[()] = 0
+        return ["{}{} {}".format(self.name, _format_labels(self.labelnames, key), _format_value(value))
+                for key, value in sorted(values.items())]
+
+
+class Gauge(_Metric):
+    metric_type = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(), callback=None):
+        # callback is evaluated on every scrape, it has to return the value (unlabeled gauges) or a dict
+        # label tuple -> value (labeled gauges)
+        super().__init__(name, documentation, labelnames)
+        self._callback = callback
+
+    def set(self, value, *labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, *labels, amount=1):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, *labels, amount=1):
+        self.inc(*labels, amount=-amount)
+
+    def _samples(self):
+        if self._callback:
+            try:
+                result = self._callback()
+            except Exception:
+                result = None
+            if result is None:
+                values = dict()
+            elif isinstance(result, dict):
+                values = result
+            else:
+                values = {(): result}
+        else:
+            with self._lock:
+                values = dict(self._values)
+            if not values and not self.labelnames:
+                values[()] = 0
+        return ["{}{} {}".format(self.name, _format_labels(self.labelnames, key), _format_value(value))
+                for key, value in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    metric_type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, *labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                # per bucket counts (last one is +Inf), sum of all observations
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def _samples(self):
+        with self._lock:
+            values = {key: (list(entry[0]), entry[1]) for key, entry in self._values.items()}
+        lines = list()
+        for key, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                lines.append("{}_bucket{} {}".format(self.name,
+                                                     _format_labels(self.labelnames, key, ("le", _format_value(bound))),
+                                                     cumulative))
+            lines.append("{}_sum{} {}".format(self.name, _format_labels(self.labelnames, key), total))
+            lines.append("{}_count{} {}".format(self.name, _format_labels(self.labelnames, key), cumulative))
+        return lines
+
+
+def generate_latest():
+    with _registry_lock:
+        metrics = list(_registry)
+    return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+# Metrics which are updated from several parts of Calibre-Web
+http_requests = Counter("calibreweb_http_requests_total",
+                        "Number of handled HTTP requests",
+                        ("blueprint", "endpoint", "method", "status"))
+http_request_duration = Histogram("calibreweb_http_request_duration_seconds",
+                                  "HTTP request latency",
+                                  ("blueprint", "endpoint"))
+http_requests_in_flight = Gauge("calibreweb_http_requests_in_flight",
+                                "Number of HTTP requests currently being processed")
+http_response_size = Histogram("calibreweb_http_response_size_bytes",
+                               "Size of HTTP responses with known content length",
+                               ("blueprint", "endpoint"),
+                               buckets=DEFAULT_SIZE_BUCKETS)
+worker_tasks = Counter("calibreweb_worker_tasks_total",
+                       "Number of finished background tasks",
+                       ("task", "status"))
+worker_task_duration = Histogram("calibreweb_worker_task_duration_seconds",
+                                 "Runtime of background tasks",
+                                 ("task",),
+                                 buckets=DEFAULT_TASK_BUCKETS)
+thumbnail_cache = Counter("calibreweb_thumbnail_cache_requests_total",
+                          "Thumbnail requests served from (hit) or bypassing (miss) the thumbnail cache",
+                          ("type", "result"))
+calibre_db_connections = Counter("calibreweb_calibre_db_connections_total",
+                                 "Number of opened connections to the Calibre database")
+calibre_db_sessions_active = Gauge("calibreweb_calibre_db_sessions_active",
+                                   "Number of currently open Calibre database sessions")
+kobo_sync_requests = Counter("calibreweb_kobo_sync_requests_total",
+                             "Number of Kobo library sync requests",
+                             ("result",))
@@ -26,9 +26,10 @@ try:
 except ImportError:
     import Queue as queue
 from datetime import datetime
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 
 from cps import logger
+from . import metrics
 
 log = logger.create()
 
@@ -40,8 +41,20 @@ STAT_FINISH_SUCCESS = 3
 STAT_ENDED = 4
 STAT_CANCELLED = 5
 
+# task 'status' names used for the exported metrics
+STAT_NAMES = {
+    STAT_WAITING: "waiting",
+    STAT_FAIL: "failed",
+    STAT_STARTED: "started",
+    STAT_FINISH_SUCCESS: "finished",
+    STAT_ENDED: "ended",
+    STAT_CANCELLED: "cancelled",
+}
+
 # Only retain this many tasks in dequeued list
 TASK_CLEANUP_TRIGGER = 20
+# Number of changed tasks remembered for clients asking for the changes since their last version
+TASK_CHANGE_HISTORY = 200
 
 QueuedTask = namedtuple('QueuedTask', 'num, user, added, task, hidden')
 
@@ -63,6 +76,48 @@ class ImprovedQueue(queue.Queue):
             return list(self.queue)
 
 
+class TaskChanges:
+    """Version of the task list, increased on every change of a task
+
+    The last change of each task is remembered, so clients only need the tasks changed since the version they know.
+    Versions are only valid together with the epoch of the running process.
+    """
+
+    def __init__(self, history=TASK_CHANGE_HISTORY):
+        self.epoch = uuid.uuid4().hex[:8]
+        self.version = 0
+        self._history = history
+        self._changes = OrderedDict()
+        # changes up to this version are no longer remembered
+        self._forgotten = 0
+        self._lock = threading.Lock()
+
+    def notify(self, task_id, removed=False):
+        with self._lock:
+            self.version += 1
+            self._changes.pop(task_id, None)
+            self._changes[task_id] = (self.version, removed)
+            while len(self._changes) > self._history:
+                __, (version, __) = self._changes.popitem(last=False)
+                self._forgotten = version
+
+    def since(self, version):
+        """Returns the ids of changed and removed tasks after version, None if these changes are no longer known"""
+        with self._lock:
+            if not self._forgotten <= version <= self.version:
+                return None
+            changed = set()
+            removed = set()
+            for task_id, (task_version, is_removed) in reversed(self._changes.items()):
+                if task_version <= version:
+                    break
+                (removed if is_removed else changed).add(task_id)
+            return changed, removed
+
+
+task_changes = TaskChanges()
+
+
 # Class for all worker tasks in the background
 class WorkerThread(threading.Thread):
     _instance = None
@@ -96,6 +151,7 @@ class WorkerThread(threading.Thread):
             task=task,
             hidden=hidden
         ))
+        task_changes.notify(task.id)
 
     @property
     def tasks(self):
@@ -118,6 +174,9 @@ class WorkerThread(threading.Thread):
                 # otherwise, loop off the oldest dead tasks until we hit the target trigger
                 ret = sorted(dead, key=lambda y: y.task.end_time)[-TASK_CLEANUP_TRIGGER:] + alive
 
+            for item in self.dequeued:
+                if item not in ret:
+                    task_changes.notify(item.task.id, removed=True)
             self.dequeued = sorted(ret, key=lambda y: y.num)
 
     # Main thread loop starting the different tasks
@@ -151,6 +210,7 @@ class WorkerThread(threading.Thread):
             # remove self_cleanup tasks and hidden "System Tasks" from list
             if item.task.self_cleanup or item.hidden:
                 self.dequeued.remove(item)
+                task_changes.notify(item.task.id, removed=True)
 
             self.queue.task_done()
 
@@ -202,6 +262,13 @@ class CalibreTask:
             log.exception(ex)
 
         self.end_time = datetime.now()
+        task_changes.notify(self.id)
+        self._record_metrics()
+
+    def _record_metrics(self):
+        task_class = self.__class__.__name__
+        metrics.worker_tasks.inc(task_class, STAT_NAMES.get(self.stat, "unknown"))
+        metrics.worker_task_duration.observe((self.end_time - self.start_time).total_seconds(), task_class)
 
     @property
     def stat(self):
@@ -210,6 +277,7 @@ class CalibreTask:
     @stat.setter
     def stat(self, x):
         self._stat = x
+        self._changed()
 
     @property
     def progress(self):
@@ -220,6 +288,7 @@ class CalibreTask:
         if not 0 <= x <= 1:
             raise ValueError("Task progress should within [0, 1] range")
         self._progress = x
+        self._changed()
 
     @property
     def error(self):
@@ -228,6 +297,21 @@ class CalibreTask:
     @error.setter
     def error(self, x):
         self._error = x
+        self._changed()
+
+    @property
+    def message(self):
+        return self._message
+
+    @message.setter
+    def message(self, x):
+        self._message = x
+        self._changed()
+
+    def _changed(self):
+        # called from __init__ before the task has an id, new tasks are announced by WorkerThread.add
+        if getattr(self, 'id', None) is not None:
+            task_changes.notify(self.id)
 
     @property
     def runtime(self):
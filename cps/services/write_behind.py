@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import atexit
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import exc
+
+from .. import logger
+
+log = logger.create()
+
+
+class WriteBehindQueue:
+    """Collects small writes and applies them in batched transactions from a background thread
+
+    Every write has a key, a value and a function apply(session, value). Writes with the same key are coalesced, the
+    last submitted value wins. A batch is either committed completely or kept in the queue and retried with the next
+    flush, pending writes are also flushed at exit.
+    """
+
+    def __init__(self, session_factory, interval=0.25, name="WriteBehindQueue"):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.name = name
+        self._pending = OrderedDict()
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._stopped = False
+        atexit.register(self.stop)
+
+    def submit(self, key, value, apply, sync=False):
+        """Queues a write, with sync=True all pending writes are committed before returning"""
+        with self._condition:
+            self._pending.pop(key, None)
+            self._pending[key] = (value, apply)
+            if not sync and not self._stopped:
+                self._start()
+                self._condition.notify()
+        if sync or self._stopped:
+            return self.flush()
+        return True
+
+    def get_pending(self, key, default=None):
+        """Returns the value of a not yet committed write, allows reading own writes before the flush"""
+        with self._condition:
+            entry = self._pending.get(key)
+        return entry[0] if entry is not None else default
+
+    def flush(self):
+        with self._flush_lock:
+            with self._condition:
+                batch = self._pending
+                self._pending = OrderedDict()
+            if not batch:
+                return True
+            session = None
+            try:
+                session = self.session_factory()
+                for value, apply in batch.values():
+                    apply(session, value)
+                session.commit()
+                log.debug("%s: %d writes committed", self.name, len(batch))
+                return True
+            except Exception as e:
+                if session is not None:
+                    session.rollback()
+                log.error("%s: batch of %d writes failed, retrying later: %s", self.name, len(batch), e)
+                with self._condition:
+                    # Newer writes for the same key have been submitted meanwhile and supersede the failed ones
+                    for key, entry in self._pending.items():
+                        batch.pop(key, None)
+                        batch[key] = entry
+                    self._pending = batch
+                return False
+            finally:
+                if session is not None:
+                    session.close()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self.flush()
+
+    def _start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+            # Give further writes the chance to join the batch
+            time.sleep(self.interval)
+            if not self.flush():
+                time.sleep(self.interval * 10)
@@ -27,16 +27,31 @@ from flask import Blueprint, flash, redirect, request, url_for, abort
 from flask_babel import gettext as _
 from .cw_login import current_user
 from sqlalchemy.exc import InvalidRequestError, OperationalError
-from sqlalchemy.sql.expression import func, true
+from sqlalchemy.sql.expression import func, true, case
 
 from . import calibre_db, config, db, logger, ub
 from .render_template import render_title_template
 from .usermanagement import login_required_if_no_ano, user_login_required
+from .kepub_preconvert import preconverter
 
 log = logger.create()
 
 shelf = Blueprint('shelf', __name__)
 
+# Sort orders of shelves besides the manual one, series are joined for sorting by author
+SHELF_ORDER = {
+    'pubnew': [db.Books.pubdate.desc()],
+    'pubold': [db.Books.pubdate],
+    'shelfnew': [ub.BookShelf.date_added.desc()],
+    'shelfold': [ub.BookShelf.date_added],
+    'abc': [db.Books.sort],
+    'zyx': [db.Books.sort.desc()],
+    'new': [db.Books.timestamp.desc()],
+    'old': [db.Books.timestamp],
+    'authaz': [db.Books.author_sort.asc(), db.Series.name, db.Books.series_index],
+    'authza': [db.Books.author_sort.desc(), db.Series.name.desc(), db.Books.series_index.desc()],
+}
+
 
 @shelf.route("/shelf/add/<int:shelf_id>/<int:book_id>", methods=["POST"])
 @user_login_required
@@ -92,6 +107,8 @@ def add_to_shelf(shelf_id, book_id):
             return redirect(request.environ["HTTP_REFERER"])
         else:
             return redirect(url_for('web.index'))
+    if shelf.kobo_sync:
+        preconverter.request_scan()
     if not xhr:
         log.debug("Book has been added to shelf: {}".format(shelf.name))
         flash(_("Book has been added to shelf: %(sname)s", sname=shelf.name), category="success")
@@ -117,25 +134,12 @@ def search_from_shelf(shelf_id):
         return redirect(url_for('web.index'))
 
     if current_user.id in ub.searched_ids and ub.searched_ids[current_user.id]:
-        books_from_shelf = list()
-        books_in_shelf = ub.session.query(ub.BookShelf).filter(ub.BookShelf.shelf == shelf_id).all()
-        if books_in_shelf:
-            book_ids = [book_id.book_id for book_id in books_in_shelf]
-            for searchid in ub.searched_ids[current_user.id]:
-                if searchid in book_ids:
-                    books_from_shelf.append(searchid)
-        else:
+        if not ub.session.query(ub.BookShelf.id).filter(ub.BookShelf.shelf == shelf_id).first():
             log.error("No Books are part of {}".format(shelf.name))
             flash(_("No Books are part of the shelf: %(name)s", name=shelf.name), category="error")
             return redirect(url_for('web.index'))
-
-        # maxOrder = ub.session.query(func.max(ub.BookShelf.order)).filter(ub.BookShelf.shelf == shelf_id).first()[0] or 0
-
-        for book in books_from_shelf:
-            ub.session.delete(ub.session.query(ub.BookShelf).filter(ub.BookShelf.shelf == shelf_id).filter(
-                ub.BookShelf.book_id == book).first())
-        shelf.last_modified = datetime.now(timezone.utc)
         try:
+            ub.remove_books_from_shelf(shelf, ub.searched_ids[current_user.id])
             ub.session.commit()
             flash(_("Books have been removed from shelf: %(sname)s", sname=shelf.name), category="success")
         except (OperationalError, InvalidRequestError) as e:
@@ -163,30 +167,15 @@ def search_to_shelf(shelf_id):
         return redirect(url_for('web.index'))
 
     if current_user.id in ub.searched_ids and ub.searched_ids[current_user.id]:
-        books_for_shelf = list()
-        books_in_shelf = ub.session.query(ub.BookShelf).filter(ub.BookShelf.shelf == shelf_id).all()
-        if books_in_shelf:
-            book_ids = [book_id.book_id for book_id in books_in_shelf]
-            for searchid in ub.searched_ids[current_user.id]:
-                if searchid not in book_ids:
-                    books_for_shelf.append(searchid)
-        else:
-            books_for_shelf = ub.searched_ids[current_user.id]
-
-        if not books_for_shelf:
-            log.error("Books are already part of {}".format(shelf.name))
-            flash(_("Books are already part of the shelf: %(name)s", name=shelf.name), category="error")
-            return redirect(url_for('web.index'))
-
-        maxOrder = ub.session.query(func.max(ub.BookShelf.order)).filter(ub.BookShelf.shelf == shelf_id).first()[0] or 0
-
-        for book in books_for_shelf:
-            maxOrder += 1
-            shelf.books.append(ub.BookShelf(shelf=shelf.id, book_id=book, order=maxOrder))
-        shelf.last_modified = datetime.now(timezone.utc)
         try:
-            ub.session.merge(shelf)
+            if not ub.add_books_to_shelf(shelf, ub.searched_ids[current_user.id]):
+                ub.session.rollback()
+                log.error("Books are already part of {}".format(shelf.name))
+                flash(_("Books are already part of the shelf: %(name)s", name=shelf.name), category="error")
+                return redirect(url_for('web.index'))
             ub.session.commit()
+            if shelf.kobo_sync:
+                preconverter.request_scan()
             flash(_("Books have been added to shelf: %(sname)s", sname=shelf.name), category="success")
         except (OperationalError, InvalidRequestError) as e:
             ub.session.rollback()
@@ -391,6 +380,8 @@ def create_edit_shelf(shelf, page_title, page, shelf_id=False):
                 flash_text = _("Shelf %(title)s changed", title=shelf_title)
             try:
                 ub.session.commit()
+                if shelf.kobo_sync:
+                    preconverter.request_scan()
                 log.info("Shelf {} {}".format(shelf_title, shelf_action))
                 flash(flash_text, category="success")
                 return redirect(url_for('shelf.show_shelf', shelf_id=shelf.id))
@@ -452,14 +443,22 @@ def delete_shelf_helper(cur_shelf):
 
 
 def change_shelf_order(shelf_id, order):
-    result = calibre_db.session.query(db.Books).outerjoin(db.books_series_link,
-                                                          db.Books.id == db.books_series_link.c.book)\
-        .outerjoin(db.Series).join(ub.BookShelf, ub.BookShelf.book_id == db.Books.id) \
+    """Stores the given sort order as order of the shelf entries (used e.g. by OPDS), only changed entries are
+    written with one bulk update"""
+    entries = calibre_db.session.query(ub.BookShelf.id, ub.BookShelf.order) \
+        .join(db.Books, ub.BookShelf.book_id == db.Books.id) \
+        .outerjoin(db.books_series_link, db.Books.id == db.books_series_link.c.book) \
+        .outerjoin(db.Series) \
         .filter(ub.BookShelf.shelf == shelf_id).order_by(*order).all()
-    for index, entry in enumerate(result):
-        book = ub.session.query(ub.BookShelf).filter(ub.BookShelf.shelf == shelf_id) \
-            .filter(ub.BookShelf.book_id == entry.id).first()
-        book.order = index
+    changed = [(entry_id, index) for index, (entry_id, stored) in enumerate(entries) if stored != index]
+    if not changed:
+        return
+    # chunks keep the number of sql variables below the limit of older sqlite versions
+    for start in range(0, len(changed), 300):
+        new_order = dict(changed[start:start + 300])
+        ub.session.query(ub.BookShelf).filter(ub.BookShelf.id.in_(list(new_order))) \
+            .update({ub.BookShelf.order: case(new_order, value=ub.BookShelf.id)}, synchronize_session=False)
+    ub.mark_shelves_changed()
     ub.session_commit("Shelf-id:{} - Order changed".format(shelf_id))
 
 
@@ -468,34 +467,17 @@ def render_show_shelf(shelf_type, shelf_id, page_no, sort_param):
     status = current_user.get_view_property("shelf", 'man')
     # check user is allowed to access shelf
     if shelf and check_shelf_view_permissions(shelf):
+        order = [ub.BookShelf.order.asc()]
         if shelf_type == 1:
             if status != 'on':
                 if sort_param == 'stored':
                     sort_param = current_user.get_view_property("shelf", 'stored')
                 else:
                     current_user.set_view_property("shelf", 'stored', sort_param)
-                if sort_param == 'pubnew':
-                    change_shelf_order(shelf_id, [db.Books.pubdate.desc()])
-                if sort_param == 'pubold':
-                    change_shelf_order(shelf_id, [db.Books.pubdate])
-                if sort_param == 'shelfnew':
-                    change_shelf_order(shelf_id, [ub.BookShelf.date_added.desc()])
-                if sort_param == 'shelfold':
-                    change_shelf_order(shelf_id, [ub.BookShelf.date_added])
-                if sort_param == 'abc':
-                    change_shelf_order(shelf_id, [db.Books.sort])
-                if sort_param == 'zyx':
-                    change_shelf_order(shelf_id, [db.Books.sort.desc()])
-                if sort_param == 'new':
-                    change_shelf_order(shelf_id, [db.Books.timestamp.desc()])
-                if sort_param == 'old':
-                    change_shelf_order(shelf_id, [db.Books.timestamp])
-                if sort_param == 'authaz':
-                    change_shelf_order(shelf_id, [db.Books.author_sort.asc(), db.Series.name, db.Books.series_index])
-                if sort_param == 'authza':
-                    change_shelf_order(shelf_id, [db.Books.author_sort.desc(),
-                                                  db.Series.name.desc(),
-                                                  db.Books.series_index.desc()])
+                if sort_param in SHELF_ORDER:
+                    # the page is sorted by the query, the stored order is only updated if it differs
+                    order = SHELF_ORDER[sort_param] + order
+                    change_shelf_order(shelf_id, SHELF_ORDER[sort_param])
             page = "shelf.html"
             pagesize = 0
         else:
@@ -505,23 +487,12 @@ def render_show_shelf(shelf_type, shelf_id, page_no, sort_param):
         result, __, pagination = calibre_db.fill_indexpage(page_no, pagesize,
                                                            db.Books,
                                                            ub.BookShelf.shelf == shelf_id,
-                                                           [ub.BookShelf.order.asc()],
+                                                           order,
                                                            True, config.config_read_column,
+                                                           db.books_series_link,
+                                                           db.books_series_link.c.book == db.Books.id,
+                                                           db.Series,
                                                            ub.BookShelf, ub.BookShelf.book_id == db.Books.id)
-        # delete shelf entries where book is not existent anymore, can happen if book is deleted outside calibre-web
-        wrong_entries = calibre_db.session.query(ub.BookShelf) \
-            .join(db.Books, ub.BookShelf.book_id == db.Books.id, isouter=True) \
-            .filter(db.Books.id == None).all()
-        for entry in wrong_entries:
-            log.info('Not existing book {} in {} deleted'.format(entry.book_id, shelf))
-            try:
-                ub.session.query(ub.BookShelf).filter(ub.BookShelf.book_id == entry.book_id).delete()
-                ub.session.commit()
-            except (OperationalError, InvalidRequestError) as e:
-                ub.session.rollback()
-                log.error_or_exception("Settings Database error: {}".format(e))
-                flash(_("Oops! Database Error: %(error)s.", error=e.orig), category="error")
-
         return render_title_template(page,
                                      entries=result,
                                      pagination=pagination,
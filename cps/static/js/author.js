@@ -0,0 +1,52 @@
+/* This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+ *    Copyright (C) 2026 OzzieIsaacs
+ *
+ *  This program is free software: you can redistribute it and/or modify
+ *  it under the terms of the GNU General Public License as published by
+ *  the Free Software Foundation, either version 3 of the License, or
+ *  (at your option) any later version.
+ *
+ *  This program is distributed in the hope that it will be useful,
+ *  but WITHOUT ANY WARRANTY; without even the implied warranty of
+ *  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ *  GNU General Public License for more details.
+ *
+ *  You should have received a copy of the GNU General Public License
+ *  along with this program. If not, see <http://www.gnu.org/licenses/>.
+ */
+
+// Loads the Goodreads information of the author after the page is shown, the server answers with 202 as long as
+// the information is still fetched in the background
+$(function() {
+    var placeholder = $("#author-goodreads-bio");
+    if (!placeholder.length) {
+        return;
+    }
+    var retries = 15;
+
+    function loadPanel() {
+        $.ajax({
+            method: "get",
+            url: placeholder.data("url"),
+            dataType: "html",
+            success: function(data, textStatus, xhr) {
+                if (xhr.status === 202 && retries-- > 0) {
+                    window.setTimeout(loadPanel, 2000);
+                    return;
+                }
+                if (xhr.status !== 200) {
+                    return;
+                }
+                var panel = $("<div>").html(data);
+                $("#author-goodreads-books").replaceWith(panel.children(".discover"));
+                placeholder.replaceWith(panel.children());
+                $("#author-in-library").removeClass("hidden");
+                var photo = $(".author-bio img").attr("src");
+                if (photo) {
+                    $("img.bg-blur").attr("src", photo);
+                }
+            }
+        });
+    }
+    loadPanel();
+});
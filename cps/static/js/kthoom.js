@@ -63,6 +63,11 @@ var imageFiles = [];
 var imageFilenames = [];
 var totalImages = 0;
 var prevScrollPosition = 0;
+// Set if the server delivers single pages, otherwise the whole archive is unpacked in the browser
+var pageService = null;
+// Pages loaded ahead of the current page
+var PREFETCH_PAGES = 3;
+var THUMBNAIL_WIDTH = 200;
 
 var settings = {
     hflip: false,
@@ -260,6 +265,50 @@ function loadFromArrayBuffer(ab) {
     });
 }
 
+function pageServiceUrl(page, width) {
+    return pageService.url + "/page/" + page + "?v=" + encodeURIComponent(pageService.version) +
+        (width ? "&width=" + width : "");
+}
+
+function loadFromPageService(pagesUrl, fallback) {
+    $.getJSON(pagesUrl).done(function(data) {
+        // the longer screen side covers rotated pages as well
+        var width = Math.round(Math.max(screen.width, screen.height) * (window.devicePixelRatio || 1));
+        pageService = {url: pagesUrl.replace(/\/pages$/, ""), version: data.version, loaded: []};
+        totalImages = data.pages.length;
+        data.pages.forEach(function(name, i) {
+            imageFilenames.push(name);
+            imageFiles.push({filename: name, dataURI: pageServiceUrl(i, width)});
+            $("#thumbnails").append(
+                "<li>" +
+                "<a data-page='" + (i + 1) + "'>" +
+                "<img loading='lazy' src='" + pageServiceUrl(i, THUMBNAIL_WIDTH) + "'/>" +
+                "<span>" + (i + 1) + "</span>" +
+                "</a>" +
+                "</li>"
+            );
+            drawCanvas(i + 1);
+        });
+        updateProgress(100);
+        updateDirectionButtons();
+        updatePage();
+    }).fail(fallback);
+}
+
+// Loads the current page and the next few pages into their canvas
+function loadPages() {
+    if (pageService === null) {
+        return;
+    }
+    var last = Math.min(imageFiles.length, currentImage + 1 + PREFETCH_PAGES);
+    for (var i = Math.max(currentImage, 0); i < last; i++) {
+        if (!pageService.loaded[i]) {
+            pageService.loaded[i] = true;
+            setImage(imageFiles[i].dataURI, $(".mainImage")[i]);
+        }
+    }
+}
+
 function scrollTocToActive() {
     $(".page").text((currentImage + 1 ) + "/" + totalImages);
 
@@ -279,6 +328,7 @@ function scrollTocToActive() {
 }
 
 function updatePage() {
+    loadPages();
     scrollTocToActive();
     scrollCurrentImageIntoView();
     updateProgress();
@@ -375,7 +425,7 @@ function setImage(url, _canvas) {
                     $("#mainText").innerHTML("<iframe style=\"width:100%;height:700px;border:0\" src=\"data:text/html," + escape(xhr.responseText) + "\"></iframe>");
                 };
                 xhr.send(null);
-            } else if (!/(jpg|jpeg|png|gif|webp)$/.test(imageFiles[currentImage].filename) && imageFiles[currentImage].data.uncompressedSize < 10 * 1024) {
+            } else if (!/(jpg|jpeg|png|gif|webp)$/.test(imageFiles[currentImage].filename) && imageFiles[currentImage].data && imageFiles[currentImage].data.uncompressedSize < 10 * 1024) {
                 xhr.open("GET", url, true);
                 xhr.onload = function() {
                     $("#mainText").css("display", "");
@@ -423,6 +473,9 @@ function setImage(url, _canvas) {
 // reloadImages is a slow process when multiple images are involved. Only used when rotating/mirroring
 function reloadImages() {
     for(i=0; i < imageFiles.length; i++) {
+        if (pageService !== null && !pageService.loaded[i]) {
+            continue;
+        }
         setImage(imageFiles[i].dataURI, $(".mainImage")[i]);
     }
 }
@@ -612,7 +665,7 @@ function keyHandler(evt) {
     }
 }
 
-function drawCanvas() {
+function drawCanvas(pageNumber) {
     var maxheight = innerHeight - 50;
     var canvasElement = $("<canvas></canvas>");
     var x = canvasElement[0].getContext("2d");
@@ -644,7 +697,7 @@ function drawCanvas() {
     x.textAlign = "center";
     x.font = "24px sans-serif";
     x.strokeStyle = (settings.theme === "dark") ? "white" : "black";
-    x.fillText("Loading Page #" + (currentImage + 1), innerWidth / 2, 100);
+    x.fillText("Loading Page #" + (pageNumber || currentImage + 1), innerWidth / 2, 100);
 
     $("#mainContent").append(canvasElement);
 }
@@ -659,7 +712,7 @@ function updateArrows() {
     }
 };
 
-function init(filename) {
+function loadArchive(filename) {
     var request = new XMLHttpRequest();
     request.open("GET", filename);
     request.responseType = "arraybuffer";
@@ -670,10 +723,21 @@ function init(filename) {
             console.warn(request.statusText, request.responseText);
         }
     });
+    request.send();
+}
+
+// pagesUrl: optional url of the page service, the whole archive is loaded if the server can't deliver single pages
+function init(filename, pagesUrl) {
     kthoom.loadSettings();
     setTheme();
     updateScale();
-    request.send();
+    if (pagesUrl) {
+        loadFromPageService(pagesUrl, function () {
+            loadArchive(filename);
+        });
+    } else {
+        loadArchive(filename);
+    }
     initProgressClick();
     document.body.className += /AppleWebKit/.test(navigator.userAgent) ? " webkit" : "";
 
@@ -818,6 +882,7 @@ function init(filename) {
                         currentImage = imageFiles.length - 1;
                     }
                     console.log(currentImage);
+                    loadPages();
                     scrollTocToActive();
                     updateProgress();
                 }
@@ -828,6 +893,7 @@ function init(filename) {
                 if (currentImageOffset(currentImage - 1) >= 0) {
                     currentImage = Math.floor((imageFiles.length) / (viewLength-viewLength/(imageFiles.length)) * scroll, 0);
                     console.log(currentImage);
+                    loadPages();
                     scrollTocToActive();
                     updateProgress();
                 }
@@ -26,17 +26,43 @@ $(function() {
         striped: true
     });
     if ($('#tasktable').length) {
-        setInterval(function () {
-            $.ajax({
-                method: "get",
-                url: getPath() + "/ajax/emailstat",
-                async: true,
-                timeout: 900,
-                success: function (data) {
-                    $('#tasktable').bootstrapTable("load", data);
+        if (window.EventSource) {
+            // the server only sends the tasks changed since the last received event
+            var taskRows = [];
+            var taskStream = new EventSource(getPath() + "/ajax/taskstream");
+            taskStream.onmessage = function (e) {
+                var data = JSON.parse(e.data);
+                if (data.full) {
+                    taskRows = [];
                 }
-            });
-        }, 1000);
+                taskRows = taskRows.filter(function (row) {
+                    return data.removed.indexOf(row.task_id) < 0;
+                });
+                data.tasks.forEach(function (task) {
+                    var index = taskRows.findIndex(function (row) {
+                        return row.task_id === task.task_id;
+                    });
+                    if (index < 0) {
+                        taskRows.push(task);
+                    } else {
+                        taskRows[index] = task;
+                    }
+                });
+                $('#tasktable').bootstrapTable("load", taskRows);
+            };
+        } else {
+            setInterval(function () {
+                $.ajax({
+                    method: "get",
+                    url: getPath() + "/ajax/emailstat",
+                    async: true,
+                    timeout: 900,
+                    success: function (data) {
+                        $('#tasktable').bootstrapTable("load", data);
+                    }
+                });
+            }, 1000);
+        }
     }
 
     $("#cancel_task_confirm").click(function() {
@@ -847,7 +873,7 @@ $(function() {
 
     $("#user-table").bootstrapTable({
         sidePagination: "server",
-        queryParams: queryParams,
+        queryParams: userQueryParams,
         pagination: true,
         paginationLoop: false,
         paginationDetailHAlign: " hidden",
@@ -861,7 +887,7 @@ $(function() {
         searchOnEnterKey: true,
         checkboxHeader: true,
         maintainMetaData: true,
-        responseHandler: responseHandler,
+        responseHandler: userResponseHandler,
         columns: user_column,
         onPostBody () {
             // Remove all checkboxes from Headers for showing the texts in the column selector
@@ -1010,6 +1036,14 @@ function responseHandler(res) {
     return res;
 }
 
+// Position of the next page of the user table, the server only uses it if sorting and search didn't change
+var userCursor = null;
+
+function userResponseHandler(res) {
+    userCursor = res.cursor;
+    return responseHandler(res);
+}
+
 function singleUserFormatter(value, row) {
     return '<a class="btn btn-default" onclick="storeLocation()" href="' + window.location.pathname + '/../../admin/user/' + row.id + '">' + this.buttontext + '</a>'
 }
@@ -1316,6 +1350,15 @@ function queryParams(params)
     return params;
 }
 
+function userQueryParams(params)
+{
+    params = queryParams(params);
+    if (userCursor) {
+        params.cursor = userCursor;
+    }
+    return params;
+}
+
 function storeLocation() {
     window.sessionStorage.setItem("back", window.location.pathname);
 }
@@ -19,9 +19,11 @@
 import sys
 import os
 import subprocess
+import shutil
 import re
 
-def process_open(command, quotes=(), env=None, sout=subprocess.PIPE, serr=subprocess.PIPE, newlines=True):
+def process_open(command, quotes=(), env=None, sout=subprocess.PIPE, serr=subprocess.PIPE, newlines=True,
+                 low_priority=False):
     # linux py3.x no encode and as list without quotes no empty element for parameters
     # windows py 3.x no encode and as string with quotes empty element for parameters is okay
     # separate handling for windows and linux
@@ -32,6 +34,8 @@ def process_open(command, quotes=(), env=None, sout=subprocess.PIPE, serr=subpro
         exc_command = " ".join(command)
     else:
         exc_command = [x for x in command]
+        if low_priority and shutil.which('nice'):
+            exc_command = ['nice', '-n', '10'] + exc_command
 
     return subprocess.Popen(exc_command, shell=False, stdout=sout, stderr=serr, universal_newlines=newlines, env=env) # nosec
 
@@ -19,9 +19,10 @@
 import datetime
 
 from flask_babel import lazy_gettext as N_
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.sql.expression import or_
 
-from cps import logger, file_helper, ub
+from cps import app, config, db, logger, file_helper, ub
 from cps.services.worker import CalibreTask
 
 
@@ -62,3 +63,49 @@ class TaskClean(CalibreTask):
     @property
     def is_cancellable(self):
         return False
+
+
+class TaskCleanShelves(CalibreTask):
+    """Removes shelf entries of books which don't exist anymore, e.g. deleted with Calibre desktop"""
+    def __init__(self, task_message=N_('Delete shelf entries of deleted books')):
+        super(TaskCleanShelves, self).__init__(task_message)
+        self.log = logger.create()
+
+    def run(self, worker_thread):
+        if not config.db_configured:
+            self._handleSuccess()
+            return
+        with app.app_context():
+            calibre_db = db.CalibreDB(app)
+            try:
+                orphans = [book_id for book_id, in calibre_db.session.query(ub.BookShelf.book_id)
+                           .outerjoin(db.Books, ub.BookShelf.book_id == db.Books.id)
+                           .filter(db.Books.id == None).distinct()]
+            except SQLAlchemyError as ex:
+                self._handleError('Error reading shelf entries: ' + str(ex))
+                return
+            finally:
+                calibre_db.session.close()
+        if orphans:
+            app_db_session = ub.get_new_session_instance()
+            try:
+                for start in range(0, len(orphans), 500):
+                    app_db_session.query(ub.BookShelf).filter(ub.BookShelf.book_id.in_(orphans[start:start + 500]))\
+                        .delete(synchronize_session=False)
+                app_db_session.commit()
+                self.log.info("Deleted shelf entries of {} not existing books".format(len(orphans)))
+            except SQLAlchemyError as ex:
+                app_db_session.rollback()
+                self._handleError('Error deleting shelf entries: ' + str(ex))
+                return
+            finally:
+                app_db_session.remove()
+        self._handleSuccess()
+
+    @property
+    def name(self):
+        return "Clean up shelves"
+
+    @property
+    def is_cancellable(self):
+        return False
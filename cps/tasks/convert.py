@@ -19,6 +19,9 @@
 import os
 import re
 import glob
+import hashlib
+import threading
+from collections import namedtuple
 from shutil import copyfile, copyfileobj
 from markupsafe import escape
 from time import time
@@ -27,7 +30,7 @@ from uuid import uuid4
 from sqlalchemy.exc import SQLAlchemyError
 from flask_babel import lazy_gettext as N_
 
-from cps.services.worker import CalibreTask
+from cps.services.worker import CalibreTask, WorkerThread
 from cps import db, app
 from cps import logger, config
 from cps.subproc_wrapper import process_open
@@ -38,7 +41,8 @@ from cps.file_helper import get_temp_dir
 from cps.binary_helper import resolve_binary_path, SUPPORTED_KEPUBIFY_BINARIES
 
 from cps.tasks.mail import TaskEmail
-from cps import gdriveutils, helper
+from cps import gdriveutils
+from cps.embed_helper import do_calibre_export
 from cps.constants import SUPPORTED_CALIBRE_BINARIES
 from cps.string_helper import strip_whitespaces
 
@@ -46,9 +50,59 @@ log = logger.create()
 
 current_milli_time = lambda: int(round(time() * 1000))
 
+ConversionResult = namedtuple('ConversionResult', ['path', 'filename', 'title'])
+
+# Conversions which are waiting or running, identical requests attach to them instead of converting again
+_in_flight = dict()
+_in_flight_lock = threading.Lock()
+
+
+def conversion_key(book_id, last_modified, old_book_format, new_book_format):
+    """Identifies a conversion, the hash covers all settings which have an influence on the converted file"""
+    options = "|".join(str(option) for option in (config.config_converterpath,
+                                                   config.config_calibre,
+                                                   config.config_kepubifypath,
+                                                   config.config_embed_metadata,
+                                                   config.config_binariesdir))
+    return (book_id, old_book_format.upper(), new_book_format.upper(), last_modified,
+            hashlib.sha1(options.encode('utf-8')).hexdigest())
+
+
+def add_conversion(user, task, queue_task=True):
+    """Queues the conversion task, or hands its requester over to an identical conversion already queued
+
+    With queue_task=False the task is only registered and has to be started by the caller. Returns the task which
+    is going to do the conversion
+    """
+    with _in_flight_lock:
+        queued = _in_flight.get(task.key)
+        if queued:
+            queued.requesters.extend(task.requesters)
+            log.info("Book id %d: conversion %s -> %s already queued, attaching request",
+                     task.book_id, task.settings['old_book_format'], task.settings['new_book_format'])
+            return queued
+        if task.key:
+            _in_flight[task.key] = task
+    if queue_task:
+        WorkerThread.add(user, task)
+    return task
+
+
+def send_converted_book(user, result, settings, ereader_mail, book_id):
+    email_text = N_(u"%(book)s send to E-Reader", book=escape(result.title))
+    WorkerThread.add(user, TaskEmail(settings['subject'],
+                                     result.path,
+                                     result.filename,
+                                     settings,
+                                     ereader_mail,
+                                     email_text,
+                                     settings['body'],
+                                     id=book_id,
+                                     internal=True))
+
 
 class TaskConvert(CalibreTask):
-    def __init__(self, file_path, book_id, task_message, settings, ereader_mail, user=None):
+    def __init__(self, file_path, book_id, task_message, settings, ereader_mail, user=None, key=None):
         super(TaskConvert, self).__init__(task_message)
         self.worker_thread = None
         self.file_path = file_path
@@ -57,13 +111,40 @@ class TaskConvert(CalibreTask):
         self.settings = settings
         self.ereader_mail = ereader_mail
         self.user = user
+        self.key = key
+        # run the converter with lowered cpu priority
+        self.low_priority = False
+        # everyone waiting for the converted book to be sent to an e-reader: (user, settings, ereader_mail)
+        self.requesters = [(user, settings, ereader_mail)] if ereader_mail else []
 
         self.results = dict()
 
     def run(self, worker_thread):
+        self.worker_thread = worker_thread
+        filename = None
+        try:
+            filename = self._run_conversion()
+        finally:
+            requesters = self._release()
+        if filename:
+            for user, settings, ereader_mail in requesters:
+                # todo: figure out how to incorporate this into the progress
+                try:
+                    send_converted_book(user, ConversionResult(self.results["path"], filename, self.title),
+                                        settings, ereader_mail, self.book_id)
+                except Exception as ex:
+                    return self._handleError(str(ex))
+
+    def _release(self):
+        """Ends accepting further requesters, returns all requesters of this conversion"""
+        with _in_flight_lock:
+            if self.key and _in_flight.get(self.key) is self:
+                del _in_flight[self.key]
+            return list(self.requesters)
+
+    def _run_conversion(self):
         df_cover = None
         cur_book = None
-        self.worker_thread = worker_thread
         if config.config_use_google_drive:
             with app.app_context():
                 worker_db = db.CalibreDB(app)
@@ -101,30 +182,11 @@ class TaskConvert(CalibreTask):
             if df_cover:
                 os.remove(os.path.join(config.config_calibre_dir, cur_book.path, "cover.jpg"))
 
-        if filename:
-            if config.config_use_google_drive:
-                # Upload files to gdrive
-                gdriveutils.updateGdriveCalibreFromLocal()
-                self._handleSuccess()
-            if self.ereader_mail:
-                # if we're sending to E-Reader after converting, create a one-off task and run it immediately
-                # todo: figure out how to incorporate this into the progress
-                try:
-                    EmailText = N_(u"%(book)s send to E-Reader", book=escape(self.title))
-                    for email in self.ereader_mail.split(','):
-                        email = strip_whitespaces(email)
-                        worker_thread.add(self.user, TaskEmail(self.settings['subject'],
-                                                               self.results["path"],
-                                                               filename,
-                                                               self.settings,
-                                                               email,
-                                                               EmailText,
-                                                               self.settings['body'],
-                                                               id=self.book_id,
-                                                               internal=True)
-                                          )
-                except Exception as ex:
-                    return self._handleError(str(ex))
+        if filename and config.config_use_google_drive:
+            # Upload files to gdrive
+            gdriveutils.updateGdriveCalibreFromLocal()
+            self._handleSuccess()
+        return filename
 
     def _convert_ebook_format(self):
         error_message = None
@@ -223,7 +285,7 @@ class TaskConvert(CalibreTask):
 
     def _convert_kepubify(self, file_path, format_old_ext, format_new_ext, kepubify_binary):
         if config.config_embed_metadata and config.config_binariesdir:
-            tmp_dir, temp_file_name = helper.do_calibre_export(self.book_id, format_old_ext[1:])
+            tmp_dir, temp_file_name = do_calibre_export(self.book_id, format_old_ext[1:])
             filename = os.path.join(tmp_dir, temp_file_name + format_old_ext)
             temp_file_path = tmp_dir
         else:
@@ -232,7 +294,7 @@ class TaskConvert(CalibreTask):
         quotes = [1, 3]
         command = [kepubify_binary, filename, '-o', temp_file_path, '-i']
         try:
-            p = process_open(command, quotes)
+            p = process_open(command, quotes, low_priority=self.low_priority)
         except OSError as e:
             return 1, N_("Kepubify-converter failed: %(error)s", error=e)
         self.progress = 0.01
@@ -317,7 +379,7 @@ class TaskConvert(CalibreTask):
                             command.append(parsed)
                             quotes.append(quotes_index)
                             quotes_index += 1
-            p = process_open(command, quotes, newlines=False)
+            p = process_open(command, quotes, newlines=False, low_priority=self.low_priority)
         except OSError as e:
             return 1, N_("Ebook-converter failed: %(error)s", error=e)
 
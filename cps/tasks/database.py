@@ -18,7 +18,8 @@
 
 from flask_babel import lazy_gettext as N_
 
-from cps import config, logger, db, ub, app
+from cps import logger
+from cps.library_watcher import watcher
 from cps.services.worker import CalibreTask
 
 
@@ -29,10 +30,10 @@ class TaskReconnectDatabase(CalibreTask):
         # self.calibre_db = db.CalibreDB(expire_on_commit=False, init=True)
 
     def run(self, worker_thread):
-        with app.app_context():
-            calibre_db = db.CalibreDB(app)
-            calibre_db.reconnect_db(config, ub.app_DB_path)
-        # self.calibre_db.session.close()
+        # the database is only reconnected if another program changed metadata.db
+        watcher.check()
+        if not watcher.reconnect_if_changed():
+            self.log.debug("Calibre database unchanged, no reconnect needed")
         self._handleSuccess()
 
     @property
@@ -17,21 +17,24 @@
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import re
+import base64
 import smtplib
 import ssl
 import threading
 import socket
 import mimetypes
+import time
+from uuid import uuid4
 
 try:
     import certifi
 except ImportError:  # pragma: no cover
     certifi = None
 
-from io import StringIO
 from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
 from email.utils import formatdate, parseaddr, make_msgid
-from email.generator import Generator
 from flask_babel import lazy_gettext as N_
 
 from cps.services.worker import CalibreTask
@@ -44,7 +47,11 @@ from cps.string_helper import strip_whitespaces
 
 log = logger.create()
 
-CHUNKSIZE = 8192
+# 57 bytes are encoded to one base64 line of 76 characters
+CHUNKSIZE = 57 * 1024
+BASE64_LINE = 76
+# Idle SMTP connections are kept open this long for following mail tasks to the same server
+SMTP_KEEPALIVE = 30
 
 
 # Class for sending email with ability to get current progress
@@ -53,53 +60,120 @@ class EmailBase:
     transferSize = 0
     progress = 0
 
-    def data(self, msg):
-        self.transferSize = len(msg)
-        (code, resp) = smtplib.SMTP.data(self, msg)
-        self.progress = 0
-        return (code, resp)
-
     def send(self, strg):
         """Send 'strg' to the server."""
         log.debug_no_auth('send: {}'.format(strg[:300]), stacklevel=2)
         if hasattr(self, 'sock') and self.sock:
             try:
-                if self.transferSize:
-                    lock = threading.Lock()
-                    lock.acquire()
-                    self.transferSize = len(strg)
-                    lock.release()
-                    for i in range(0, self.transferSize, CHUNKSIZE):
-                        if isinstance(strg, bytes):
-                            self.sock.send((strg[i:i + CHUNKSIZE]))
-                        else:
-                            self.sock.send((strg[i:i + CHUNKSIZE]).encode('utf-8'))
-                        lock.acquire()
-                        self.progress = i
-                        lock.release()
-                else:
-                    self.sock.sendall(strg.encode('utf-8'))
+                self.sock.sendall(strg if isinstance(strg, bytes) else strg.encode('utf-8'))
             except socket.error:
                 self.close()
                 raise smtplib.SMTPServerDisconnected('Server not connected')
         else:
             raise smtplib.SMTPServerDisconnected('please run connect() first')
 
+    def send_message_stream(self, from_addr, recipients, size, chunks):
+        """Sends a message given as chunks in SMTP wire format (CRLF line endings, dot-stuffed) without joining it
+
+        Returns a dict of refused recipients like smtplib.SMTP.sendmail"""
+        self.ehlo_or_helo_if_needed()
+        (code, resp) = self.mail(from_addr)
+        if code != 250:
+            self._rset()
+            raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+        refused = dict()
+        for recipient in recipients:
+            (code, resp) = self.rcpt(recipient)
+            if code not in (250, 251):
+                refused[recipient] = (code, resp)
+        if len(refused) == len(recipients):
+            self._rset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+        (code, resp) = self.docmd("data")
+        if code != 354:
+            self._rset()
+            raise smtplib.SMTPDataError(code, resp)
+        self.transferSize = size
+        self.progress = 0
+        try:
+            for chunk in chunks:
+                self.sock.sendall(chunk)
+                self.progress += len(chunk)
+            self.sock.sendall(b"." + smtplib.bCRLF)
+        except socket.error:
+            self.close()
+            raise smtplib.SMTPServerDisconnected('Server not connected')
+        (code, resp) = self.getreply()
+        if code != 250:
+            self._rset()
+            raise smtplib.SMTPDataError(code, resp)
+        return refused
+
     @classmethod
     def _print_debug(cls, *args):
         log.debug(args)
 
     def getTransferStatus(self):
         if self.transferSize:
-            lock2 = threading.Lock()
-            lock2.acquire()
-            value = int((float(self.progress) / float(self.transferSize))*100)
-            lock2.release()
-            return value / 100
+            return min(int((float(self.progress) / float(self.transferSize)) * 100), 100) / 100
         else:
             return 1
 
 
+class SMTPConnectionPool:
+    """Keeps the connection of a finished mail task open for a short time
+
+    Mail tasks are processed one after another by the worker thread, consecutive tasks for the same server reuse the
+    connection instead of connecting, negotiating TLS and logging in again."""
+
+    def __init__(self, keepalive=SMTP_KEEPALIVE):
+        self.keepalive = keepalive
+        self._connections = dict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            connection, released = self._connections.pop(key, (None, 0))
+        if connection is None:
+            return None
+        if time.monotonic() - released < self.keepalive:
+            try:
+                if connection.noop()[0] == 250:
+                    return connection
+            except (smtplib.SMTPException, socket.error):
+                pass
+        self._close(connection)
+        return None
+
+    def put(self, key, connection):
+        with self._lock:
+            previous = self._connections.pop(key, (None, 0))[0]
+            self._connections[key] = (connection, time.monotonic())
+        if previous is not None:
+            self._close(previous)
+        timer = threading.Timer(self.keepalive, self.close_expired)
+        timer.daemon = True
+        timer.start()
+
+    def close_expired(self):
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (__, released) in self._connections.items() if now - released >= self.keepalive]
+            connections = [self._connections.pop(key)[0] for key in expired]
+        for connection in connections:
+            self._close(connection)
+
+    @staticmethod
+    def _close(connection):
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, socket.error):
+            connection.close()
+
+
+smtp_pool = SMTPConnectionPool()
+
+
 # Class for sending email with ability to get current progress, derived from emailbase class
 class Email(EmailBase, smtplib.SMTP):
 
@@ -121,7 +195,11 @@ class TaskEmail(CalibreTask):
         self.attachment = attachment
         self.settings = settings
         self.filepath = filepath
-        self.recipient = recipient
+        # one task delivers the mail to all recipients of a comma separated list
+        if isinstance(recipient, str):
+            recipient = [strip_whitespaces(r) for r in recipient.split(',')]
+        self.recipients = [r for r in recipient if r]
+        self.recipient = ", ".join(self.recipients)
         self.text = text
         self.asyncSMTP = None
         self.book_id = id
@@ -140,39 +218,70 @@ class TaskEmail(CalibreTask):
             msgid_domain = ''
         return msgid_domain or 'calibre-web.com'
 
-    def prepare_message(self):
+    def prepare_message(self, attachment_data=None):
         message = EmailMessage()
-        # message = MIMEMultipart()
         message['From'] = self.settings["mail_from"]
         message['To'] = self.recipient
         message['Subject'] = self.subject
         message['Date'] = formatdate(localtime=True)
         message['Message-ID'] = make_msgid(domain=self.get_msgid_domain())
         message.set_content(self.text.encode('UTF-8'), "text", "plain")
-        if self.attachment:
-            data = self._get_attachment(self.filepath, self.attachment)
-            if data:
-                # Set mimetype
-                content_type, encoding = mimetypes.guess_type(self.attachment)
-                if content_type is None or encoding is not None:
-                    content_type = 'application/octet-stream'
-                main_type, sub_type = content_type.split('/', 1)
-                message.add_attachment(data, maintype=main_type, subtype=sub_type, filename=self.attachment)
-            else:
-                self._handleError("Attachment not found")
-                return
+        if attachment_data is not None:
+            # Set mimetype
+            content_type, encoding = mimetypes.guess_type(self.attachment)
+            if content_type is None or encoding is not None:
+                content_type = 'application/octet-stream'
+            main_type, sub_type = content_type.split('/', 1)
+            message.add_attachment(attachment_data, maintype=main_type, subtype=sub_type, filename=self.attachment)
         return message
 
+    def prepare_message_stream(self, attachment_path=None):
+        """Returns size and chunks of the message in SMTP wire format, the attachment is read and base64 encoded
+        while sending"""
+        marker = "calibre-web-attachment-{}".format(uuid4().hex).encode('ascii')
+        message = self.prepare_message(marker if attachment_path else None)
+        data = re.sub(rb'(?m)^\.', b'..', message.as_bytes(policy=SMTP_POLICY))
+        if not data.endswith(smtplib.bCRLF):
+            data += smtplib.bCRLF
+        if not attachment_path:
+            return len(data), [data]
+        prefix, suffix = data.split(base64.b64encode(marker), 1)
+        encoded_size = (os.path.getsize(attachment_path) + 2) // 3 * 4
+        line_breaks = max((encoded_size + BASE64_LINE - 1) // BASE64_LINE - 1, 0) * len(smtplib.bCRLF)
+        return len(prefix) + encoded_size + line_breaks + len(suffix), \
+            self._stream_message(prefix, attachment_path, suffix)
+
+    @staticmethod
+    def _stream_message(prefix, attachment_path, suffix):
+        yield prefix
+        with open(attachment_path, 'rb') as file_:
+            first = True
+            while True:
+                block = file_.read(CHUNKSIZE)
+                if not block:
+                    break
+                encoded = base64.b64encode(block)
+                lines = smtplib.bCRLF.join(encoded[i:i + BASE64_LINE] for i in range(0, len(encoded), BASE64_LINE))
+                yield lines if first else smtplib.bCRLF + lines
+                first = False
+        yield suffix
+
     def run(self, worker_thread):
+        attachment = None
         try:
-            # create MIME message
-            msg = self.prepare_message()
-            if not msg:
-                return
+            if self.attachment:
+                attachment = self._get_attachment(self.filepath, self.attachment)
+                if not attachment:
+                    self._handleError("Attachment not found")
+                    return
             if self.settings['mail_server_type'] == 0:
-                self.send_standard_email(msg)
+                self.send_standard_email(attachment[0] if attachment else None)
             else:
-                self.send_gmail_email(msg)
+                if attachment:
+                    with open(attachment[0], 'rb') as file_:
+                        self.send_gmail_email(self.prepare_message(file_.read()))
+                else:
+                    self.send_gmail_email(self.prepare_message())
         except MemoryError as e:
             log.error_or_exception(e, stacklevel=2)
             self._handleError('MemoryError sending e-mail: {}'.format(str(e)))
@@ -197,6 +306,12 @@ class TaskEmail(CalibreTask):
         except Exception as ex:
             log.error_or_exception(ex, stacklevel=2)
             self._handleError('Error sending e-mail: {}'.format(ex))
+        finally:
+            if attachment and attachment[1]:
+                try:
+                    os.remove(attachment[0])
+                except OSError as ex:
+                    log.warning("Could not remove temporary attachment %s: %s", attachment[0], ex)
 
     def _create_ssl_context(self, cafile=None):
         if cafile:
@@ -219,12 +334,46 @@ class TaskEmail(CalibreTask):
         log.warning("SSL certificate verification failed for SMTP %s, retrying with certifi CA bundle", action)
         return self._create_ssl_context(cafile=cafile)
 
-    def send_standard_email(self, msg):
+    def _connection_key(self):
+        return (self.settings["mail_server"], self.settings["mail_port"], int(self.settings.get('mail_use_ssl', 0)),
+                self.settings["mail_login"], self.settings["mail_password_e"])
+
+    def send_standard_email(self, attachment_path=None):
+        log.debug("Start sending e-mail")
+        key = self._connection_key()
+        self.asyncSMTP = smtp_pool.get(key)
+        reused = self.asyncSMTP is not None
+        if reused:
+            log.debug("Reusing SMTP connection")
+        else:
+            self._connect()
+        try:
+            try:
+                refused = self._send_message(attachment_path)
+            except smtplib.SMTPServerDisconnected:
+                if not reused:
+                    raise
+                # the server closed the pooled connection meanwhile, send again on a new one
+                self._connect()
+                refused = self._send_message(attachment_path)
+        except Exception:
+            self.asyncSMTP.close()
+            raise
+        for recipient, (code, resp) in refused.items():
+            log.error("E-mail to {} was refused: {} {}".format(recipient, code, resp))
+        smtp_pool.put(key, self.asyncSMTP)
+        self._handleSuccess()
+        log.debug("E-mail send successfully")
+
+    def _send_message(self, attachment_path):
+        size, chunks = self.prepare_message_stream(attachment_path)
+        return self.asyncSMTP.send_message_stream(self.settings["mail_from"], self.recipients, size, chunks)
+
+    def _connect(self):
         use_ssl = int(self.settings.get('mail_use_ssl', 0))
         timeout = 600  # set timeout to 5mins
 
         # on python3 debugoutput is caught with overwritten _print_debug function
-        log.debug("Start sending e-mail")
         if use_ssl == 2:
             try:
                 self.asyncSMTP = EmailSSL(self.settings["mail_server"], self.settings["mail_port"],
@@ -254,16 +403,6 @@ class TaskEmail(CalibreTask):
         if self.settings["mail_password_e"]:
             self.asyncSMTP.login(str(self.settings["mail_login"]), str(self.settings["mail_password_e"]))
 
-        # Convert message to something to send
-        fp = StringIO()
-        gen = Generator(fp, mangle_from_=False)
-        gen.flatten(msg)
-
-        self.asyncSMTP.sendmail(self.settings["mail_from"], self.recipient, fp.getvalue())
-        self.asyncSMTP.quit()
-        self._handleSuccess()
-        log.debug("E-mail send successfully")
-
     def send_gmail_email(self, message):
         gmail.send_messsage(self.settings.get('mail_gmail_token', None), message)
         self._handleSuccess()
@@ -283,7 +422,7 @@ class TaskEmail(CalibreTask):
             self._progress = x
 
     def _get_attachment(self, book_path, filename):
-        """Get file as MIMEBase message"""
+        """Returns the path of the file to attach and whether it is a temporary file, None if it can't be read"""
         calibre_path = config.get_book_path()
         extension = os.path.splitext(filename)[1][1:]
         if config.config_use_google_drive:
@@ -298,24 +437,17 @@ class TaskEmail(CalibreTask):
             if config.config_binariesdir and config.config_embed_metadata:
                 data_path, data_file = do_calibre_export(self.book_id, extension)
                 datafile = os.path.join(data_path, data_file + "." + extension)
-            with open(datafile, 'rb') as file_:
-                data = file_.read()
-            os.remove(datafile)
-        else:
-            datafile = os.path.join(calibre_path, book_path, filename)
-            try:
-                if config.config_binariesdir and config.config_embed_metadata:
-                    data_path, data_file = do_calibre_export(self.book_id, extension)
-                    datafile = os.path.join(data_path, data_file + "." + extension)
-                with open(datafile, 'rb') as file_:
-                    data = file_.read()
-                if config.config_binariesdir and config.config_embed_metadata:
-                    os.remove(datafile)
-            except IOError as e:
-                log.error_or_exception(e, stacklevel=2)
-                log.error('The requested file could not be read. Maybe wrong permissions?')
-                return None
-        return data
+            return datafile, True
+        datafile = os.path.join(calibre_path, book_path, filename)
+        temporary = False
+        if config.config_binariesdir and config.config_embed_metadata:
+            data_path, data_file = do_calibre_export(self.book_id, extension)
+            datafile = os.path.join(data_path, data_file + "." + extension)
+            temporary = True
+        if not os.access(datafile, os.R_OK):
+            log.error('The requested file could not be read. Maybe wrong permissions?')
+            return None
+        return datafile, temporary
 
     @property
     def name(self):
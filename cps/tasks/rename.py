@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Moves book folders and files after title or author changes. All path changes are planned up front and written to a
+# journal next to app.db, the files are moved afterwards and the new paths are stored in the database in one
+# transaction once the files are in place. Every step checks where the files currently are, so an interrupted job
+# is simply started again from its journal.
+
+import errno
+import glob
+import json
+import os
+import shutil
+from uuid import uuid4
+
+from flask_babel import gettext as _, lazy_gettext as N_, force_locale
+from sqlalchemy import bindparam, func
+from sqlalchemy.exc import SQLAlchemyError
+
+from cps import app, config, db, gdriveutils, helper, logger, ub
+from cps.services.worker import CalibreTask
+
+log = logger.create()
+
+# Number of books read or updated by one statement
+RENAME_CHUNK = 500
+JOURNAL_DIR = "rename_journal"
+
+
+def _chunks(values):
+    for start in range(0, len(values), RENAME_CHUNK):
+        yield values[start:start + RENAME_CHUNK]
+
+
+def plan_renames(session, book_ids, first_author=None):
+    """Returns the folder and file name changes needed for the books, first_author is the new first author of all
+    books, without it the author folder is kept"""
+    books = list()
+    for chunk in _chunks(sorted(book_ids)):
+        files = dict()
+        for data_id, book_id, book_format, name in (session.query(db.Data.id, db.Data.book, db.Data.format,
+                                                                  db.Data.name)
+                                                    .filter(db.Data.book.in_(chunk)).order_by(db.Data.id)):
+            files.setdefault(book_id, list()).append((data_id, book_format, name))
+        for book_id, title, path in (session.query(db.Books.id, db.Books.title, db.Books.path)
+                                     .filter(db.Books.id.in_(chunk)).order_by(db.Books.id)):
+            author_dir = path.split('/')[0]
+            author = first_author or author_dir
+            new_path = "{}/{} ({})".format(helper.get_valid_filename(author, chars=96) if first_author else author_dir,
+                                           helper.get_valid_filename(title, chars=96), book_id)
+            new_name = helper.get_valid_filename(title, chars=42) + ' - ' + helper.get_valid_filename(author, chars=42)
+            renamed_files = [[data_id, book_format.lower(), name, new_name]
+                             for data_id, book_format, name in files.get(book_id, []) if name != new_name]
+            if path != new_path or renamed_files:
+                books.append({"id": book_id, "old": path, "new": new_path, "files": renamed_files})
+    # Author folders are renamed as a whole if all books inside move to the same new folder, this also changes the
+    # case of the folder name on case-insensitive file systems
+    moving = dict()
+    for book in books:
+        old_dir, new_dir = book["old"].split('/')[0], book["new"].split('/')[0]
+        if old_dir != new_dir:
+            moving.setdefault((old_dir, new_dir), list()).append(book["id"])
+    authors = list()
+    for (old_dir, new_dir), ids in moving.items():
+        prefix = old_dir + '/'
+        count = (session.query(func.count(db.Books.id))
+                 .filter(func.substr(db.Books.path, 1, len(prefix)) == prefix).scalar())
+        if count == len(ids):
+            authors.append([old_dir, new_dir])
+    return {"library": config.get_book_path(), "authors": authors, "books": books}
+
+
+class RenameJournal:
+    """Plan of a rename job followed by one line per finished book"""
+
+    def __init__(self, path):
+        self.path = path
+        self.plan = None
+        self.done = set()
+
+    @staticmethod
+    def directory():
+        return os.path.join(os.path.dirname(ub.app_DB_path), JOURNAL_DIR)
+
+    @classmethod
+    def create(cls, plan):
+        os.makedirs(cls.directory(), exist_ok=True)
+        journal = cls(os.path.join(cls.directory(), "{}.jsonl".format(uuid4().hex)))
+        journal.plan = plan
+        with open(journal.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(plan) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return journal
+
+    @classmethod
+    def unfinished(cls):
+        return sorted(glob.glob(os.path.join(cls.directory(), "*.jsonl")), key=os.path.getmtime)
+
+    def load(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            self.plan = json.loads(f.readline())
+            for line in f:
+                try:
+                    self.done.add(json.loads(line)["done"])
+                except (ValueError, KeyError):
+                    # last line only partly written
+                    pass
+        return self
+
+    def mark_done(self, book_id):
+        self.done.add(book_id)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"done": book_id}) + "\n")
+
+    def remove(self):
+        try:
+            os.remove(self.path)
+        except OSError as ex:
+            log.error("Removing rename journal %s failed: %s", self.path, ex)
+
+
+def _has_exact_name(path):
+    # on case-insensitive file systems a path is also found by a name differing in case
+    try:
+        return os.path.basename(path) in os.listdir(os.path.dirname(path))
+    except OSError:
+        return False
+
+
+def _move(src, dst):
+    """Moves a file or folder, does nothing if it was already moved"""
+    if src == dst or not os.path.exists(src):
+        return
+    if not os.path.exists(dst):
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        shutil.move(src, dst)
+    elif os.path.samefile(src, dst):
+        # only the case of the name changes
+        if not _has_exact_name(dst):
+            os.rename(src, dst)
+    elif os.path.isdir(src):
+        # target folder already exists, merge the content
+        for dir_name, __, file_list in os.walk(src):
+            target_dir = dst + dir_name[len(src):]
+            os.makedirs(target_dir, exist_ok=True)
+            for file in file_list:
+                shutil.move(os.path.join(dir_name, file), os.path.join(target_dir, file))
+        shutil.rmtree(src)
+    else:
+        shutil.move(src, dst)
+
+
+def move_book(calibre_path, book):
+    """Moves the folder and files of one planned book, already moved parts are skipped"""
+    new_dir = os.path.join(calibre_path, book["new"])
+    # the folder is still at the old location, or was moved together with the author folder
+    moved_path = book["new"].split('/')[0] + '/' + book["old"].split('/')[1]
+    for old_path in dict.fromkeys((book["old"], moved_path)):
+        src = os.path.join(calibre_path, old_path)
+        if old_path != book["new"] and os.path.isdir(src):
+            _move(src, new_dir)
+    if not os.path.isdir(new_dir):
+        raise OSError(errno.ENOENT, os.strerror(errno.ENOENT), os.path.join(calibre_path, book["old"]))
+    for __, extension, old_name, new_name in book["files"]:
+        src = os.path.join(new_dir, old_name + '.' + extension)
+        dst = os.path.join(new_dir, new_name + '.' + extension)
+        _move(src, dst)
+        if not os.path.exists(dst):
+            log.error("File %s of book %s not found", src, book["id"])
+
+
+def store_renames(session, calibre_path, books):
+    """Updates path and file names of the books whose files are in place, the old values are part of the condition
+    to leave books changed in the meantime alone"""
+    paths = list()
+    names = list()
+    for book in books:
+        new_dir = os.path.join(calibre_path, book["new"])
+        if not os.path.isdir(new_dir):
+            continue
+        if book["old"] != book["new"]:
+            paths.append({"b_id": book["id"], "b_old": book["old"], "b_new": book["new"]})
+        for data_id, extension, old_name, new_name in book["files"]:
+            if os.path.exists(os.path.join(new_dir, new_name + '.' + extension)):
+                names.append({"d_id": data_id, "d_old": old_name, "d_new": new_name})
+    books_table = db.Books.__table__
+    data_table = db.Data.__table__
+    for chunk in _chunks(paths):
+        session.execute(books_table.update()
+                        .where(books_table.c.id == bindparam("b_id"))
+                        .where(books_table.c.path == bindparam("b_old"))
+                        .values(path=bindparam("b_new")), chunk)
+    for chunk in _chunks(names):
+        session.execute(data_table.update()
+                        .where(data_table.c.id == bindparam("d_id"))
+                        .where(data_table.c.name == bindparam("d_old"))
+                        .values(name=bindparam("d_new")), chunk)
+    return len(paths), len(names)
+
+
+class TaskRenameBooks(CalibreTask):
+    """Moves the folders and files of books to match their title and first author"""
+    def __init__(self, book_ids=None, first_author=None, journal=None, task_message=N_('Renaming book folders')):
+        super(TaskRenameBooks, self).__init__(task_message)
+        self.log = logger.create()
+        self.book_ids = book_ids or list()
+        self.first_author = first_author
+        self.journal = journal
+
+    @classmethod
+    def resume_unfinished(cls):
+        """Returns one task per journal left over by an interrupted job"""
+        try:
+            return [cls(journal=RenameJournal(path).load()) for path in RenameJournal.unfinished()]
+        except (OSError, ValueError) as ex:
+            log.error("Reading rename journal failed: {}".format(ex))
+            return []
+
+    def run(self, worker_thread):
+        # error messages of the helper functions are translated
+        with app.app_context(), force_locale(config.config_default_locale):
+            calibre_db = db.CalibreDB(app)
+            # the update trigger of the books table needs the title_sort function
+            calibre_db.create_functions(config)
+            if config.config_use_google_drive:
+                errors = self._rename_gdrive(calibre_db)
+            else:
+                errors = self._rename_local(calibre_db)
+        if errors:
+            for error in errors:
+                self.log.error(error)
+            self._handleError("; ".join(errors[:5]))
+        else:
+            self._handleSuccess()
+
+    def _rename_local(self, calibre_db):
+        calibre_path = config.get_book_path()
+        if self.journal is None:
+            try:
+                plan = plan_renames(calibre_db.session, self.book_ids, self.first_author)
+            except SQLAlchemyError as ex:
+                return [str(ex)]
+            if not plan["books"]:
+                return []
+            self.journal = RenameJournal.create(plan)
+        plan = self.journal.plan
+        if plan["library"] != calibre_path:
+            self.log.error("Rename journal %s belongs to library %s", self.journal.path, plan["library"])
+            return []
+        errors = list()
+        for old_dir, new_dir in plan["authors"]:
+            src = os.path.join(calibre_path, old_dir)
+            dst = os.path.join(calibre_path, new_dir)
+            try:
+                if os.path.isdir(src) and (not os.path.exists(dst) or os.path.samefile(src, dst)):
+                    _move(src, dst)
+            except OSError as ex:
+                # the books are moved one by one instead
+                self.log.error("Rename author from: %s to %s: %s", src, dst, ex)
+        count = len(plan["books"])
+        for index, book in enumerate(plan["books"]):
+            if book["id"] not in self.journal.done:
+                try:
+                    move_book(calibre_path, book)
+                    self.journal.mark_done(book["id"])
+                except OSError as ex:
+                    errors.append(_("Rename title from: '%(src)s' to '%(dest)s' failed with error: %(error)s",
+                                    src=os.path.join(calibre_path, book["old"]),
+                                    dest=os.path.join(calibre_path, book["new"]), error=str(ex)))
+            self.progress = (index + 1) / count
+        for old_dir in set(book["old"].split('/')[0] for book in plan["books"]):
+            old_path = os.path.join(calibre_path, old_dir)
+            try:
+                if os.path.isdir(old_path) and not os.listdir(old_path):
+                    os.rmdir(old_path)
+            except OSError as ex:
+                self.log.error("Deleting author folder %s failed: %s", old_path, ex)
+        try:
+            paths, names = store_renames(calibre_db.session, calibre_path, plan["books"])
+            calibre_db.session.commit()
+            self.log.debug("Renamed %d book folders and %d files", paths, names)
+        except SQLAlchemyError as ex:
+            calibre_db.session.rollback()
+            self.log.error_or_exception("Storing renamed book paths failed: {}".format(ex))
+            # the journal is kept, the job is repeated on the next start
+            return errors + [str(ex)]
+        self.journal.remove()
+        return errors
+
+    def _rename_gdrive(self, calibre_db):
+        errors = list()
+        count = len(self.book_ids)
+        for index, book_id in enumerate(self.book_ids):
+            try:
+                # the book may have been deleted in the meantime
+                if calibre_db.get_book(book_id):
+                    error = helper.update_dir_structure(book_id, config.get_book_path(), self.first_author)
+                    if error:
+                        calibre_db.session.rollback()
+                        errors.append(error)
+                    else:
+                        calibre_db.session.commit()
+            except (SQLAlchemyError, OSError) as ex:
+                calibre_db.session.rollback()
+                self.log.error_or_exception("Renaming folder of book {} failed: {}".format(book_id, ex))
+                errors.append(str(ex))
+            self.progress = (index + 1) / count
+        gdriveutils.updateGdriveCalibreFromLocal()
+        return errors
+
+    @property
+    def name(self):
+        return "Rename Books"
+
+    @property
+    def is_cancellable(self):
+        return False
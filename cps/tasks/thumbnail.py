@@ -65,10 +65,12 @@ def get_best_fit(width, height, image_width, image_height):
 
 
 class TaskGenerateCoverThumbnails(CalibreTask):
-    def __init__(self, book_id=-1, task_message=''):
+    def __init__(self, book_id=-1, task_message='', book_ids=None):
         super(TaskGenerateCoverThumbnails, self).__init__(task_message)
         self.log = logger.create()
         self.book_id = book_id
+        # limits the task to a list of books, e.g. the books changed by Calibre
+        self.book_ids = book_ids
         self.app_db_session = ub.get_new_session_instance()
         self.cache = fs.FileSystem()
         self.resolutions = [
@@ -80,7 +82,7 @@ class TaskGenerateCoverThumbnails(CalibreTask):
     def run(self, worker_thread):
         if use_IM and self.stat != STAT_CANCELLED and self.stat != STAT_ENDED:
             self.message = 'Scanning Books'
-            books_with_covers = self.get_books_with_covers(self.book_id)
+            books_with_covers = self.get_books_with_covers(self.book_id, self.book_ids)
             count = len(books_with_covers)
 
             total_generated = 0
@@ -112,8 +114,11 @@ class TaskGenerateCoverThumbnails(CalibreTask):
         self.app_db_session.remove()
 
     @staticmethod
-    def get_books_with_covers(book_id=-1):
-        filter_exp = (db.Books.id == book_id) if book_id != -1 else True
+    def get_books_with_covers(book_id=-1, book_ids=None):
+        if book_ids is not None:
+            filter_exp = db.Books.id.in_(book_ids)
+        else:
+            filter_exp = (db.Books.id == book_id) if book_id != -1 else True
         with app.app_context():
             calibre_db = db.CalibreDB(app) #, expire_on_commit=False, init=True)
             books_cover = calibre_db.session.query(db.Books).filter(db.Books.has_cover == 1).filter(filter_exp).all()
@@ -235,6 +240,8 @@ class TaskGenerateCoverThumbnails(CalibreTask):
     def __str__(self):
         if self.book_id > 0:
             return "Add Cover Thumbnails for Book {}".format(self.book_id)
+        elif self.book_ids is not None:
+            return "Update Cover Thumbnails for {} changed Books".format(len(self.book_ids))
         else:
             return "Generate Cover Thumbnails"
 
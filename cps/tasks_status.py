@@ -14,9 +14,12 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 
+import json
+import time
+
 from markupsafe import escape
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request, Response, stream_with_context
 from .cw_login import current_user
 from flask_babel import gettext as _
 from flask_babel import format_datetime
@@ -25,13 +28,28 @@ from babel.units import format_unit
 from . import logger
 from .render_template import render_title_template
 from .services.worker import WorkerThread, STAT_WAITING, STAT_FAIL, STAT_STARTED, STAT_FINISH_SUCCESS, STAT_ENDED, \
-    STAT_CANCELLED
+    STAT_CANCELLED, task_changes
 from .usermanagement import user_login_required
 
+try:
+    # cooperative under the gevent server, a normal sleep in other threads
+    from gevent import sleep
+except ImportError:
+    from time import sleep
+
 tasks = Blueprint('tasks', __name__)
 
 log = logger.create()
 
+# Seconds between two checks of the task version while streaming, changes in between are sent as one event
+STREAM_INTERVAL = 0.5
+# Seconds after which running tasks are sent again to update their runtime
+RUNTIME_REFRESH = 5
+# Seconds after which a stream is closed, the browser reconnects and continues with the last received version
+STREAM_LIFETIME = 300
+# Seconds between two keep alive comments on an idle stream
+KEEPALIVE = 20
+
 
 @tasks.route("/ajax/emailstat")
 @user_login_required
@@ -40,6 +58,74 @@ def get_email_status_json():
     return jsonify(render_task_status(tasks))
 
 
+@tasks.route("/ajax/taskstream")
+@user_login_required
+def get_task_stream():
+    """Server-sent events with the changed tasks since the version of the Last-Event-ID header
+
+    Only the gevent server keeps the stream open, in threaded servers an open stream would occupy a thread per
+    browser tab. Other servers answer with the current changes and let the browser reconnect.
+    """
+    epoch, __, version = (request.headers.get('Last-Event-ID') or request.args.get('version', '')).partition(':')
+    version = int(version) if epoch == task_changes.epoch and version.isdigit() else None
+    keep_open = request.environ.get('SERVER_SOFTWARE', '').startswith('gevent')
+    return Response(stream_with_context(task_events(version, keep_open)), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+def task_events(version, keep_open):
+    yield "retry: {}\n\n".format(1000 if keep_open else int(STREAM_INTERVAL * 2000))
+    started = last_sent = last_refresh = time.monotonic()
+    # tasks which were running in the last sent events, their runtime is refreshed periodically
+    running = set()
+    while True:
+        now = time.monotonic()
+        event = None
+        if version is None or task_changes.version != version:
+            event, version = render_task_delta(version, running)
+        elif running and now - last_refresh >= RUNTIME_REFRESH:
+            event = render_task_event(version, [item for item in WorkerThread.get_instance().tasks
+                                                if item.task.id in running], running)
+        elif not keep_open:
+            # every poll is a new request without the running tasks of earlier events, send them to update the runtime
+            started_tasks = [item for item in WorkerThread.get_instance().tasks if item.task.stat == STAT_STARTED]
+            if started_tasks:
+                event = render_task_event(version, started_tasks, running)
+        if event is not None:
+            last_sent = last_refresh = now
+            yield event
+        elif now - last_sent >= KEEPALIVE:
+            last_sent = now
+            yield ":\n\n"
+        if not keep_open or now - started >= STREAM_LIFETIME:
+            return
+        sleep(STREAM_INTERVAL)
+
+
+def render_task_delta(version, running):
+    """Returns the event with all tasks changed after version, all tasks if these changes are unknown"""
+    current = task_changes.version
+    changes = task_changes.since(version) if version is not None else None
+    tasklist = WorkerThread.get_instance().tasks
+    if changes is None:
+        running.clear()
+        return render_task_event(current, tasklist, running, full=True), current
+    changed, removed = changes
+    running.difference_update(removed)
+    return render_task_event(current, [item for item in tasklist if item.task.id in changed], running,
+                             removed=[str(task_id) for task_id in removed]), current
+
+
+def render_task_event(version, tasklist, running, full=False, removed=None):
+    for item in tasklist:
+        if item.task.stat == STAT_STARTED:
+            running.add(item.task.id)
+        else:
+            running.discard(item.task.id)
+    data = {"full": full, "tasks": render_task_status(tasklist), "removed": removed or []}
+    return "id: {}:{}\ndata: {}\n\n".format(task_changes.epoch, version, json.dumps(data, default=str))
+
+
 @tasks.route("/tasks")
 @user_login_required
 def get_tasks_status():
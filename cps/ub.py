@@ -20,6 +20,7 @@
 import atexit
 import os
 import sys
+import threading
 from datetime import datetime, timezone, timedelta
 import itertools
 import uuid
@@ -40,21 +41,24 @@ except ImportError as e:
     except ImportError as e:
         OAuthConsumerMixin = BaseException
         oauth_support = False
-from sqlalchemy import create_engine, exc, exists, event, text
+from sqlalchemy import create_engine, exc, exists, event, text, inspect, bindparam, Index
 from sqlalchemy import Column, ForeignKey
 from sqlalchemy import String, Integer, SmallInteger, Boolean, DateTime, Float, JSON
 from sqlalchemy.orm.attributes import flag_modified
-from sqlalchemy.sql.expression import func
+from sqlalchemy.sql.expression import func, table, column, literal
 try:
     # Compatibility with sqlalchemy 2.0
     from sqlalchemy.orm import declarative_base
 except ImportError:
     from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import backref, relationship, sessionmaker, Session, scoped_session
+from sqlalchemy.orm.events import SessionEvents
 from werkzeug.security import generate_password_hash
 
 from . import constants, logger
 from .string_helper import strip_whitespaces
+from .services.cache import LRUCache
+from .services.write_behind import WriteBehindQueue
 
 log = logger.create()
 
@@ -65,6 +69,14 @@ searched_ids = {}
 
 logged_in = dict()
 
+# Sessions validated by load_user, (user id, random, session key) -> CachedUserSession
+user_session_cache = LRUCache(maxsize=1024, ttl=600)
+# Extended expiry dates of stored sessions which are not written to the database yet, session id -> expiry
+pending_session_expiry = dict()
+pending_session_expiry_lock = threading.Lock()
+# Set as soon as flush_session_expiry is called periodically in the background
+defer_session_expiry = False
+
 
 def signal_store_user_session(object, user):
     store_user_session()
@@ -94,6 +106,7 @@ def store_user_session():
 def delete_user_session(user_id, session_key):
     try:
         log.debug("Deleted session_key: " + session_key)
+        invalidate_user_sessions(user_id, session_key)
         session.query(User_Sessions).filter(User_Sessions.user_id == user_id,
                                             User_Sessions.session_key == session_key).delete()
         session.commit()
@@ -110,10 +123,8 @@ def check_user_session(user_id, session_key, random):
                                                     ).one_or_none()
         if found is not None:
             new_expiry = int((datetime.now()  + timedelta(days=31)).timestamp())
-            if new_expiry - found.expiry > 86400:
-                found.expiry = new_expiry
-                session.merge(found)
-                session.commit()
+            if new_expiry - (found.expiry or 0) > 86400:
+                extend_session_expiry(found.id, new_expiry)
         return bool(found)
     except (exc.OperationalError, exc.InvalidRequestError) as e:
         session.rollback()
@@ -121,6 +132,70 @@ def check_user_session(user_id, session_key, random):
         return False
 
 
+class CachedUserSession:
+    __slots__ = ('user', 'session_id', 'expiry')
+
+    def __init__(self, user, session_id=None, expiry=None):
+        self.user = user
+        self.session_id = session_id
+        self.expiry = expiry
+
+
+def get_cached_user_session(user_id, random, session_key):
+    entry = user_session_cache.get((user_id, random, session_key))
+    if entry is not None and entry.session_id is not None:
+        new_expiry = int((datetime.now() + timedelta(days=31)).timestamp())
+        if new_expiry - (entry.expiry or 0) > 86400:
+            entry.expiry = new_expiry
+            extend_session_expiry(entry.session_id, new_expiry)
+    return entry.user if entry is not None else None
+
+
+def cache_user_session(user, random, session_key, user_session=None):
+    entry = CachedUserSession(user)
+    if user_session is not None:
+        entry.session_id = user_session.id
+        entry.expiry = user_session.expiry
+    user_session_cache.set((user.id, random, session_key), entry)
+
+
+def invalidate_user_sessions(user_id=None, session_key=None):
+    if user_id is None:
+        user_session_cache.clear()
+    else:
+        user_session_cache.remove_if(lambda key, __: key[0] == int(user_id)
+                                     and (session_key is None or key[2] == session_key))
+
+
+def extend_session_expiry(session_id, expiry):
+    with pending_session_expiry_lock:
+        pending_session_expiry[session_id] = expiry
+    if not defer_session_expiry:
+        flush_session_expiry()
+
+
+def flush_session_expiry():
+    """Writes all pending session expiry extensions in one statement"""
+    with pending_session_expiry_lock:
+        pending = dict(pending_session_expiry)
+        pending_session_expiry.clear()
+    if not pending or session is None:
+        return
+    statement = User_Sessions.__table__.update().where(User_Sessions.id == bindparam('_id')) \
+        .values(expiry=bindparam('_expiry'))
+    try:
+        with session.bind.begin() as conn:
+            conn.execute(statement, [{'_id': session_id, '_expiry': expiry} for session_id, expiry in pending.items()])
+    except exc.OperationalError as e:
+        log.error("Could not extend expiry of user sessions: %s", e)
+        with pending_session_expiry_lock:
+            for session_id, expiry in pending.items():
+                pending_session_expiry.setdefault(session_id, expiry)
+
+
+atexit.register(flush_session_expiry)
+
+
 user_logged_in.connect(signal_store_user_session)
 
 def store_ids(result):
@@ -259,6 +334,12 @@ class User(UserBase, Base):
     kobo_only_shelves_sync = Column(Integer, default=0)
 
 
+# Case-insensitive sorting and paging of the admin user table
+Index('ix_user_name_lower', func.lower(User.name))
+Index('ix_user_email_lower', func.lower(User.email))
+Index('ix_user_kindle_mail_lower', func.lower(User.kindle_mail))
+
+
 if oauth_support:
     class OAuth(OAuthConsumerMixin, Base):
         provider_user_id = Column(String(256))
@@ -349,6 +430,7 @@ class User_Sessions(Base):
     random = Column(String, default="")
     expiry = Column(Integer)
 
+    __table_args__ = (Index('ix_user_session_random_key', 'random', 'session_key'),)
 
     def __init__(self, user_id, session_key, random, expiry):
         super().__init__()
@@ -499,6 +581,74 @@ def receive_before_flush(session, flush_context, instances):
     for change in itertools.chain(session.new, session.deleted):
         if isinstance(change, BookShelf):
             change.ub_shelf.last_modified = datetime.now(timezone.utc)
+    if any(isinstance(change, (Shelf, BookShelf))
+           for change in itertools.chain(session.new, session.dirty, session.deleted)):
+        session.info['shelves_changed'] = True
+
+
+def mark_shelves_changed(_session=None):
+    """Bulk statements on shelves bypass the flush, the shelf version changes with the next commit of the session"""
+    (_session or session).info['shelves_changed'] = True
+
+
+def _statement_tables(orm_execute_state):
+    tables = set(mapper.local_table.name for mapper in orm_execute_state.all_mappers)
+    table = getattr(orm_execute_state.statement, 'table', None)
+    if table is not None:
+        tables.add(table.name)
+    return tables
+
+
+# Bulk inserts, updates and deletes bypass the flush, mark the session as well. The event needs SQLAlchemy 1.4, with
+# older versions only the explicit marks of the callers of bulk statements are available
+if hasattr(SessionEvents, 'do_orm_execute'):
+    @event.listens_for(Session, 'do_orm_execute')
+    def receive_do_orm_execute(orm_execute_state):
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            tables = _statement_tables(orm_execute_state)
+            if tables & {Shelf.__tablename__, BookShelf.__tablename__}:
+                orm_execute_state.session.info['shelves_changed'] = True
+            if tables & {User.__tablename__, User_Sessions.__tablename__}:
+                invalidate_user_sessions()
+
+
+# The shelf version changes with every committed change of a shelf or its books, cached shelf lists depend on it
+shelf_version = 0
+
+
+def get_shelf_version():
+    return shelf_version
+
+
+def bump_shelf_version():
+    global shelf_version
+    shelf_version += 1
+
+
+@event.listens_for(Session, 'after_commit')
+def receive_after_commit(session):
+    if session.info.pop('shelves_changed', False):
+        bump_shelf_version()
+
+
+@event.listens_for(Session, 'after_rollback')
+def receive_after_rollback(session):
+    session.info.pop('shelves_changed', None)
+
+
+# Cached user sessions have to be validated again after a user was deleted, renamed or got a new password or roles
+@event.listens_for(Session, 'after_flush')
+def receive_after_flush(session, flush_context):
+    for change in session.deleted:
+        if isinstance(change, User):
+            invalidate_user_sessions(change.id)
+        elif isinstance(change, User_Sessions):
+            invalidate_user_sessions(change.user_id, change.session_key)
+    for change in session.dirty:
+        if isinstance(change, User):
+            state = inspect(change)
+            if any(state.attrs[name].history.has_changes() for name in ('password', 'role', 'name')):
+                invalidate_user_sessions(change.id)
 
 
 # Baseclass representing Downloads from calibre-web in app.db
@@ -601,6 +751,19 @@ def migrate_user_session_table(engine, _session):
             conn.execute(text("ALTER TABLE user_session ADD column 'random' String"))
             conn.execute(text("ALTER TABLE user_session ADD column 'expiry' Integer"))
             trans.commit()
+    with engine.connect() as conn:
+        trans = conn.begin()
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_user_session_random_key ON user_session (random, session_key)"))
+        trans.commit()
+
+
+def migrate_user_table(engine, _session):
+    with engine.connect() as conn:
+        trans = conn.begin()
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_user_name_lower ON user (lower(name))"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_user_email_lower ON user (lower(email))"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_user_kindle_mail_lower ON user (lower(kindle_mail))"))
+        trans.commit()
 
 
 def migrate_remote_auth_token_table(engine, _session):
@@ -623,6 +786,7 @@ def migrate_Database(_session):
     add_missing_tables(engine, _session)
     migrate_registration_table(engine, _session)
     migrate_user_session_table(engine, _session)
+    migrate_user_table(engine, _session)
     migrate_remote_auth_token_table(engine, _session)
 
 
@@ -639,26 +803,126 @@ def clean_database(_session):
 
 
 # Save downloaded books per user in calibre-web's own database
-def update_download(book_id, user_id):
-    check = session.query(Downloads).filter(Downloads.user_id == user_id).filter(Downloads.book_id == book_id).first()
+def update_download(book_id, user_id, sync=False):
+    return activity_queue.submit(('download', user_id, book_id), (user_id, book_id), _apply_download, sync)
 
-    if not check:
-        new_download = Downloads(user_id=user_id, book_id=book_id)
-        session.add(new_download)
-        try:
-            session.commit()
-        except exc.OperationalError:
-            session.rollback()
+
+def _apply_download(_session, value):
+    user_id, book_id = value
+    if not _session.query(exists().where(Downloads.user_id == user_id, Downloads.book_id == book_id)).scalar():
+        _session.add(Downloads(user_id=user_id, book_id=book_id))
+
+
+# Stores the bookmark of a user in a book format, an empty bookmark_key removes the bookmark
+def update_bookmark(user_id, book_id, book_format, bookmark_key, sync=False):
+    return activity_queue.submit(('bookmark', user_id, book_id, book_format.upper()),
+                          (user_id, book_id, book_format, bookmark_key), _apply_bookmark, sync)
+
+
+def _apply_bookmark(_session, value):
+    user_id, book_id, book_format, bookmark_key = value
+    _session.query(Bookmark).filter(Bookmark.user_id == user_id,
+                                    Bookmark.book_id == book_id,
+                                    Bookmark.format == book_format).delete()
+    if bookmark_key:
+        _session.add(Bookmark(user_id=user_id, book_id=book_id, format=book_format, bookmark_key=bookmark_key))
+
+
+def get_read_status(user_id, book_id):
+    """Returns the read status of a book including not yet committed changes"""
+    pending = activity_queue.get_pending(('read_status', user_id, book_id))
+    if pending is not None:
+        return pending[2]
+    status = session.query(ReadBook.read_status).filter(ReadBook.user_id == user_id,
+                                                        ReadBook.book_id == book_id).scalar()
+    return status if status is not None else ReadBook.STATUS_UNREAD
+
+
+def update_read_status(user_id, book_id, read_status, sync=False):
+    return activity_queue.submit(('read_status', user_id, book_id), (user_id, book_id, read_status),
+                                 _apply_read_status, sync)
+
+
+def _apply_read_status(_session, value):
+    user_id, book_id, read_status = value
+    book = _session.query(ReadBook).filter(ReadBook.user_id == user_id, ReadBook.book_id == book_id).first()
+    if not book:
+        book = ReadBook(user_id=user_id, book_id=book_id)
+        _session.add(book)
+    book.read_status = read_status
+    if not book.kobo_reading_state:
+        kobo_reading_state = KoboReadingState(user_id=user_id, book_id=book_id)
+        kobo_reading_state.current_bookmark = KoboBookmark()
+        kobo_reading_state.statistics = KoboStatistics()
+        book.kobo_reading_state = kobo_reading_state
+
+
+def flush_activity():
+    """Commits all queued downloads, bookmarks and read states, has to be called before reading them in bulk"""
+    return activity_queue.flush()
+
+
+# Downloads, bookmarks and read states are written behind in batches by a background thread
+activity_queue = WriteBehindQueue(lambda: Session(bind=session.bind), name="ActivityQueue")
 
 
 # Delete non-existing downloaded books in calibre-web's own database
 def delete_download(book_id):
+    activity_queue.flush()
     session.query(Downloads).filter(book_id == Downloads.book_id).delete()
     try:
         session.commit()
     except exc.OperationalError:
         session.rollback()
 
+# Book ids of set based shelf operations, the temporary table only lives in the connection of the session
+shelf_book_ids = table('shelf_book_ids', column('pos', Integer), column('book_id', Integer), schema='temp')
+
+
+def _store_shelf_book_ids(book_ids):
+    session.execute(text("CREATE TEMP TABLE IF NOT EXISTS shelf_book_ids "
+                         "(pos INTEGER PRIMARY KEY, book_id INTEGER UNIQUE)"))
+    session.execute(text("DELETE FROM temp.shelf_book_ids"))
+    if book_ids:
+        session.execute(text("INSERT OR IGNORE INTO temp.shelf_book_ids (book_id) VALUES (:book_id)"),
+                        [{"book_id": int(book_id)} for book_id in book_ids])
+
+
+# Appends books to the end of a shelf in the given order with one INSERT ... SELECT, books already on the shelf are
+# skipped. Returns the number of added books, the caller commits the session
+def add_books_to_shelf(shelf, book_ids):
+    # new shelves need their id
+    session.flush()
+    _store_shelf_book_ids(book_ids)
+    now = datetime.now(timezone.utc)
+    max_order = session.query(func.coalesce(func.max(BookShelf.order), 0)).filter(BookShelf.shelf == shelf.id).scalar()
+    # uncorrelated, sqlite evaluates it once instead of searching the unindexed link table for every book
+    on_shelf = session.query(BookShelf.book_id).filter(BookShelf.shelf == shelf.id, BookShelf.book_id.isnot(None))
+    new_entries = session.query(shelf_book_ids.c.book_id,
+                                shelf_book_ids.c.pos + max_order,
+                                literal(shelf.id, Integer),
+                                literal(now, DateTime)).filter(shelf_book_ids.c.book_id.notin_(on_shelf)) \
+        .order_by(shelf_book_ids.c.pos)
+    added = session.execute(BookShelf.__table__.insert().from_select(['book_id', 'order', 'shelf', 'date_added'],
+                                                                    new_entries)).rowcount
+    if added:
+        shelf.last_modified = now
+        mark_shelves_changed()
+    return added
+
+
+# Removes books from a shelf with one DELETE, returns the number of removed books, the caller commits the session
+def remove_books_from_shelf(shelf, book_ids):
+    _store_shelf_book_ids(book_ids)
+    removed = session.query(BookShelf).filter(BookShelf.shelf == shelf.id,
+                                              BookShelf.book_id.in_(session.query(shelf_book_ids.c.book_id))) \
+        .delete(synchronize_session=False)
+    if removed:
+        shelf.last_modified = datetime.now(timezone.utc)
+        mark_shelves_changed()
+    return removed
+
+
 # Generate user Guest (translated text), as anonymous user, no rights
 def create_anonymous_user(_session):
     user = User()
@@ -710,6 +974,7 @@ def init_db(app_db_path):
     Session = scoped_session(sessionmaker())
     Session.configure(bind=engine)
     session = Session()
+    user_session_cache.clear()
 
     if os.path.exists(app_db_path):
         Base.metadata.create_all(engine)
@@ -758,6 +1023,8 @@ def get_new_session_instance():
 def dispose():
     global session
 
+    flush_session_expiry()
+    user_session_cache.clear()
     old_session = session
     session = None
     if old_session:
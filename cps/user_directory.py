@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+#  This file is part of the Calibre-Web (https://github.com/janeczku/calibre-web)
+#    Copyright (C) 2026 OzzieIsaacs
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Pages of the admin user table. Only the columns shown in the table are read, name and mail addresses are sorted
+# case-insensitive using the lower() indexes of the user table. Every page returns a cursor with the sort key of its
+# last row, the following page continues after this row instead of skipping all rows before it.
+
+import json
+
+from sqlalchemy import and_, or_, case, func, literal
+
+from . import constants, ub
+
+# Columns of the user table, the password and the stored view settings are never sent to the browser
+USER_COLUMNS = ('id', 'name', 'email', 'role', 'kindle_mail', 'locale', 'sidebar_view', 'default_language',
+                'denied_tags', 'allowed_tags', 'denied_column_value', 'allowed_column_value',
+                'kobo_only_shelves_sync')
+LOWERCASE_SORT = ('name', 'email', 'kindle_mail')
+
+
+def _sort_key(sort):
+    column = getattr(ub.User, sort)
+    return func.lower(column) if sort in LOWERCASE_SORT else column
+
+
+def _after(key, value, last_id, descending):
+    # rows following (value, last_id), NULL values come first in ascending order
+    if value is None:
+        if descending:
+            return and_(key.is_(None), ub.User.id < last_id)
+        return or_(key.isnot(None), and_(key.is_(None), ub.User.id > last_id))
+    if descending:
+        return or_(and_(key <= value, or_(key < value, ub.User.id < last_id)), key.is_(None))
+    return and_(key >= value, or_(key > value, ub.User.id > last_id))
+
+
+def _read_cursor(cursor, position):
+    try:
+        values = json.loads(cursor)
+        if isinstance(values, list) and len(values) == 2 and values[0] == position \
+                and isinstance(values[1], list) and len(values[1]) == 2 and isinstance(values[1][1], int):
+            return values[1]
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def list_users(search=None, sort="id", order="asc", state=None, offset=0, limit=10, cursor=None,
+               include_anonymous=False):
+    """Returns the total number of users, the number of users matching the search, the rows of the requested page
+    as dicts and the cursor for the next page"""
+    query = ub.session.query(*[getattr(ub.User, name) for name in USER_COLUMNS])
+    if not include_anonymous:
+        query = query.filter(ub.User.role.op('&')(constants.ROLE_ANONYMOUS) != constants.ROLE_ANONYMOUS)
+    total_count = filtered_count = query.count()
+    if search:
+        pattern = "%" + search + "%"
+        query = query.filter(or_(func.lower(ub.User.name).ilike(pattern),
+                                 func.lower(ub.User.kindle_mail).ilike(pattern),
+                                 func.lower(ub.User.email).ilike(pattern)))
+        filtered_count = query.count()
+
+    if sort != "state" and sort not in USER_COLUMNS:
+        sort = "id"
+    descending = order == "desc"
+    next_cursor = None
+    if sort == "state":
+        # selected users first for descending order, last for ascending order
+        selected_ids = dict((int(user_id), 1) for user_id in state or [] if str(user_id).isdigit())
+        # dictionary form of case, which SQLAlchemy 1.3 understands as well
+        selected = case(selected_ids, value=ub.User.id, else_=0) if selected_ids else literal(0)
+        if descending:
+            query = query.order_by(selected.desc(), ub.User.id.asc())
+        else:
+            query = query.order_by(selected.asc(), ub.User.id.desc())
+        rows = query.offset(offset).limit(limit).all()
+    else:
+        key = _sort_key(sort)
+        # the sort key is read as well, the cursor has to use the same lower() as the database
+        query = (query.add_columns(key.label("sort_key"))
+                 .order_by(key.desc() if descending else key.asc(),
+                           ub.User.id.desc() if descending else ub.User.id.asc()))
+        last = _read_cursor(cursor, [sort, order, search or "", offset])
+        if last:
+            query = query.filter(_after(key, last[0], last[1], descending))
+        else:
+            query = query.offset(offset)
+        rows = query.limit(limit).all()
+        if len(rows) == limit:
+            next_cursor = json.dumps([[sort, order, search or "", offset + limit], [rows[-1].sort_key, rows[-1].id]])
+    entries = list()
+    for row in rows:
+        entry = row._asdict()
+        entry.pop("sort_key", None)
+        entries.append(entry)
+    return total_count, filtered_count, entries, next_cursor
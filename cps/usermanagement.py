@@ -153,7 +153,11 @@ def load_user_from_reverse_proxy_header(req):
 
 @lm.user_loader
 def load_user(user_id, random, session_key):
+    user = ub.get_cached_user_session(int(user_id), random, session_key)
+    if user:
+        return user
     user = ub.session.query(ub.User).filter(ub.User.id == int(user_id)).first()
+    entry = None
     if session_key:
         entry = ub.session.query(ub.User_Sessions).filter(ub.User_Sessions.random == random,
                                                           ub.User_Sessions.session_key == session_key).first()
@@ -163,4 +167,6 @@ def load_user(user_id, random, session_key):
         entry = ub.session.query(ub.User_Sessions).filter(ub.User_Sessions.random == random).first()
         if not entry or entry.user_id != user.id:
             return None
+    if user:
+        ub.cache_user_session(user, random, session_key, entry)
     return user
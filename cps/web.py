@@ -18,6 +18,7 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program. If not, see <http://www.gnu.org/licenses/>.
 
+import io
 import os
 import json
 import mimetypes
@@ -25,7 +26,8 @@ import chardet  # dependency of requests
 import copy
 from importlib.metadata import metadata
 
-from flask import Blueprint, jsonify, request, redirect, send_from_directory, make_response, flash, abort, url_for
+from flask import Blueprint, jsonify, request, redirect, send_from_directory, send_file, make_response, flash, abort, \
+    url_for
 from flask import session as flask_session
 from flask_babel import gettext as _
 from flask_babel import get_locale
@@ -33,12 +35,13 @@ from .cw_login import login_user, logout_user, current_user
 from flask_limiter.util import get_remote_address
 from sqlalchemy.exc import IntegrityError, InvalidRequestError, OperationalError
 from sqlalchemy.sql.expression import text, func, false, not_, and_, or_
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.sql.functions import coalesce
 from werkzeug.datastructures import Headers
 from werkzeug.security import generate_password_hash, check_password_hash
 
-from . import constants, logger, isoLanguages, services, limiter
+from . import constants, logger, isoLanguages, services, limiter, comic_pages, audio_stream
 from . import db, ub, config, app
 from . import calibre_db, kobo_sync_status
 from .search import render_search_results, render_adv_search_results
@@ -157,19 +160,10 @@ def get_email_status_json():
 @user_login_required
 def set_bookmark(book_id, book_format):
     bookmark_key = request.form["bookmark"]
-    ub.session.query(ub.Bookmark).filter(and_(ub.Bookmark.user_id == int(current_user.id),
-                                              ub.Bookmark.book_id == book_id,
-                                              ub.Bookmark.format == book_format)).delete()
+    ub.update_bookmark(int(current_user.id), book_id, book_format, bookmark_key)
     if not bookmark_key:
-        ub.session_commit()
         return "", 204
-
-    l_bookmark = ub.Bookmark(user_id=current_user.id,
-                             book_id=book_id,
-                             format=book_format,
-                             bookmark_key=bookmark_key)
-    ub.session.merge(l_bookmark)
-    ub.session_commit("Bookmark for user {} in book {} created".format(current_user.id, book_id))
+    log.debug("Bookmark for user {} in book {} queued".format(current_user.id, book_id))
     return "", 201
 
 
@@ -206,54 +200,120 @@ def update_view():
     return "1", 200
 
 
-'''
-@web.route("/ajax/getcomic/<int:book_id>/<book_format>/<int:page>")
-@user_login_required
-def get_comic_book(book_id, book_format, page):
-    book = calibre_db.get_book(book_id)
-    if not book:
+@web.route("/ajax/author/<int:author_id>/goodreads")
+@login_required_if_no_ano
+def author_goodreads(author_id):
+    if not (services.goodreads_support and config.config_use_goodreads):
+        abort(404)
+    author = calibre_db.session.query(db.Authors).filter(db.Authors.id == author_id).first()
+    if not author:
+        abort(404)
+    ready, author_info = services.goodreads_support.get_author_info(author.name.replace('|', ','))
+    if not ready:
+        return "", 202
+    if not author_info:
         return "", 204
+    library_books = (calibre_db.session.query(db.Books)
+                     .filter(db.Books.authors.any(db.Authors.id == author_id))
+                     .filter(calibre_db.common_filters())
+                     .options(selectinload(db.Books.identifiers)).all())
+    other_books = services.goodreads_support.get_other_books(author_info, library_books)
+    return render_title_template('author_goodreads.html', author=author_info, other_books=list(other_books))
+
+
+def _comic_file(book_id, book_format):
+    # path of a local comic file of a book visible to the current user
+    if config.config_use_google_drive or not comic_pages.archive_format(book_format):
+        return None
+    book = calibre_db.get_filtered_book(book_id)
+    if not book:
+        return None
+    data = calibre_db.get_book_format(book_id, book_format.upper())
+    if not data:
+        return None
+    return os.path.join(config.get_book_path(), book.path, data.name + "." + book_format.lower())
+
+
+def _comic_cache_headers(response, version):
+    # page urls of the reader contain the version of the archive, other requests have to be revalidated
+    response.cache_control.private = True
+    if request.args.get("v") == version:
+        response.cache_control.no_cache = None
+        response.cache_control.max_age = 7 * 24 * 3600
     else:
-        for bookformat in book.data:
-            if bookformat.format.lower() == book_format.lower():
-                cbr_file = os.path.join(config.config_calibre_dir, book.path, bookformat.name) + "." + book_format
-                if book_format in ("cbr", "rar"):
-                    if feature_support['rar'] == True:
-                        rarfile.UNRAR_TOOL = resolve_binary_path(config.config_rarfile_location,
-                                                                 SUPPORTED_UNRAR_BINARIES)
-                        try:
-                            rf = rarfile.RarFile(cbr_file)
-                            names = sort(rf.namelist())
-                            extract = lambda page: rf.read(names[page])
-                        except:
-                            # rarfile not valid
-                            log.error('Unrar binary not found, or unable to decompress file %s', cbr_file)
-                            return "", 204
-                    else:
-                        log.info('Unrar is not supported please install python rarfile extension')
-                        # no support means return nothing
-                        return "", 204
-                elif book_format in ("cbz", "zip"):
-                    zf = zipfile.ZipFile(cbr_file)
-                    names=sort(zf.namelist())
-                    extract = lambda page: zf.read(names[page])
-                elif book_format in ("cbt", "tar"):
-                    tf = tarfile.TarFile(cbr_file)
-                    names=sort(tf.getnames())
-                    extract = lambda page: tf.extractfile(names[page]).read()
-                else:
-                    log.error('unsupported comic format')
-                    return "", 204
-
-                b64 = codecs.encode(extract(page), 'base64').decode()
-                ext = names[page].rpartition('.')[-1]
-                if ext not in ('png', 'gif', 'jpg', 'jpeg', 'webp'):
-                    ext = 'png'
-                extractedfile="data:image/" + ext + ";base64," + b64
-                fileData={"name": names[page], "page":page, "last":len(names)-1, "content": extractedfile}
-                return make_response(json.dumps(fileData))
-        return "", 204
-'''
+        response.cache_control.no_cache = True
+    return response
+
+
+def _audio_info(book, book_format):
+    # duration and chapters of a local audio file, the player falls back to the information of the stream
+    data = calibre_db.get_book_format(book.id, book_format.upper())
+    if config.config_use_google_drive or not data:
+        return None
+    return audio_stream.get_audio_info(os.path.join(config.get_book_path(), book.path,
+                                                    data.name + "." + book_format.lower()), book_format)
+
+
+@web.route("/ajax/audio/<int:book_id>/<book_format>/info")
+@login_required_if_no_ano
+@viewer_required
+def get_audio_info(book_id, book_format):
+    book = calibre_db.get_filtered_book(book_id)
+    if not book or book_format.lower() not in constants.EXTENSIONS_AUDIO:
+        abort(404)
+    info = _audio_info(book, book_format)
+    if not info:
+        abort(404)
+    response = make_response(jsonify(info))
+    response.set_etag(info["version"])
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+@web.route("/ajax/comic/<int:book_id>/<book_format>/pages")
+@login_required_if_no_ano
+@viewer_required
+def get_comic_pages(book_id, book_format):
+    comic_file = _comic_file(book_id, book_format)
+    if not comic_file:
+        abort(404)
+    try:
+        index = comic_pages.get_page_index(comic_file, book_format,
+                                           resolve_binary_path(config.config_rarfile_location,
+                                                               SUPPORTED_UNRAR_BINARIES))
+    except comic_pages.ComicPageError as ex:
+        log.error(ex)
+        abort(404)
+    response = make_response(jsonify(version=index.version, pages=index.names))
+    response.set_etag(index.version)
+    return _comic_cache_headers(response, index.version).make_conditional(request)
+
+
+@web.route("/ajax/comic/<int:book_id>/<book_format>/page/<int:page>")
+@login_required_if_no_ano
+@viewer_required
+def get_comic_page(book_id, book_format, page):
+    comic_file = _comic_file(book_id, book_format)
+    if not comic_file:
+        abort(404)
+    width = request.args.get("width", 0, type=int)
+    width = comic_pages.page_width(width) if width > 0 else None
+    rar_executable = resolve_binary_path(config.config_rarfile_location, SUPPORTED_UNRAR_BINARIES)
+    try:
+        index = comic_pages.get_page_index(comic_file, book_format, rar_executable)
+        etag = "{}-{}-{}".format(index.version, page, width or 0)
+        if request.if_none_match.contains(etag):
+            response = make_response("", 304)
+            response.set_etag(etag)
+            return _comic_cache_headers(response, index.version)
+        data, extension, version = comic_pages.get_page(comic_file, book_format, page, width, rar_executable)
+    except comic_pages.ComicPageError as ex:
+        log.error(ex)
+        abort(404)
+    response = send_file(io.BytesIO(data), mimetype=comic_pages.MIME_TYPES.get(extension, "application/octet-stream"),
+                         etag=etag, last_modified=index.mtime, conditional=True)
+    return _comic_cache_headers(response, version)
 
 
 # ################################### Typeahead ##################################################################
@@ -540,15 +600,13 @@ def render_author_books(page, author_id, order):
         author = calibre_db.session.query(db.Authors).get(author_id)
     author_name = author.name.replace('|', ',')
 
-    author_info = None
-    other_books = []
-    if services.goodreads_support and config.config_use_goodreads:
-        author_info = services.goodreads_support.get_author_info(author_name)
-        book_entries = [entry.Books for entry in entries]
-        other_books = services.goodreads_support.get_other_books(author_info, book_entries)
+    goodreads = bool(services.goodreads_support and config.config_use_goodreads)
+    if goodreads:
+        # starts fetching the author information, the page loads it later on
+        services.goodreads_support.get_author_info(author_name)
     return render_title_template('author.html', entries=entries, pagination=pagination, id=author_id,
-                                 title=_("Author: %(name)s", name=author_name), author=author_info,
-                                 other_books=other_books, page="author", order=order[1])
+                                 title=_("Author: %(name)s", name=author_name), goodreads=goodreads,
+                                 page="author", order=order[1])
 
 
 def render_publisher_books(page, book_id, order):
@@ -735,6 +793,7 @@ def render_language_books(page, name, order):
 def render_read_books(page, are_read, as_xml=False, order=None):
     sort_param = order[0] if order else []
     if not config.config_read_column:
+        ub.flush_activity()
         if are_read:
             db_filter = and_(ub.ReadBook.user_id == int(current_user.id),
                              ub.ReadBook.read_status == ub.ReadBook.STATUS_FINISHED)
@@ -1219,6 +1278,13 @@ def serve_book(book_id, book_format, anyname):
             log.error_or_exception(ex)
             return "File Not Found"
     else:
+        if book_format.lower() in constants.EXTENSIONS_AUDIO:
+            try:
+                return audio_stream.stream_audio(os.path.join(config.get_book_path(), book.path,
+                                                              data.name + "." + book_format), book_format)
+            except FileNotFoundError:
+                log.error("File Not Found")
+                return "File Not Found"
         if book_format.upper() == 'TXT':
             try:
                 rawdata = open(os.path.join(config.get_book_path(), book.path, data.name + "." + book_format),
@@ -1584,6 +1650,7 @@ def read_book(book_id, book_format):
     # check if book has a bookmark
     bookmark = None
     if current_user.is_authenticated:
+        ub.flush_activity()
         bookmark = ub.session.query(ub.Bookmark).filter(and_(ub.Bookmark.user_id == int(current_user.id),
                                                              ub.Bookmark.book_id == book_id,
                                                              ub.Bookmark.format == book_format.upper())).first()
@@ -1607,7 +1674,8 @@ def read_book(book_id, book_format):
                 entries = calibre_db.get_filtered_book(book_id)
                 log.debug("Start mp3 listening for %d", book_id)
                 return render_title_template('listenmp3.html', mp3file=book_id, audioformat=book_format.lower(),
-                                             entry=entries, bookmark=bookmark)
+                                             entry=entries, bookmark=bookmark,
+                                             audio_info=_audio_info(book, book_format))
         for fileExt in ["cbr", "cbt", "cbz"]:
             if book_format.lower() == fileExt:
                 all_name = str(book_id)